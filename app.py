@@ -16,11 +16,25 @@
 Application factory module.
 """
 import os
+import click
 from flask import Flask, render_template
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
 
-from src.extensions import db, migrate, login_manager
+from src.cli import register_commands
+from src.database import configure_binds, configure_engines, check_schema_version, SchemaVersionError
+from src.extensions import db, login_manager
 from src.routes import auth_bp, survey_bp, main_bp
+from src.services.async_submit import async_submitter
+from src.services.ingest import ingestor
+from src.services.live import broadcaster
+from src.services.metrics import request_metrics
+from src.services.pages import respond_page_cache
+from src.services.passwords import password_hasher
+from src.services.purge import survey_purger
+from src.services.results import results_cache
+from src.services.slow_queries import slow_query_log
+from src.services.users import user_cache
 
 
 def create_app(config=None):
@@ -40,11 +54,15 @@ def create_app(config=None):
     # Ensure the instance folder exists
     os.makedirs(app.instance_path, exist_ok=True)
     
-    # Set up database URI
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
-        'DATABASE_URL', 
-        f"sqlite:///{os.path.join(app.instance_path, 'customer_feedback.db')}"
-    )
+    # Set up database URI, unless one was passed to the factory
+    if not (config and config.get('SQLALCHEMY_DATABASE_URI')):
+        app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
+            'DATABASE_URL', 
+            f"sqlite:///{os.path.join(app.instance_path, 'customer_feedback.db')}"
+        )
+    
+    # Cache compiled templates on disk
+    configure_templates(app)
     
     # Initialize extensions
     initialize_extensions(app)
@@ -52,6 +70,9 @@ def create_app(config=None):
     # Register blueprints
     register_blueprints(app)
     
+    # Register CLI commands
+    register_commands(app)
+    
     # Enable CORS
     CORS(app)
     
@@ -69,19 +90,81 @@ def create_app(config=None):
 
 def initialize_extensions(app):
     """Initialize Flask extensions."""
+    # Commands registered by the app, such as 'flask db upgrade', must run
+    # before the schema is current. The flask CLI loads the app for them
+    # before a subcommand is chosen; built-in commands such as 'flask run'
+    # load it from inside the subcommand and get the normal startup.
+    ctx = click.get_current_context(silent=True)
+    running_cli = ctx is not None and ctx.find_root().invoked_subcommand is None
+    
     # Initialize SQLAlchemy
+    configure_binds(app)
     db.init_app(app)
+    configure_engines(app)
     
-    # Initialize Flask-Migrate
-    migrate.init_app(app, db)
+    # Initialize Flask-Migrate; importing it loads alembic, so worker
+    # processes that only check the schema version skip it outside the CLI
+    if app.config['SCHEMA_STARTUP_MODE'] != 'check' or running_cli:
+        from flask_migrate import Migrate
+        Migrate(app, db)
     
     # Initialize Flask-Login
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
     
-    # Create tables if they don't exist
-    with app.app_context():
-        db.create_all()
+    # Initialize the password hashing pool
+    password_hasher.init_app(app)
+    
+    # Initialize write-behind response ingestion
+    ingestor.init_app(app)
+    
+    # Initialize the background purge of deleted surveys
+    survey_purger.init_app(app)
+    
+    # Initialize the async submit path served by the ASGI entry point
+    async_submitter.init_app(app)
+    
+    # Initialize caches
+    results_cache.init_app(app)
+    respond_page_cache.init_app(app)
+    user_cache.init_app(app)
+    
+    # Initialize live results streaming
+    broadcaster.init_app(app)
+    
+    # Initialize per-endpoint request and SQL metrics
+    request_metrics.init_app(app)
+    
+    # Initialize the slow-query log
+    slow_query_log.init_app(app)
+    
+    # Create tables if they don't exist, or only verify the migrated schema
+    if app.config['SCHEMA_STARTUP_MODE'] == 'check':
+        try:
+            check_schema_version(app)
+        except SchemaVersionError as e:
+            if not running_cli:
+                raise
+            app.logger.warning(str(e))
+    elif not running_cli:
+        # 'flask db' would otherwise find the tables of later migrations
+        # already created; 'python init_db.py' creates them instead
+        with app.app_context():
+            db.create_all()
+    
+    # Finish purges of deleted surveys that a restart interrupted
+    if not running_cli:
+        survey_purger.resume()
+
+
+def configure_templates(app):
+    """Store compiled Jinja templates in a bytecode cache shared by all workers."""
+    if not app.config.get('JINJA_BYTECODE_CACHE'):
+        return
+    
+    cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR') or os.path.join(app.instance_path, 'jinja-cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_options = {**app.jinja_options, 'bytecode_cache': FileSystemBytecodeCache(cache_dir)}
 
 
 def register_blueprints(app):
@@ -0,0 +1,263 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Load test the survey response submission path: WSGI threads against ASGI.
+
+Usage::
+
+    python -m benchmarks.async_submit [--concurrency 16 64 256 1024] [--seconds 5] [--threads 16]
+
+Each server runs in its own process against the same SQLite file with
+``ProductionConfig``'s ``SQLITE_PRAGMAS``:
+
+* ``wsgi``: the Flask application on a WSGI server with a fixed pool of
+  ``--threads`` request threads, like a threaded gunicorn worker;
+* ``asgi``: ``asgi:app`` on uvicorn, where submissions take the async path.
+
+For every concurrency level, that many clients post responses over fresh
+connections. The benchmark reports throughput, latency, failed requests
+and the peak number of submissions in flight inside the server process.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.utils import make_app, seed_survey, percentile, write_json
+from config import ProductionConfig
+
+INFLIGHT_PATH = '/__inflight'
+
+
+class InflightCounter:
+    """Track the number of requests being processed and its peak."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def leave(self):
+        with self._lock:
+            self.current -= 1
+
+    def report(self, reset):
+        with self._lock:
+            body = json.dumps({'current': self.current, 'peak': self.peak}).encode()
+            if reset:
+                self.peak = self.current
+            return body
+
+
+def wsgi_app(flask_app, counter):
+    """Wrap the Flask application with the in-flight counter."""
+    def app(environ, start_response):
+        if environ['PATH_INFO'] == INFLIGHT_PATH:
+            start_response('200 OK', [('Content-Type', 'application/json')])
+            return [counter.report('reset' in environ.get('QUERY_STRING', ''))]
+        counter.enter()
+        try:
+            return flask_app(environ, start_response)
+        finally:
+            counter.leave()
+    return app
+
+
+def asgi_app(app, counter):
+    """Wrap the ASGI application with the in-flight counter."""
+    async def wrapped(scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] == INFLIGHT_PATH:
+            body = counter.report(b'reset' in scope.get('query_string', b''))
+            await send({'type': 'http.response.start', 'status': 200,
+                        'headers': [(b'content-type', b'application/json'),
+                                    (b'content-length', str(len(body)).encode())]})
+            await send({'type': 'http.response.body', 'body': body})
+            return
+        if scope['type'] != 'http':
+            await app(scope, receive, send)
+            return
+        counter.enter()
+        try:
+            await app(scope, receive, send)
+        finally:
+            counter.leave()
+    return wrapped
+
+
+def serve(mode, db_path, port, threads):
+    """Run one server in the current process until it is terminated."""
+    flask_app = make_app(db_path, SQLITE_PRAGMAS=ProductionConfig.SQLITE_PRAGMAS)
+    counter = InflightCounter()
+    
+    if mode == 'wsgi':
+        from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+        
+        class QuietRequestHandler(WSGIRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+        
+        class PooledWSGIServer(BaseWSGIServer):
+            """WSGI server that handles requests on a fixed thread pool."""
+            
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.pool = ThreadPoolExecutor(max_workers=threads)
+            
+            def process_request(self, request, client_address):
+                self.pool.submit(self.process_request_thread, request, client_address)
+            
+            def process_request_thread(self, request, client_address):
+                try:
+                    self.finish_request(request, client_address)
+                except Exception:
+                    self.handle_error(request, client_address)
+                finally:
+                    self.shutdown_request(request)
+        
+        PooledWSGIServer.request_queue_size = 4096
+        PooledWSGIServer(
+            '127.0.0.1', port, wsgi_app(flask_app, counter), handler=QuietRequestHandler
+        ).serve_forever()
+    else:
+        import uvicorn
+        from src.asgi import create_asgi_app
+        
+        uvicorn.run(asgi_app(create_asgi_app(flask_app), counter), host='127.0.0.1', port=port,
+                    log_level='warning', backlog=4096)
+
+
+async def request(port, method, path, body=b''):
+    """Send one HTTP/1.1 request on a fresh connection and return the status code."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        response = await reader.read()
+        return int(response.split(b' ', 2)[1]), response.split(b'\r\n\r\n', 1)[-1]
+    finally:
+        writer.close()
+
+
+async def load(port, survey_id, option_ids, concurrency, seconds, timeout):
+    """Post responses from ``concurrency`` clients for ``seconds`` seconds."""
+    latencies = []
+    failures = {'status': 0, 'error': 0}
+    deadline = time.monotonic() + seconds
+    
+    async def client(index):
+        i = index
+        while time.monotonic() < deadline:
+            body = json.dumps({'option_id': option_ids[i % len(option_ids)]}).encode()
+            start = time.perf_counter()
+            try:
+                status, _ = await asyncio.wait_for(
+                    request(port, 'POST', f"/api/surveys/{survey_id}/respond", body), timeout
+                )
+            except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+                failures['error'] += 1
+                continue
+            if status in (201, 202):
+                latencies.append(time.perf_counter() - start)
+            else:
+                failures['status'] += 1
+            i += len(option_ids)
+    
+    await request(port, 'GET', f"{INFLIGHT_PATH}?reset")
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    _, inflight = await request(port, 'GET', INFLIGHT_PATH)
+    
+    return {
+        'submissions_per_second': len(latencies) / seconds,
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'failed': failures['status'] + failures['error'],
+        'peak_in_flight': json.loads(inflight)['peak'],
+    }
+
+
+def wait_for_port(port, process, timeout=30):
+    """Wait until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('Server process exited during startup')
+        try:
+            asyncio.run(request(port, 'GET', INFLIGHT_PATH))
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[16, 64, 256, 1024])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--threads', type=int, default=16, help='Request threads of the WSGI server')
+    parser.add_argument('--timeout', type=float, default=30, help='Client timeout per request in seconds')
+    parser.add_argument('--port', type=int, default=8731)
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    parser.add_argument('--serve', choices=['wsgi', 'asgi'], help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.serve:
+        serve(args.serve, args.db, args.port, args.threads)
+        return
+    
+    db_path = os.path.join(tempfile.mkdtemp(prefix='survey-bench-'), 'bench.db')
+    _, survey_id, option_ids = seed_survey(make_app(db_path, SQLITE_PRAGMAS=ProductionConfig.SQLITE_PRAGMAS))
+    
+    results = {}
+    print(f"{'server':<8}{'clients':>8}{'subm/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'failed':>8}{'in flight':>11}")
+    for mode in ('wsgi', 'asgi'):
+        process = subprocess.Popen([
+            sys.executable, '-m', 'benchmarks.async_submit', '--serve', mode,
+            '--db', db_path, '--port', str(args.port), '--threads', str(args.threads)
+        ])
+        try:
+            wait_for_port(args.port, process)
+            results[mode] = {}
+            for concurrency in args.concurrency:
+                metrics = asyncio.run(load(args.port, survey_id, option_ids, concurrency, args.seconds, args.timeout))
+                results[mode][concurrency] = metrics
+                print(f"{mode:<8}{concurrency:>8}{metrics['submissions_per_second']:>10.1f}"
+                      f"{metrics['p50_ms']:>10.1f}{metrics['p99_ms']:>10.1f}"
+                      f"{metrics['failed']:>8}{metrics['peak_in_flight']:>11}")
+        finally:
+            process.terminate()
+            process.wait()
+    
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == '__main__':
+    main()
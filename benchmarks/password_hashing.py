@@ -0,0 +1,119 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark login throughput against the password hash cost.
+
+Usage::
+
+    python -m benchmarks.password_hashing [--seconds 5] [--clients 8] [--methods pbkdf2:sha256:600000 scrypt:32768:8:1]
+
+For every hash method, client threads log in as fast as they can while
+one voter thread submits survey responses. The benchmark reports logins
+per second, login latency, logins rejected because the hashing pool was
+busy, and the vote latency, which shows whether the login storm starves
+cheap requests.
+"""
+import argparse
+import threading
+import time
+
+from benchmarks.utils import make_app, seed_survey, percentile, write_json
+from src.extensions import db
+from src.models.user import User
+
+DEFAULT_METHODS = [
+    'pbkdf2:sha256:100000',
+    'pbkdf2:sha256:600000',
+    'scrypt:16384:8:1',
+    'scrypt:32768:8:1',
+]
+
+
+def run_method(method, seconds, clients, workers):
+    """Run the login storm for one hash method and return its metrics."""
+    app = make_app(PASSWORD_HASH_METHOD=method, PASSWORD_HASH_WORKERS=workers)
+    _, survey_id, option_ids = seed_survey(app)
+    with app.app_context():
+        # Hash the password with the benchmarked method, not the seeding one
+        user = User.query.filter_by(email='bench@example.com').first()
+        user.set_password('bench')
+        db.session.commit()
+    
+    stop = threading.Event()
+    metrics = {'logins': [], 'busy': 0, 'votes': []}
+    lock = threading.Lock()
+    
+    def login_client():
+        while not stop.is_set():
+            client = app.test_client()
+            start = time.perf_counter()
+            response = client.post('/auth/login', data={'email': 'bench@example.com', 'password': 'bench'})
+            elapsed = time.perf_counter() - start
+            with lock:
+                if response.status_code == 302:
+                    metrics['logins'].append(elapsed)
+                elif response.status_code == 503:
+                    metrics['busy'] += 1
+    
+    def voter():
+        client = app.test_client()
+        i = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            client.post(f"/api/surveys/{survey_id}/respond", json={'option_id': option_ids[i % len(option_ids)]})
+            metrics['votes'].append(time.perf_counter() - start)
+            i += 1
+    
+    threads = [threading.Thread(target=login_client) for _ in range(clients)]
+    threads.append(threading.Thread(target=voter))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    return {
+        'logins_per_second': len(metrics['logins']) / seconds,
+        'login_p50_ms': percentile(metrics['logins'], 0.5) * 1000,
+        'login_p95_ms': percentile(metrics['logins'], 0.95) * 1000,
+        'busy': metrics['busy'],
+        'vote_p95_ms': percentile(metrics['votes'], 0.95) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=2, help='PASSWORD_HASH_WORKERS')
+    parser.add_argument('--methods', nargs='+', default=DEFAULT_METHODS)
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args()
+    
+    results = {}
+    print(f"{'method':<24}{'logins/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'busy':>6}{'vote p95 ms':>13}")
+    for method in args.methods:
+        results[method] = metrics = run_method(method, args.seconds, args.clients, args.workers)
+        print(f"{method:<24}{metrics['logins_per_second']:>10.1f}{metrics['login_p50_ms']:>10.1f}"
+              f"{metrics['login_p95_ms']:>10.1f}{metrics['busy']:>6}{metrics['vote_p95_ms']:>13.1f}")
+    
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == '__main__':
+    main()
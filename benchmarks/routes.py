@@ -0,0 +1,186 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Route-level micro-benchmarks over the Flask test client.
+
+Usage::
+
+    python -m benchmarks.routes [--sizes 10000 100000 1000000] [--requests 200] [--json results.json]
+    python -m benchmarks.routes --compare baseline.json [--threshold 0.2]
+
+For every dataset size (the number of generated responses) a database is
+generated with ``init_db.generate_dataset`` and reused from ``--data-dir``
+on later runs. Each route is requested ``--requests`` times as the owner
+of the most popular survey. The benchmark reports p50/p95/p99 latency and
+queries per request. With ``--compare``, the run is checked against a
+stored JSON result; a p95 latency more than ``--threshold`` above the
+baseline or half a query per request more is flagged as a regression and
+makes the command exit with status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from sqlalchemy import event, text
+
+from benchmarks.utils import make_app, percentile, write_json
+from init_db import generate_dataset
+from src.extensions import db
+
+# Caches that hide the cost of the underlying queries with --disable-caches
+CACHE_SETTINGS = ('RESULTS_CACHE_ENABLED', 'RESPOND_PAGE_CACHE_ENABLED', 'USER_CACHE_ENABLED')
+
+
+def dataset_path(data_dir, size, surveys_per_user, seed):
+    """Return the database file of a dataset, generating it if it does not exist."""
+    path = os.path.join(data_dir, f"routes-{size}-{surveys_per_user}-{seed}.db")
+    if not os.path.exists(path):
+        app = make_app(path)
+        generate_dataset(app, max(1, size // 1000), surveys_per_user, size, seed=seed)
+    return path
+
+
+def routes(survey_id, option_id):
+    """Return the benchmarked routes as ``name -> (client, method, url, form)``."""
+    return {
+        'dashboard': ('owner', 'GET', '/dashboard', None),
+        'view_survey': ('owner', 'GET', f"/surveys/{survey_id}", None),
+        'respond_survey GET': ('anonymous', 'GET', f"/respond/{survey_id}", None),
+        'respond_survey POST': ('anonymous', 'POST', f"/respond/{survey_id}", {'option_id': option_id}),
+        'get_surveys': ('owner', 'GET', '/api/surveys/', None),
+        'get_results': ('owner', 'GET', f"/api/surveys/{survey_id}/results", None),
+    }
+
+
+def measure_size(path, requests, warmup, disable_caches):
+    """Benchmark every route against one dataset."""
+    app = make_app(path, **{setting: False for setting in CACHE_SETTINGS} if disable_caches else {})
+    with app.app_context():
+        survey_id, user_id, email = db.session.execute(text(
+            'SELECT s.survey_id, s.user_id, u.email FROM "Survey_Counters" c '
+            'JOIN "Surveys" s ON s.survey_id = c.survey_id JOIN "Users" u ON u.user_id = s.user_id '
+            'WHERE s.is_active ORDER BY c.response_count DESC LIMIT 1'
+        )).one()
+        option_id = db.session.execute(text(
+            'SELECT option_id FROM "Survey_Options" WHERE survey_id = :survey_id ORDER BY option_order LIMIT 1'
+        ), {'survey_id': survey_id}).scalar()
+        engine = db.engine
+    
+    clients = {'owner': app.test_client(), 'anonymous': app.test_client()}
+    response = clients['owner'].post('/auth/login', data={'email': email, 'password': 'password123'})
+    assert response.status_code == 302, 'Login failed'
+    
+    queries = []
+    
+    def count_query(*args):
+        queries.append(1)
+    
+    results = {}
+    event.listen(engine, 'before_cursor_execute', count_query)
+    try:
+        for name, (client_name, method, url, form) in routes(survey_id, option_id).items():
+            client = clients[client_name]
+            for _ in range(warmup):
+                client.open(url, method=method, data=form)
+            latencies = []
+            queries.clear()
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = client.open(url, method=method, data=form)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200, (name, response.status_code)
+            results[name] = {
+                'p50_ms': percentile(latencies, 0.50) * 1000,
+                'p95_ms': percentile(latencies, 0.95) * 1000,
+                'p99_ms': percentile(latencies, 0.99) * 1000,
+                'queries': len(queries) / requests,
+            }
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_query)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the regressions of ``results`` against ``baseline`` as printable lines."""
+    regressions = []
+    for size, routes_results in results.items():
+        for name, metrics in routes_results.items():
+            base = baseline.get(size, {}).get(name)
+            if base is None:
+                continue
+            if metrics['p95_ms'] > base['p95_ms'] * (1 + threshold):
+                regressions.append(
+                    f"{size} {name}: p95 {base['p95_ms']:.2f}ms -> {metrics['p95_ms']:.2f}ms "
+                    f"(+{(metrics['p95_ms'] / base['p95_ms'] - 1) * 100:.0f}%)"
+                )
+            if metrics['queries'] >= base['queries'] + 0.5:
+                regressions.append(
+                    f"{size} {name}: queries/request {base['queries']:.2f} -> {metrics['queries']:.2f}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--surveys-per-user', type=int, default=10)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--data-dir', default=os.path.join('instance', 'benchmarks'),
+                        help='Directory where the generated datasets are kept between runs')
+    parser.add_argument('--disable-caches', action='store_true', help='Measure with the in-process caches off')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Baseline JSON file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed relative p95 increase')
+    args = parser.parse_args()
+    
+    os.makedirs(args.data_dir, exist_ok=True)
+    results = {}
+    print(f"{'size':>9}  {'route':<22}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}")
+    for size in args.sizes:
+        path = dataset_path(args.data_dir, size, args.surveys_per_user, args.seed)
+        results[str(size)] = measure_size(path, args.requests, args.warmup, args.disable_caches)
+        for name, metrics in results[str(size)].items():
+            print(f"{size:>9}  {name:<22}{metrics['p50_ms']:>9.2f}{metrics['p95_ms']:>9.2f}"
+                  f"{metrics['p99_ms']:>9.2f}{metrics['queries']:>9.2f}")
+    
+    if args.json:
+        write_json(args.json, {
+            'meta': {
+                'python': platform.python_version(),
+                'requests': args.requests,
+                'disable_caches': args.disable_caches,
+            },
+            'results': results,
+        })
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline['results'], args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}.")
+
+
+if __name__ == '__main__':
+    main()
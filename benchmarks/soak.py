@@ -0,0 +1,231 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Soak test concurrent response submissions against one SQLite file.
+
+Usage::
+
+    python -m benchmarks.soak [--mode processes|threads] [--voters 8] [--readers 4] [--seconds 60]
+                              [--profile default|production] [--ingest sync|batched]
+
+Every voter posts responses to ``/api/surveys/<id>/respond`` and every
+reader polls ``/api/surveys/<id>/results`` through the test client of an
+application bound to the same database file, either one process per
+client or one thread per client in a single process. The harness reports
+sustained votes per second per ``--window``, the rate of "database is
+locked" errors and the tail latency of votes and reads, so that ingestion
+and PRAGMA changes can be validated before sizing a deployment.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from flask.logging import default_handler
+
+from benchmarks.sqlite_profile import PROFILES
+from benchmarks.utils import make_app, seed_survey, percentile, write_json
+
+
+class LockErrorCounter(logging.Handler):
+    """Count the "database is locked" errors logged by the application."""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.count = 0
+
+    def emit(self, record):
+        if 'database is locked' in record.getMessage():
+            self.count += 1
+
+
+def build_app(db_path, profile, ingest, disable_caches):
+    """Create an application for the soak run and attach the lock error counter."""
+    config = dict(PROFILES[profile], RESPONSE_INGEST_MODE=ingest)
+    if disable_caches:
+        config.update(RESULTS_CACHE_ENABLED=False, USER_CACHE_ENABLED=False)
+    app = make_app(db_path, **config)
+    app.logger.removeHandler(default_handler)
+    counter = LockErrorCounter()
+    app.logger.addHandler(counter)
+    return app, counter
+
+
+def run_client(app, role, index, survey_id, option_ids, started, deadline):
+    """Send requests until ``deadline`` and return ``(offset, latency, status)`` samples."""
+    client = app.test_client()
+    if role == 'reader':
+        client.post('/auth/login', data={'email': 'bench@example.com', 'password': 'bench'})
+    
+    samples = []
+    i = index
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        if role == 'voter':
+            response = client.post(f"/api/surveys/{survey_id}/respond",
+                                   json={'option_id': option_ids[i % len(option_ids)]})
+            i += 1
+        else:
+            response = client.get(f"/api/surveys/{survey_id}/results")
+        samples.append((start - started, time.monotonic() - start, response.status_code))
+    return samples
+
+
+def process_worker(role, index, options, survey_id, option_ids, started, deadline, results):
+    """Run one client in its own process with its own application."""
+    app, counter = build_app(options['db_path'], options['profile'], options['ingest'], options['disable_caches'])
+    samples = run_client(app, role, index, survey_id, option_ids, started, deadline)
+    if options['ingest'] == 'batched':
+        from src.services.ingest import ingestor
+        ingestor.shutdown()
+    results.put((role, samples, counter.count))
+
+
+def run_processes(options, survey_id, option_ids, deadline_seconds):
+    """Run every client in a separate process and collect their samples."""
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    started = time.monotonic()
+    # Give the spawned interpreters time to import the application
+    started += options['startup_grace']
+    deadline = started + deadline_seconds
+    roles = ['voter'] * options['voters'] + ['reader'] * options['readers']
+    processes = [
+        context.Process(target=process_worker,
+                        args=(role, i, options, survey_id, option_ids, started, deadline, results))
+        for i, role in enumerate(roles)
+    ]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return collected
+
+
+def run_threads(options, survey_id, option_ids, deadline_seconds):
+    """Run every client in a thread of this process, sharing one application."""
+    app, counter = build_app(options['db_path'], options['profile'], options['ingest'], options['disable_caches'])
+    started = time.monotonic()
+    deadline = started + deadline_seconds
+    collected = []
+    lock = threading.Lock()
+    
+    def worker(role, index):
+        samples = run_client(app, role, index, survey_id, option_ids, started, deadline)
+        with lock:
+            collected.append((role, samples, 0))
+    
+    roles = ['voter'] * options['voters'] + ['reader'] * options['readers']
+    threads = [threading.Thread(target=worker, args=(role, i)) for i, role in enumerate(roles)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if options['ingest'] == 'batched':
+        from src.services.ingest import ingestor
+        ingestor.shutdown()
+    collected.append(('voter', [], counter.count))
+    return collected
+
+
+def summarize(collected, seconds, window):
+    """Aggregate the samples of every client into windows and a summary."""
+    votes = [sample for role, samples, _ in collected if role == 'voter' for sample in samples]
+    reads = [sample for role, samples, _ in collected if role == 'reader' for sample in samples]
+    lock_errors = sum(count for _, _, count in collected)
+    
+    accepted = [sample for sample in votes if sample[2] in (201, 202)]
+    windows = []
+    for start in range(0, int(seconds), window):
+        in_window = [sample for sample in accepted if start <= sample[0] < start + window]
+        windows.append({
+            'start_s': start,
+            'votes_per_sec': len(in_window) / window,
+            'p99_ms': percentile([sample[1] for sample in in_window], 0.99) * 1000,
+        })
+    
+    vote_latencies = [sample[1] for sample in accepted]
+    read_latencies = [sample[1] for sample in reads if sample[2] == 200]
+    return {
+        'windows': windows,
+        'sustained_votes_per_sec': statistics.median(w['votes_per_sec'] for w in windows) if windows else 0.0,
+        'votes_attempted': len(votes),
+        'votes_failed': len(votes) - len(accepted),
+        'lock_errors': lock_errors,
+        'lock_error_rate': lock_errors / len(votes) if votes else 0.0,
+        'vote_p50_ms': percentile(vote_latencies, 0.50) * 1000,
+        'vote_p99_ms': percentile(vote_latencies, 0.99) * 1000,
+        'vote_max_ms': max(vote_latencies, default=0.0) * 1000,
+        'reads_per_sec': len(read_latencies) / seconds,
+        'read_p99_ms': percentile(read_latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mode', choices=['processes', 'threads'], default='processes')
+    parser.add_argument('--voters', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=int, default=60)
+    parser.add_argument('--window', type=int, default=10, help='Seconds per reported window')
+    parser.add_argument('--profile', choices=list(PROFILES), default='production')
+    parser.add_argument('--ingest', choices=['sync', 'batched'], default='sync')
+    parser.add_argument('--disable-caches', action='store_true', help='Turn off the results and user caches')
+    parser.add_argument('--startup-grace', type=float, default=10.0,
+                        help='Seconds allowed for spawned processes to start before the clock runs')
+    parser.add_argument('--db', help='Database file to use; a fresh one by default')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args()
+    
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix='survey-bench-'), 'soak.db')
+    seed_app = make_app(db_path, **PROFILES[args.profile])
+    _, survey_id, option_ids = seed_survey(seed_app)
+    
+    options = {
+        'db_path': db_path,
+        'profile': args.profile,
+        'ingest': args.ingest,
+        'disable_caches': args.disable_caches,
+        'voters': args.voters,
+        'readers': args.readers,
+        'startup_grace': args.startup_grace,
+    }
+    run = run_processes if args.mode == 'processes' else run_threads
+    collected = run(options, survey_id, option_ids, args.seconds)
+    summary = summarize(collected, args.seconds, args.window)
+    
+    print(f"{args.voters} voters, {args.readers} readers, {args.mode}, {args.profile} profile, {args.ingest} ingest")
+    print(f"{'window':>8}{'votes/s':>10}{'p99 ms':>10}")
+    for window in summary['windows']:
+        print(f"{window['start_s']:>7}s{window['votes_per_sec']:>10.1f}{window['p99_ms']:>10.1f}")
+    print(f"sustained votes/s: {summary['sustained_votes_per_sec']:.1f}")
+    print(f"failed votes: {summary['votes_failed']} of {summary['votes_attempted']}, "
+          f"lock errors: {summary['lock_errors']} ({summary['lock_error_rate']:.2%})")
+    print(f"vote latency p50/p99/max: {summary['vote_p50_ms']:.1f}/{summary['vote_p99_ms']:.1f}/"
+          f"{summary['vote_max_ms']:.1f} ms")
+    print(f"reads/s: {summary['reads_per_sec']:.1f}, read p99: {summary['read_p99_ms']:.1f} ms")
+    
+    if args.json:
+        write_json(args.json, {'options': vars(args), 'summary': summary})
+
+
+if __name__ == '__main__':
+    main()
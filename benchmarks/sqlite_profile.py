@@ -0,0 +1,135 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare read/write throughput with and without the SQLite engine profile.
+
+Usage::
+
+    python -m benchmarks.sqlite_profile [--seconds 5] [--writers 4] [--readers 8]
+
+Writer threads insert survey responses one transaction at a time while
+reader threads compute the survey results. The benchmark runs once with
+the default SQLite settings and once with ``ProductionConfig``'s
+``SQLITE_PRAGMAS`` and pool settings, each against a fresh database file.
+"""
+import argparse
+import threading
+import time
+
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.utils import make_app, seed_survey, percentile, write_json
+from config import ProductionConfig
+from src.extensions import db
+from src.models.survey import SurveyResponse
+from src.services.counters import record_responses
+from src.services.results import get_survey_results
+
+PROFILES = {
+    'default': {},
+    'production': {
+        'SQLITE_PRAGMAS': ProductionConfig.SQLITE_PRAGMAS,
+        'SQLALCHEMY_ENGINE_OPTIONS': ProductionConfig.SQLALCHEMY_ENGINE_OPTIONS,
+    },
+}
+
+
+def run_profile(name, seconds, writers, readers):
+    """Run the mixed workload against one profile and return its metrics."""
+    app = make_app(**PROFILES[name])
+    _, survey_id, option_ids = seed_survey(app)
+    stop = threading.Event()
+    metrics = {'writes': [], 'reads': [], 'locked': 0, 'errors': 0}
+    lock = threading.Lock()
+    
+    def writer(index):
+        with app.app_context():
+            i = index
+            while not stop.is_set():
+                option_id = option_ids[i % len(option_ids)]
+                i += 1
+                start = time.perf_counter()
+                try:
+                    db.session.add(SurveyResponse(survey_id=survey_id, option_id=option_id))
+                    record_responses(survey_id, [(option_id, None)])
+                    db.session.commit()
+                except OperationalError as e:
+                    db.session.rollback()
+                    with lock:
+                        metrics['locked' if 'locked' in str(e) else 'errors'] += 1
+                    continue
+                with lock:
+                    metrics['writes'].append(time.perf_counter() - start)
+    
+    def reader():
+        with app.app_context():
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    get_survey_results(survey_id)
+                    db.session.rollback()
+                except OperationalError as e:
+                    db.session.rollback()
+                    with lock:
+                        metrics['locked' if 'locked' in str(e) else 'errors'] += 1
+                    continue
+                with lock:
+                    metrics['reads'].append(time.perf_counter() - start)
+    
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    with app.app_context():
+        db.engine.dispose()
+    
+    return {
+        'writes_per_sec': len(metrics['writes']) / seconds,
+        'reads_per_sec': len(metrics['reads']) / seconds,
+        'write_p99_ms': percentile(metrics['writes'], 0.99) * 1000,
+        'read_p99_ms': percentile(metrics['reads'], 0.99) * 1000,
+        'lock_errors': metrics['locked'],
+        'other_errors': metrics['errors'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args()
+    
+    results = {}
+    for name in PROFILES:
+        results[name] = run_profile(name, args.seconds, args.writers, args.readers)
+    
+    columns = ['writes_per_sec', 'reads_per_sec', 'write_p99_ms', 'read_p99_ms', 'lock_errors', 'other_errors']
+    print(f"{'profile':<12}" + ''.join(f"{column:>16}" for column in columns))
+    for name, metrics in results.items():
+        print(f"{name:<12}" + ''.join(f"{metrics[column]:>16.1f}" for column in columns))
+    
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == '__main__':
+    main()
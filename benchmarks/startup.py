@@ -0,0 +1,104 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Measure process startup: import time, ``create_app()`` time and first request.
+
+Usage::
+
+    python -m benchmarks.startup [--repeat 5]
+
+Every sample runs in a fresh interpreter, as a newly forked or spawned
+worker would. The database is migrated once up front; the scenarios then
+compare ``SCHEMA_STARTUP_MODE=create`` with ``check`` and a cold template
+bytecode cache with one filled by ``flask templates compile``.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.utils import write_json
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child interpreter and prints the timings as JSON
+CHILD = '''
+import json, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+flask_app = app.create_app()
+created = time.perf_counter()
+response = flask_app.test_client().get('/auth/login')
+served = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'first_request_ms': (served - created) * 1000,
+}))
+'''
+
+SCENARIOS = {
+    'create, cold templates': {'SCHEMA_STARTUP_MODE': 'create', 'JINJA_BYTECODE_CACHE': '0'},
+    'check, cold templates': {'SCHEMA_STARTUP_MODE': 'check', 'JINJA_BYTECODE_CACHE': '0'},
+    'check, compiled templates': {'SCHEMA_STARTUP_MODE': 'check', 'JINJA_BYTECODE_CACHE': '1'},
+}
+
+
+def run(env, *args):
+    """Run a Python command in the repository with ``env`` and return its stdout."""
+    result = subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp(prefix='survey-bench-')
+    base_env = dict(
+        os.environ,
+        APP_SETTINGS='config.TestingConfig',
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        JINJA_BYTECODE_CACHE_DIR=os.path.join(workdir, 'jinja-cache'),
+        FLASK_APP='app.py',
+        SCHEMA_STARTUP_MODE='check',
+    )
+    run(base_env, '-m', 'flask', 'db', 'upgrade')
+    run(dict(base_env, JINJA_BYTECODE_CACHE='1'), '-m', 'flask', 'templates', 'compile')
+    
+    results = {}
+    print(f"{'scenario':<28}{'import ms':>11}{'create_app ms':>15}{'first request ms':>18}")
+    for name, overrides in SCENARIOS.items():
+        samples = [json.loads(run(dict(base_env, **overrides), '-c', CHILD)) for _ in range(args.repeat)]
+        results[name] = {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+        print(f"{name:<28}{results[name]['import_ms']:>11.1f}{results[name]['create_app_ms']:>15.1f}"
+              f"{results[name]['first_request_ms']:>18.1f}")
+    
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == '__main__':
+    main()
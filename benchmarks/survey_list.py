@@ -0,0 +1,128 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark serialization of the survey list against the number of surveys.
+
+Usage::
+
+    python -m benchmarks.survey_list [--sizes 10 100 1000 2000] [--repeat 5]
+
+Compares the lazy ``Survey.to_dict()`` loop, the same loop with the
+options eager-loaded through ``selectinload``, and the projected-row
+fast path used by ``GET /api/surveys/``, both for every survey at once
+and for a single keyset page of 20 surveys.
+"""
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.orm import selectinload
+
+from benchmarks.utils import make_app, seed_survey, write_json
+from src.extensions import db
+from src.models.survey import Survey, SurveyOption
+from src.services.surveys import list_survey_dicts
+
+
+def seed_surveys(app, user_id, count, options=5):
+    """Bulk insert ``count`` surveys with ``options`` options each."""
+    now = datetime.utcnow()
+    with app.app_context():
+        first_id = (db.session.query(db.func.max(Survey.survey_id)).scalar() or 0) + 1
+        db.session.execute(Survey.__table__.insert(), [
+            {'survey_id': first_id + i, 'user_id': user_id, 'title': f"Survey {i}",
+             'description': 'Benchmark survey', 'is_active': True, 'created_at': now, 'updated_at': now}
+            for i in range(count)
+        ])
+        db.session.execute(SurveyOption.__table__.insert(), [
+            {'survey_id': first_id + i, 'option_text': f"Option {order}", 'option_order': order}
+            for i in range(count) for order in range(1, options + 1)
+        ])
+        db.session.commit()
+
+
+def lazy_to_dict(user_id):
+    return [survey.to_dict() for survey in Survey.query.filter_by(user_id=user_id).all()]
+
+
+def selectin_to_dict(user_id):
+    surveys = Survey.query.options(selectinload(Survey.options)).filter_by(user_id=user_id).all()
+    return [survey.to_dict() for survey in surveys]
+
+
+def projection_all(user_id):
+    return list_survey_dicts(user_id, limit=10 ** 9)[0]
+
+
+def projection_page(user_id):
+    return list_survey_dicts(user_id, limit=20)[0]
+
+
+STRATEGIES = {
+    'lazy': lazy_to_dict,
+    'selectinload': selectin_to_dict,
+    'projection': projection_all,
+    'page of 20': projection_page,
+}
+
+
+def measure(app, user_id, strategy, repeat):
+    """Return the best wall time in ms and the query count of one run."""
+    queries = []
+    
+    def count_query(*args):
+        queries.append(1)
+    
+    best = None
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', count_query)
+        try:
+            for _ in range(repeat):
+                db.session.remove()
+                queries.clear()
+                start = time.perf_counter()
+                STRATEGIES[strategy](user_id)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count_query)
+    return {'ms': best * 1000, 'queries': len(queries)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 2000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args()
+    
+    results = {}
+    print(f"{'surveys':>8}" + ''.join(f"{name + ' ms':>18}{'queries':>9}" for name in STRATEGIES))
+    for size in args.sizes:
+        app = make_app()
+        user_id, _, _ = seed_survey(app)
+        seed_surveys(app, user_id, size - 1)
+        results[size] = {name: measure(app, user_id, name, args.repeat) for name in STRATEGIES}
+        print(f"{size:>8}" + ''.join(
+            f"{results[size][name]['ms']:>18.2f}{results[size][name]['queries']:>9}" for name in STRATEGIES
+        ))
+    
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Measure the per-request cost of loading the logged-in user.
+
+Usage::
+
+    python -m benchmarks.user_loader [--requests 500]
+
+Replays authenticated requests against the dashboard, the survey API and
+the results API through the test client, once with the user cache
+disabled and once with it enabled, and reports the queries and the wall
+time per request.
+"""
+import argparse
+import time
+
+from sqlalchemy import event
+
+from benchmarks.utils import make_app, seed_survey, write_json
+from src.extensions import db
+
+MODES = {
+    'uncached': {'USER_CACHE_ENABLED': False},
+    'cached': {'USER_CACHE_ENABLED': True},
+}
+
+
+def routes(survey_id):
+    """Return the authenticated GET routes to replay, keyed by name."""
+    return {
+        'dashboard': '/dashboard',
+        'survey': f"/api/surveys/{survey_id}",
+        'results': f"/api/surveys/{survey_id}/results",
+    }
+
+
+def measure(mode, requests):
+    """Replay every route ``requests`` times and return the metrics per route."""
+    app = make_app(**MODES[mode])
+    _, survey_id, _ = seed_survey(app)
+    client = app.test_client()
+    client.post('/auth/login', data={'email': 'bench@example.com', 'password': 'bench'})
+    
+    queries = []
+    
+    def count_query(conn, cursor, statement, *args):
+        queries.append(statement)
+    
+    results = {}
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', count_query)
+    try:
+        for name, url in routes(survey_id).items():
+            client.get(url)
+            queries.clear()
+            start = time.perf_counter()
+            for _ in range(requests):
+                response = client.get(url)
+                assert response.status_code == 200, (url, response.status_code)
+            elapsed = time.perf_counter() - start
+            results[name] = {
+                'queries_per_request': len(queries) / requests,
+                'user_queries_per_request': sum('FROM "Users"' in q for q in queries) / requests,
+                'ms_per_request': elapsed * 1000 / requests,
+            }
+    finally:
+        with app.app_context():
+            event.remove(db.engine, 'before_cursor_execute', count_query)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args()
+    
+    results = {mode: measure(mode, args.requests) for mode in MODES}
+    
+    print(f"{'route':<12}{'mode':<10}{'queries/req':>13}{'user queries':>14}{'ms/req':>10}")
+    for name in routes(0):
+        for mode in MODES:
+            metrics = results[mode][name]
+            print(f"{name:<12}{mode:<10}{metrics['queries_per_request']:>13.2f}"
+                  f"{metrics['user_queries_per_request']:>14.2f}{metrics['ms_per_request']:>10.3f}")
+    
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared helpers for the benchmark scripts.
+"""
+import json
+import os
+import tempfile
+
+from app import create_app
+from src.extensions import db
+from src.models.user import User
+from src.models.survey import Survey, SurveyOption
+
+
+def make_app(db_path=None, **config):
+    """Create an application bound to a throwaway SQLite file."""
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix='survey-bench-'), 'bench.db')
+    os.environ.setdefault('APP_SETTINGS', 'config.TestingConfig')
+    config.setdefault('SQLALCHEMY_DATABASE_URI', f"sqlite:///{db_path}")
+    config.setdefault('SQLALCHEMY_ECHO', False)
+    return create_app(config)
+
+
+def seed_survey(app, options=5, email='bench@example.com'):
+    """Create a user with one survey and return ``(user_id, survey_id, option_ids)``."""
+    with app.app_context():
+        user = User.query.filter_by(email=email).first()
+        if user is None:
+            user = User(email=email, alias='Bench', password='bench')
+            db.session.add(user)
+            db.session.flush()
+        survey = Survey(user_id=user.user_id, title='Benchmark Survey')
+        db.session.add(survey)
+        db.session.flush()
+        option_ids = []
+        for order in range(1, options + 1):
+            option = SurveyOption(survey_id=survey.survey_id, option_text=f"Option {order}", option_order=order)
+            db.session.add(option)
+            db.session.flush()
+            option_ids.append(option.option_id)
+        db.session.commit()
+        return user.user_id, survey.survey_id, option_ids
+
+
+def percentile(values, fraction):
+    """Return the value at ``fraction`` (0..1) of the sorted values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def write_json(path, data):
+    """Write benchmark results as pretty-printed JSON."""
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
@@ -18,12 +18,115 @@ Configuration settings for the application.
 import os
 from datetime import timedelta
 
+from sqlalchemy.pool import QueuePool
+
 
 class Config:
     """Base configuration."""
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-key-please-change-in-production')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
+    
+    # 'create' runs db.create_all() on startup; 'check' only verifies that
+    # the database is at the latest migration ('flask db upgrade' creates it)
+    SCHEMA_STARTUP_MODE = os.environ.get('SCHEMA_STARTUP_MODE', 'create')
+    
+    # Compiled templates are cached in JINJA_BYTECODE_CACHE_DIR, by default
+    # instance/jinja-cache; 'flask templates compile' fills it ahead of time
+    JINJA_BYTECODE_CACHE = os.environ.get('JINJA_BYTECODE_CACHE', '1') == '1'
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get('JINJA_BYTECODE_CACHE_DIR')
+    
+    # PRAGMAs applied to every new SQLite connection
+    SQLITE_PRAGMAS = {}
+    
+    # Optional read-only engine for dashboards and results
+    SQLALCHEMY_READ_DATABASE_URI = os.environ.get('READ_DATABASE_URL')
+    
+    # Response ingestion: 'sync' commits every response on the request
+    # thread, 'batched' queues them for a background writer.
+    RESPONSE_INGEST_MODE = os.environ.get('RESPONSE_INGEST_MODE', 'sync')
+    RESPONSE_INGEST_QUEUE_SIZE = int(os.environ.get('RESPONSE_INGEST_QUEUE_SIZE', 10000))
+    RESPONSE_INGEST_BATCH_SIZE = int(os.environ.get('RESPONSE_INGEST_BATCH_SIZE', 500))
+    RESPONSE_INGEST_FLUSH_INTERVAL_MS = int(os.environ.get('RESPONSE_INGEST_FLUSH_INTERVAL_MS', 50))
+    RESPONSE_INGEST_SHUTDOWN_TIMEOUT = float(os.environ.get('RESPONSE_INGEST_SHUTDOWN_TIMEOUT', 10))
+    RESPONSE_INGEST_LOCK_RETRIES = int(os.environ.get('RESPONSE_INGEST_LOCK_RETRIES', 10))
+    
+    # Async submit path of the ASGI entry point; defaults to the primary
+    # database opened through aiosqlite
+    ASYNC_SUBMIT_DATABASE_URI = os.environ.get('ASYNC_SUBMIT_DATABASE_URL')
+    ASYNC_SUBMIT_POOL_SIZE = int(os.environ.get('ASYNC_SUBMIT_POOL_SIZE', 5))
+    ASYNC_SUBMIT_MAX_OVERFLOW = int(os.environ.get('ASYNC_SUBMIT_MAX_OVERFLOW', 10))
+    # Threads that run the Flask routes behind the ASGI entry point; an open
+    # live results stream holds one of them
+    ASGI_WSGI_THREADS = int(os.environ.get('ASGI_WSGI_THREADS', 32))
+    
+    # Rendered public respond pages
+    RESPOND_PAGE_CACHE_BACKEND = os.environ.get('RESPOND_PAGE_CACHE_BACKEND', 'src.services.cache.MemoryCacheBackend')
+    RESPOND_PAGE_CACHE_SIZE = int(os.environ.get('RESPOND_PAGE_CACHE_SIZE', 4096))
+    RESPOND_PAGE_CACHE_TTL = int(os.environ.get('RESPOND_PAGE_CACHE_TTL', 300))
+    # 0 makes browsers and proxies revalidate with the ETag on every request
+    RESPOND_PAGE_MAX_AGE = int(os.environ.get('RESPOND_PAGE_MAX_AGE', 0))
+    
+    # Live results over Server-Sent Events; each open results page holds a
+    # request thread, so only enable this with threaded or async workers
+    LIVE_RESULTS_ENABLED = os.environ.get('LIVE_RESULTS_ENABLED', '0') == '1'
+    LIVE_RESULTS_POLL_INTERVAL = float(os.environ.get('LIVE_RESULTS_POLL_INTERVAL', 1.0))
+    LIVE_RESULTS_KEEPALIVE = float(os.environ.get('LIVE_RESULTS_KEEPALIVE', 15.0))
+    LIVE_RESULTS_MAX_STREAM_SECONDS = float(os.environ.get('LIVE_RESULTS_MAX_STREAM_SECONDS', 300.0))
+    LIVE_RESULTS_QUEUE_SIZE = int(os.environ.get('LIVE_RESULTS_QUEUE_SIZE', 16))
+    
+    # Keyset pagination of survey lists
+    SURVEYS_PAGE_SIZE = int(os.environ.get('SURVEYS_PAGE_SIZE', 20))
+    SURVEYS_MAX_PAGE_SIZE = int(os.environ.get('SURVEYS_MAX_PAGE_SIZE', 200))
+    
+    # Survey results cache
+    RESULTS_CACHE_BACKEND = os.environ.get('RESULTS_CACHE_BACKEND', 'src.services.cache.MemoryCacheBackend')
+    RESULTS_CACHE_SIZE = int(os.environ.get('RESULTS_CACHE_SIZE', 1024))
+    RESULTS_CACHE_TTL = int(os.environ.get('RESULTS_CACHE_TTL', 30))
+    
+    # Users loaded by Flask-Login on every authenticated request
+    USER_CACHE_BACKEND = os.environ.get('USER_CACHE_BACKEND', 'src.services.cache.MemoryCacheBackend')
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 4096))
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 60))
+    
+    # Password hashing runs on its own bounded pool; hashes made with another
+    # method or cost are upgraded on the next successful login.
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 16))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 5.0))
+    
+    # Per-endpoint request latency, query count and SQL time, served at
+    # /metrics; METRICS_SERVER_TIMING adds a Server-Timing response header
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') == '1'
+    METRICS_SERVER_TIMING = os.environ.get('METRICS_SERVER_TIMING', '0') == '1'
+    
+    # Statements slower than SLOW_QUERY_THRESHOLD_MS (0 disables) are logged
+    # with their query plan at most once per SLOW_QUERY_LOG_INTERVAL seconds
+    # per normalized statement and appended to SLOW_QUERY_LOG_FILE, by
+    # default instance/slow_queries.jsonl; 'flask slow-queries top' reports them
+    SLOW_QUERY_THRESHOLD_MS = int(os.environ.get('SLOW_QUERY_THRESHOLD_MS', 200))
+    SLOW_QUERY_LOG_INTERVAL = float(os.environ.get('SLOW_QUERY_LOG_INTERVAL', 60))
+    SLOW_QUERY_EXPLAIN = os.environ.get('SLOW_QUERY_EXPLAIN', '1') == '1'
+    SLOW_QUERY_LOG_FILE = os.environ.get('SLOW_QUERY_LOG_FILE')
+    
+    # Surveys with more responses than SURVEY_PURGE_SYNC_LIMIT are hidden on
+    # deletion and their rows are removed in the background, in transactions
+    # of SURVEY_PURGE_CHUNK_SIZE rows
+    SURVEY_PURGE_SYNC_LIMIT = int(os.environ.get('SURVEY_PURGE_SYNC_LIMIT', 10000))
+    SURVEY_PURGE_CHUNK_SIZE = int(os.environ.get('SURVEY_PURGE_CHUNK_SIZE', 1000))
+    SURVEY_PURGE_PAUSE_MS = int(os.environ.get('SURVEY_PURGE_PAUSE_MS', 50))
+    
+    # Bulk response import
+    BULK_IMPORT_CHUNK_SIZE = int(os.environ.get('BULK_IMPORT_CHUNK_SIZE', 5000))
+    BULK_IMPORT_MAX_ERRORS = int(os.environ.get('BULK_IMPORT_MAX_ERRORS', 1000))
+    
+    # Trend charts read from the rollups
+    TIMESERIES_DEFAULT_BUCKETS = int(os.environ.get('TIMESERIES_DEFAULT_BUCKETS', 48))
+    TIMESERIES_MAX_BUCKETS = int(os.environ.get('TIMESERIES_MAX_BUCKETS', 2000))
+    
+    # Streaming response export
+    EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 5000))
 
 
 class DevelopmentConfig(Config):
@@ -43,4 +146,22 @@ class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     SECRET_KEY = os.environ.get('SECRET_KEY')
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
\ No newline at end of file
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
+    SCHEMA_STARTUP_MODE = os.environ.get('SCHEMA_STARTUP_MODE', 'check')
+    
+    # WAL lets readers proceed while a writer commits, and the busy timeout
+    # makes writers wait for the lock instead of failing immediately.
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -64000)),
+        'temp_store': 'MEMORY',
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': QueuePool,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+    }
\ No newline at end of file
@@ -5,7 +5,8 @@ CREATE TABLE Users (
     alias TEXT NOT NULL,
     password_hash TEXT NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    last_login TIMESTAMP
+    last_login TIMESTAMP,
+    surveys_updated_at TIMESTAMP
 );
 
 -- Surveys table to store survey information
@@ -17,6 +18,7 @@ CREATE TABLE Surveys (
     is_active BOOLEAN DEFAULT 1,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    deleted_at TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE
 );
 
@@ -40,3 +42,39 @@ CREATE TABLE Survey_Responses (
     FOREIGN KEY (survey_id) REFERENCES Surveys(survey_id) ON DELETE CASCADE,
     FOREIGN KEY (option_id) REFERENCES Survey_Options(option_id) ON DELETE CASCADE
 );
+
+-- Survey Counters table to store the materialized number of responses per survey
+CREATE TABLE Survey_Counters (
+    survey_id INTEGER PRIMARY KEY,
+    response_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (survey_id) REFERENCES Surveys(survey_id) ON DELETE CASCADE
+);
+
+-- Survey Option Counters table to store the materialized number of responses per option
+CREATE TABLE Survey_Option_Counters (
+    option_id INTEGER PRIMARY KEY,
+    response_count INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (option_id) REFERENCES Survey_Options(option_id) ON DELETE CASCADE
+);
+
+-- Survey Response Rollups table to store the number of responses per option and time bucket
+CREATE TABLE Survey_Response_Rollups (
+    option_id INTEGER NOT NULL,
+    granularity TEXT NOT NULL,
+    bucket_start TIMESTAMP NOT NULL,
+    survey_id INTEGER NOT NULL,
+    response_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (option_id, granularity, bucket_start),
+    FOREIGN KEY (option_id) REFERENCES Survey_Options(option_id) ON DELETE CASCADE,
+    FOREIGN KEY (survey_id) REFERENCES Surveys(survey_id) ON DELETE CASCADE,
+    CONSTRAINT check_rollup_granularity CHECK (granularity IN ('hour', 'day'))
+);
+
+-- Indexes for the foreign keys and the filters used on every request
+CREATE INDEX ix_surveys_user_id_created_at_survey_id ON Surveys (user_id, created_at, survey_id);
+CREATE INDEX ix_survey_options_survey_id_option_order ON Survey_Options (survey_id, option_order);
+CREATE INDEX ix_survey_responses_survey_id_option_id ON Survey_Responses (survey_id, option_id);
+CREATE INDEX ix_survey_responses_survey_id_response_date ON Survey_Responses (survey_id, response_date);
+CREATE INDEX ix_survey_responses_option_id ON Survey_Responses (option_id);
+CREATE INDEX ix_survey_response_rollups_survey_id_granularity_bucket_start ON Survey_Response_Rollups (survey_id, granularity, bucket_start);
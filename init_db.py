@@ -14,18 +14,41 @@
 
 """
 Database initialization script.
+
+Without arguments it creates the schema and a demo account. With
+``--users`` it also generates a synthetic dataset for load and scale
+testing, e.g.::
+
+    python init_db.py --users 10000 --surveys-per-user 50 --responses 20000000
+
+Survey popularity follows a Zipf distribution, votes within a survey are
+skewed towards a few options, and response dates decay after the survey
+is created and follow a daily cycle. Rows are written with raw
+``executemany`` calls in large transactions, and the response counters
+and rollups are computed while generating instead of afterwards.
 """
+import argparse
 import os
-import sqlite3
-from pathlib import Path
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
 from flask import Flask
 from src.extensions import db
 from src.models.user import User
 from src.models.survey import Survey, SurveyOption, SurveyResponse
+from src.services.passwords import password_hasher
 
+# Relative number of responses per hour of the day (UTC)
+HOURLY_TRAFFIC = [2, 1, 1, 1, 1, 2, 4, 7, 9, 10, 10, 9, 9, 9, 9, 9, 9, 10, 11, 12, 11, 9, 6, 4]
 
-def init_db():
-    """Initialize the database with schema and sample data."""
+# SQLAlchemy's storage format for DateTime columns on SQLite
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
+def create_db_app():
+    """Create a minimal application bound to the configured database."""
     app = Flask(__name__)
     
     # Configure the app
@@ -40,7 +63,11 @@ def init_db():
     
     # Initialize SQLAlchemy
     db.init_app(app)
-    
+    return app
+
+
+def init_db(app):
+    """Initialize the database with schema and sample data."""
     with app.app_context():
         # Create all tables
         db.create_all()
@@ -91,5 +118,187 @@ def init_db():
             print("Database already contains data. Skipping sample data creation.")
 
 
+class Progress:
+    """Print the number of generated rows, the rate and the remaining time."""
+
+    def __init__(self, total, label):
+        self.total = total
+        self.label = label
+        self.done = 0
+        self.started = time.monotonic()
+        self.last_report = 0.0
+
+    def advance(self, count):
+        self.done += count
+        now = time.monotonic()
+        if now - self.last_report >= 1 or self.done >= self.total:
+            self.last_report = now
+            elapsed = now - self.started
+            rate = self.done / elapsed if elapsed else 0
+            eta = (self.total - self.done) / rate if rate else 0
+            sys.stderr.write(
+                f"\r{self.label}: {self.done:,}/{self.total:,} ({rate:,.0f} rows/s, {eta:,.0f}s left)   "
+            )
+            if self.done >= self.total:
+                sys.stderr.write('\n')
+            sys.stderr.flush()
+
+
+def zipf_counts(total, size, exponent, rng):
+    """Split ``total`` into ``size`` Zipf-distributed counts in random order."""
+    weights = [1 / rank ** exponent for rank in range(1, size + 1)]
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    for i in range(total - sum(counts)):
+        counts[i % size] += 1
+    rng.shuffle(counts)
+    return counts
+
+
+def generate_dataset(app, users, surveys_per_user, responses, days=365, batch_size=100000,
+                     zipf_exponent=1.1, decay_days=7.0, seed=None):
+    """Bulk insert synthetic users, surveys, options, responses, counters and rollups."""
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    first_day = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0)
+    day_strings = [(first_day + timedelta(days=d)).strftime('%Y-%m-%d') for d in range(days + 1)]
+    second_strings = [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}.000000" for s in range(86400)]
+    hour_strings = [f"{h:02d}:00:00.000000" for h in range(24)]
+    now_offset = int((now - first_day).total_seconds())
+    last_day_index = now_offset // 86400
+    hours = list(range(24))
+    
+    with app.app_context():
+        db.create_all()
+        connection = db.engine.raw_connection()
+    
+    try:
+        cursor = connection.cursor()
+        for pragma in ('synchronous=OFF', 'temp_store=MEMORY', 'cache_size=-262144'):
+            cursor.execute(f"PRAGMA {pragma}")
+        
+        def next_id(table, column):
+            return (cursor.execute(f'SELECT MAX({column}) FROM "{table}"').fetchone()[0] or 0) + 1
+        
+        user_id = next_id('Users', 'user_id')
+        survey_id = next_id('Surveys', 'survey_id')
+        option_id = next_id('Survey_Options', 'option_id')
+        response_id = next_id('Survey_Responses', 'response_id')
+        
+        # Every generated user gets the same password, hashed once
+        password_hash = password_hasher.hash('password123')
+        progress = Progress(users, 'users')
+        for start in range(0, users, batch_size):
+            rows = [
+                (uid, f"user{uid}@example.com", f"User {uid}", password_hash, now.strftime(DATETIME_FORMAT))
+                for uid in range(user_id + start, user_id + min(start + batch_size, users))
+            ]
+            cursor.executemany(
+                'INSERT INTO "Users" (user_id, email, alias, password_hash, created_at) VALUES (?, ?, ?, ?, ?)', rows
+            )
+            progress.advance(len(rows))
+        connection.commit()
+        
+        survey_count = users * surveys_per_user
+        response_counts = zipf_counts(responses, survey_count, zipf_exponent, rng) if survey_count else []
+        pending = {name: [] for name in ('surveys', 'options', 'responses', 'survey_counters', 'option_counters', 'rollups')}
+        statements = {
+            'surveys': 'INSERT INTO "Surveys" (survey_id, user_id, title, description, is_active, created_at, updated_at) '
+                       'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            'options': 'INSERT INTO "Survey_Options" (option_id, survey_id, option_text, option_order) VALUES (?, ?, ?, ?)',
+            'responses': 'INSERT INTO "Survey_Responses" (response_id, survey_id, option_id, respondent_email, response_date) '
+                         'VALUES (?, ?, ?, NULL, ?)',
+            'survey_counters': 'INSERT INTO "Survey_Counters" (survey_id, response_count, updated_at) VALUES (?, ?, ?)',
+            'option_counters': 'INSERT INTO "Survey_Option_Counters" (option_id, response_count) VALUES (?, ?)',
+            'rollups': 'INSERT INTO "Survey_Response_Rollups" (option_id, granularity, bucket_start, survey_id, response_count) '
+                       'VALUES (?, ?, ?, ?, ?)',
+        }
+        
+        def flush():
+            for name, rows in pending.items():
+                if rows:
+                    cursor.executemany(statements[name], rows)
+                    rows.clear()
+            connection.commit()
+        
+        progress = Progress(responses, 'responses')
+        for index in range(survey_count):
+            owner = user_id + index // surveys_per_user
+            created = rng.randrange(now_offset)
+            created_at = f"{day_strings[created // 86400]} {second_strings[created % 86400]}"
+            pending['surveys'].append((
+                survey_id, owner, f"Survey {survey_id}", 'Generated survey', rng.random() < 0.9, created_at, created_at
+            ))
+            
+            # A few options collect most of the votes
+            option_ids = list(range(option_id, option_id + rng.randint(2, 5)))
+            option_weights = [rng.paretovariate(1.2) for _ in option_ids]
+            for order, oid in enumerate(option_ids, 1):
+                pending['options'].append((oid, survey_id, f"Option {order}", order))
+            option_id += len(option_ids)
+            
+            count = response_counts[index]
+            if count:
+                # Responses decay after the survey is published and follow a daily cycle
+                first_day_index = created // 86400
+                chosen_options = rng.choices(option_ids, weights=option_weights, k=count)
+                chosen_hours = rng.choices(hours, weights=HOURLY_TRAFFIC, k=count)
+                option_counts = Counter(chosen_options)
+                rollups = Counter()
+                for oid, hour in zip(chosen_options, chosen_hours):
+                    day = min(first_day_index + int(rng.expovariate(1 / decay_days)), last_day_index)
+                    moment = day * 86400 + hour * 3600 + int(rng.random() * 3600)
+                    if moment < created or moment > now_offset:
+                        moment = rng.randint(created, min(created + 86400, now_offset))
+                    day, second = divmod(moment, 86400)
+                    pending['responses'].append((
+                        response_id, survey_id, oid, f"{day_strings[day]} {second_strings[second]}"
+                    ))
+                    response_id += 1
+                    rollups[(oid, day, second // 3600)] += 1
+                    if len(pending['responses']) >= batch_size:
+                        flush()
+                
+                day_totals = Counter()
+                for (oid, day, hour), n in rollups.items():
+                    pending['rollups'].append((oid, 'hour', f"{day_strings[day]} {hour_strings[hour]}", survey_id, n))
+                    day_totals[(oid, day)] += n
+                for (oid, day), n in day_totals.items():
+                    pending['rollups'].append((oid, 'day', f"{day_strings[day]} {hour_strings[0]}", survey_id, n))
+                pending['survey_counters'].append((survey_id, count, now.strftime(DATETIME_FORMAT)))
+                pending['option_counters'].extend(option_counts.items())
+                progress.advance(count)
+            
+            survey_id += 1
+            if len(pending['responses']) >= batch_size or len(pending['surveys']) >= batch_size:
+                flush()
+        flush()
+    finally:
+        connection.close()
+    
+    print(f"Generated {users:,} users, {survey_count:,} surveys and {responses:,} responses.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create the database, demo data and optionally a synthetic dataset.')
+    parser.add_argument('--users', type=int, default=0, help='Number of synthetic users to generate.')
+    parser.add_argument('--surveys-per-user', type=int, default=10)
+    parser.add_argument('--responses', type=int, default=0, help='Total number of synthetic responses.')
+    parser.add_argument('--days', type=int, default=365, help='Spread survey creation over this many days.')
+    parser.add_argument('--batch-size', type=int, default=100000, help='Rows per executemany and transaction.')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for reproducible datasets.')
+    args = parser.parse_args()
+    
+    app = create_db_app()
+    init_db(app)
+    if args.users:
+        started = time.monotonic()
+        generate_dataset(
+            app, args.users, args.surveys_per_user, args.responses,
+            days=args.days, batch_size=args.batch_size, seed=args.seed
+        )
+        print(f"Finished in {time.monotonic() - started:,.1f}s.")
+
+
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""add response counters
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-18 15:02:41.118604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001a'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created with db.create_all() after the counters were added,
+    # and stamped at the baseline, already have the tables.
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if 'Survey_Counters' not in tables:
+        op.create_table('Survey_Counters',
+        sa.Column('survey_id', sa.Integer(), nullable=False),
+        sa.Column('response_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['survey_id'], ['Surveys.survey_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('survey_id')
+        )
+    if 'Survey_Option_Counters' not in tables:
+        op.create_table('Survey_Option_Counters',
+        sa.Column('option_id', sa.Integer(), nullable=False),
+        sa.Column('response_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['option_id'], ['Survey_Options.option_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('option_id')
+        )
+    # The counters are filled from the existing responses by revision 0007.
+
+
+def downgrade():
+    op.drop_table('Survey_Option_Counters')
+    op.drop_table('Survey_Counters')
@@ -0,0 +1,36 @@
+"""fill response counters
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 12:10:41.204318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created before the counters existed, and stamped at the
+    # baseline, have responses but no counter rows; rebuild them all.
+    op.execute('DELETE FROM "Survey_Option_Counters"')
+    op.execute('DELETE FROM "Survey_Counters"')
+    op.execute(
+        'INSERT INTO "Survey_Option_Counters" (option_id, response_count) '
+        'SELECT option_id, count(*) FROM "Survey_Responses" GROUP BY option_id'
+    )
+    op.execute(
+        'INSERT INTO "Survey_Counters" (survey_id, response_count, updated_at) '
+        'SELECT survey_id, count(*), CURRENT_TIMESTAMP FROM "Survey_Responses" GROUP BY survey_id'
+    )
+
+
+def downgrade():
+    # The counters are derived data; they are left in place.
+    pass
@@ -0,0 +1,41 @@
+"""fill response rollups
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 12:31:07.519842
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# strftime patterns matching SQLAlchemy's SQLite DATETIME storage format
+BUCKET_FORMATS = {
+    'hour': '%Y-%m-%d %H:00:00.000000',
+    'day': '%Y-%m-%d 00:00:00.000000',
+}
+
+
+def upgrade():
+    # Responses stored before the rollups existed are not in any bucket;
+    # rebuild them all, as 'flask rollups backfill' does.
+    op.execute('DELETE FROM "Survey_Response_Rollups"')
+    for granularity, bucket_format in BUCKET_FORMATS.items():
+        op.execute(sa.text(
+            'INSERT INTO "Survey_Response_Rollups" '
+            '(option_id, granularity, bucket_start, survey_id, response_count) '
+            'SELECT option_id, :granularity, strftime(:bucket_format, response_date), survey_id, count(*) '
+            'FROM "Survey_Responses" WHERE response_date IS NOT NULL '
+            'GROUP BY option_id, strftime(:bucket_format, response_date)'
+        ).bindparams(granularity=granularity, bucket_format=bucket_format))
+
+
+def downgrade():
+    # The rollups are derived data; they are left in place.
+    pass
@@ -0,0 +1,192 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+ASGI application.
+
+``POST /api/surveys/<id>/respond`` is answered on the async submit path;
+every other request is handed to the Flask application on a pool of
+``ASGI_WSGI_THREADS`` threads. ``asgiref``'s own adapter runs every WSGI
+request on one shared thread, so a single slow or streaming response
+would block all other Flask routes.
+"""
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+from src.services.async_submit import async_submitter, SubmissionError
+
+SUBMIT_PATH = re.compile(r'^/api/surveys/(\d+)/respond$')
+
+# Response submissions are tiny JSON documents
+MAX_SUBMIT_BODY = 64 * 1024
+
+
+class SurveyASGIApp:
+    """Route response submissions to the async path and the rest to Flask."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = ThreadPoolWsgiToAsgi(flask_app, flask_app.config.get('ASGI_WSGI_THREADS', 32))
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        
+        match = SUBMIT_PATH.match(scope.get('path', ''))
+        if scope['type'] == 'http' and scope['method'] == 'POST' and match:
+            await self.submit_response(int(match.group(1)), receive, send)
+            return
+        
+        await self.wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        """Dispose of the async engine when the server shuts down."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await async_submitter.dispose()
+                self.wsgi.shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def submit_response(self, survey_id, receive, send):
+        """Submit a response to a survey."""
+        body = await read_body(receive, MAX_SUBMIT_BODY)
+        if body is None:
+            await send_json(send, 413, {'error': 'Request body too large'})
+            return
+        
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        
+        # Validate input
+        if not isinstance(data, dict) or not data.get('option_id'):
+            await send_json(send, 400, {'error': 'Option ID is required'})
+            return
+        
+        try:
+            option_id = int(data['option_id'])
+        except (TypeError, ValueError):
+            await send_json(send, 400, {'error': 'Invalid option for this survey'})
+            return
+        
+        try:
+            status, payload = await async_submitter.submit(survey_id, option_id, data.get('email'))
+        except SubmissionError as e:
+            status, payload = e.status_code, {'error': str(e)}
+        except Exception as e:
+            self.flask_app.logger.error(f"Error submitting response: {str(e)}")
+            status, payload = 500, {'error': 'Failed to submit response'}
+        await send_json(send, status, payload)
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    """WSGI adapter that runs each request on its own thread of a pool."""
+
+    def __init__(self, wsgi_application, max_workers):
+        super().__init__(wsgi_application)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='wsgi')
+
+    async def __call__(self, scope, receive, send):
+        await _ThreadPoolWsgiInstance(self.wsgi_application, self.executor)(scope, receive, send)
+
+    def shutdown(self):
+        """Stop the pool without waiting for open streaming responses."""
+        self.executor.shutdown(wait=False)
+
+
+class _ThreadPoolWsgiInstance(WsgiToAsgiInstance):
+    """One request of :class:`ThreadPoolWsgiToAsgi`."""
+
+    def __init__(self, wsgi_application, executor):
+        super().__init__(wsgi_application)
+        self.executor = executor
+
+    async def run_wsgi_app(self, body):
+        await sync_to_async(self._run_wsgi_app, thread_sensitive=False, executor=self.executor)(body)
+
+    def _run_wsgi_app(self, body):
+        """Run the WSGI application and send its response, like asgiref does.
+
+        Unlike asgiref, the response iterable is closed, which lets Flask
+        tear down the request and application contexts.
+        """
+        environ = self.build_environ(self.scope, body)
+        output = self.wsgi_application(environ, self.start_response)
+        try:
+            bytes_sent = 0
+            for chunk in output:
+                if not self.response_started:
+                    self.response_started = True
+                    self.sync_send(self.response_start)
+                if self.response_content_length is not None:
+                    chunk = chunk[:self.response_content_length - bytes_sent]
+                self.sync_send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                bytes_sent += len(chunk)
+                if bytes_sent == self.response_content_length:
+                    break
+        finally:
+            if hasattr(output, 'close'):
+                output.close()
+        
+        if not self.response_started:
+            self.response_started = True
+            self.sync_send(self.response_start)
+        self.sync_send({'type': 'http.response.body'})
+
+
+async def read_body(receive, limit):
+    """Read the request body, or return None if it exceeds ``limit`` bytes."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def send_json(send, status, payload):
+    """Send a complete JSON response."""
+    body = json.dumps(payload).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode()),
+            # Same CORS policy as the Flask application
+            (b'access-control-allow-origin', b'*'),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def create_asgi_app(flask_app):
+    """Wrap a Flask application created by ``create_app``."""
+    return SurveyASGIApp(flask_app)
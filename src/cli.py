@@ -0,0 +1,151 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Command line interface commands.
+Each command group is registered in the app factory located in app.py
+"""
+import os
+
+import click
+from flask import current_app
+from flask.cli import AppGroup, with_appcontext
+
+from src.services.counters import rebuild_counters, verify_counters
+from src.services.purge import survey_purger
+from src.services.query_plans import check_query_plans, is_full_scan
+from src.services.rollups import backfill_rollups
+from src.services.slow_queries import slow_query_log, top_slow_queries
+
+counters_cli = AppGroup('counters', help='Maintain the materialized response counters.')
+rollups_cli = AppGroup('rollups', help='Maintain the time-bucketed response rollups.')
+templates_cli = AppGroup('templates', help='Manage the compiled template cache.')
+slow_queries_cli = AppGroup('slow-queries', help='Inspect the slow-query log.')
+surveys_cli = AppGroup('surveys', help='Maintain surveys.')
+
+
+@counters_cli.command('rebuild')
+@click.option('--survey-id', type=int, default=None, help='Only rebuild the counters of this survey.')
+def rebuild_counters_command(survey_id):
+    """Rebuild the response counters from Survey_Responses."""
+    survey_counts, option_counts = rebuild_counters(survey_id)
+    click.echo(
+        f"Rebuilt counters for {len(survey_counts)} surveys and {len(option_counts)} options "
+        f"({sum(survey_counts.values())} responses)."
+    )
+
+
+@counters_cli.command('verify')
+@click.option('--survey-id', type=int, default=None, help='Only verify the counters of this survey.')
+def verify_counters_command(survey_id):
+    """Verify the response counters against Survey_Responses."""
+    mismatches = verify_counters(survey_id)
+    for kind, key, stored, actual in mismatches:
+        click.echo(f"{kind} {key}: stored={stored} actual={actual}")
+    
+    if mismatches:
+        raise click.ClickException(
+            f"{len(mismatches)} counters are out of date. Run 'flask counters rebuild' to fix them."
+        )
+    click.echo('All counters are up to date.')
+
+
+@rollups_cli.command('backfill')
+@click.option('--survey-id', type=int, default=None, help='Only backfill the rollups of this survey.')
+def backfill_rollups_command(survey_id):
+    """Rebuild the hourly and daily rollups from Survey_Responses."""
+    written = backfill_rollups(survey_id)
+    click.echo(f"Wrote {written} rollup rows.")
+
+
+@surveys_cli.command('purge')
+def purge_surveys_command():
+    """Remove the rows of every survey that was deleted but not purged yet."""
+    survey_ids = survey_purger.pending_surveys()
+    for survey_id in survey_ids:
+        deleted = survey_purger.purge(survey_id)
+        click.echo(f"Purged survey {survey_id} ({deleted} responses).")
+    click.echo(f"Purged {len(survey_ids)} surveys.")
+
+
+@templates_cli.command('compile')
+def compile_templates_command():
+    """Compile every template into the bytecode cache."""
+    if current_app.jinja_env.bytecode_cache is None:
+        raise click.ClickException('The template bytecode cache is disabled (JINJA_BYTECODE_CACHE).')
+    
+    names = current_app.jinja_env.list_templates()
+    for name in names:
+        current_app.jinja_env.get_template(name)
+    click.echo(f"Compiled {len(names)} templates.")
+
+
+@slow_queries_cli.command('top')
+@click.option('-n', '--limit', type=int, default=10, help='Number of statements to show.')
+@click.option('--sort', type=click.Choice(['total', 'max', 'count']), default='total',
+              help='Order by total time, longest execution or number of slow executions.')
+def top_slow_queries_command(limit, sort):
+    """Show the slowest statements recorded by every worker."""
+    entries = top_slow_queries(slow_query_log.path, limit, sort)
+    if not entries:
+        click.echo(f"No slow queries recorded in {slow_query_log.path}.")
+        return
+    
+    for rank, entry in enumerate(entries, 1):
+        click.echo(
+            f"{rank}. total={entry['total_ms']:.1f} ms count={entry['count']} "
+            f"max={entry['max_ms']:.1f} ms endpoints={', '.join(sorted(entry['endpoints'])) or '-'}"
+        )
+        click.echo(f"    {entry['sql']}")
+        if entry['parameters'] is not None:
+            click.echo(f"    parameters: {entry['parameters']}")
+        for detail in entry['plan'] or []:
+            marker = '  <- FULL SCAN' if is_full_scan(detail) else ''
+            click.echo(f"    plan: {detail}{marker}")
+
+
+@slow_queries_cli.command('clear')
+def clear_slow_queries_command():
+    """Delete the slow-query log file."""
+    if os.path.exists(slow_query_log.path):
+        os.remove(slow_query_log.path)
+    click.echo(f"Cleared {slow_query_log.path}.")
+
+
+@click.command('check-query-plans')
+@with_appcontext
+def check_query_plans_command():
+    """Fail if any hot query performs a full table scan."""
+    report = check_query_plans()
+    failures = 0
+    for name, (plan, full_scans) in report.items():
+        status = 'FULL SCAN' if full_scans else 'ok'
+        click.echo(f"{name}: {status}")
+        for detail in plan:
+            click.echo(f"    {detail}")
+        if full_scans:
+            failures += 1
+    
+    if failures:
+        raise click.ClickException(f"{failures} hot queries scan a whole table.")
+
+
+def register_commands(app):
+    """Register CLI command groups."""
+    app.cli.add_command(counters_cli)
+    app.cli.add_command(rollups_cli)
+    app.cli.add_command(templates_cli)
+    app.cli.add_command(surveys_cli)
+    app.cli.add_command(slow_queries_cli)
+    app.cli.add_command(check_query_plans_command)
@@ -0,0 +1,48 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Conditional GET helpers for the JSON API.
+
+Routes compute an entity tag from a cheap version stamp and answer
+matching ``If-None-Match``/``If-Modified-Since`` requests with a 304
+before loading and serializing the full payload.
+"""
+import hashlib
+
+from flask import Response, request
+from werkzeug.http import is_resource_modified
+
+
+def make_etag(*parts):
+    """Build an entity tag from the parts of a version stamp."""
+    return hashlib.sha1(':'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def not_modified(etag, last_modified=None):
+    """Return a 304 response if the client's copy is current, otherwise None."""
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return None
+    return set_validators(Response(status=304), etag, last_modified)
+
+
+def set_validators(response, etag, last_modified=None):
+    """Attach the validators to a response and require clients to revalidate."""
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
@@ -0,0 +1,162 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Database engine configuration.
+"""
+import glob
+import os
+import re
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.extensions import db
+from src.session import READ_BIND_KEY
+
+_REVISION = re.compile(r"^revision = ['\"](\w+)['\"]", re.MULTILINE)
+_DOWN_REVISION = re.compile(r"^down_revision = ['\"](\w+)['\"]", re.MULTILINE)
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised when the database is not at the latest migration."""
+
+
+def configure_binds(app):
+    """Register the read-only engine as a bind, if one is configured.
+
+    Must be called before ``db.init_app``. The URI comes from
+    ``READ_DATABASE_URL`` or ``SQLALCHEMY_READ_DATABASE_URI``. For SQLite,
+    open the same file in read-only mode, e.g.
+    ``sqlite:///file:/path/to/customer_feedback.db?mode=ro&uri=true``.
+    """
+    read_uri = os.getenv('READ_DATABASE_URL') or app.config.get('SQLALCHEMY_READ_DATABASE_URI')
+    if read_uri:
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        binds[READ_BIND_KEY] = read_uri
+        app.config['SQLALCHEMY_BINDS'] = binds
+
+
+def configure_engines(app):
+    """Apply the engine profile from the application config.
+
+    ``SQLITE_PRAGMAS`` maps PRAGMA names to values that are set on every new
+    SQLite connection, e.g. ``{'journal_mode': 'WAL', 'busy_timeout': 5000}``.
+    ``foreign_keys`` is always enabled so that ``ON DELETE CASCADE`` removes
+    the rows of deleted surveys. The read-only engine skips
+    ``journal_mode``, which needs write access, and enables ``query_only``.
+    """
+    pragmas = _with_foreign_keys(app.config.get('SQLITE_PRAGMAS'))
+    
+    with app.app_context():
+        engines = dict(db.engines)
+    
+    for bind_key, engine in engines.items():
+        if engine.dialect.name != 'sqlite':
+            continue
+        engine_pragmas = dict(pragmas)
+        if bind_key == READ_BIND_KEY:
+            engine_pragmas.pop('journal_mode', None)
+            engine_pragmas['query_only'] = 'ON'
+        event.listen(engine, 'connect', _sqlite_pragma_listener(engine_pragmas))
+
+
+def make_async_engine(app):
+    """Create the async engine used by the ASGI submit path.
+
+    The URI comes from ``ASYNC_SUBMIT_DATABASE_URI`` and defaults to the
+    primary database opened through ``aiosqlite``. ``SQLITE_PRAGMAS`` are
+    applied to its connections as well.
+    """
+    uri = app.config.get('ASYNC_SUBMIT_DATABASE_URI')
+    if not uri:
+        url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+        uri = url.set(drivername='sqlite+aiosqlite') if url.drivername == 'sqlite' else url
+    
+    engine = create_async_engine(
+        uri,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=app.config.get('ASYNC_SUBMIT_POOL_SIZE', 5),
+        max_overflow=app.config.get('ASYNC_SUBMIT_MAX_OVERFLOW', 10)
+    )
+    if engine.dialect.name == 'sqlite':
+        pragmas = _with_foreign_keys(app.config.get('SQLITE_PRAGMAS'))
+        event.listen(engine.sync_engine, 'connect', _sqlite_pragma_listener(pragmas))
+    return engine
+
+
+def head_revision(versions_directory):
+    """Return the latest revision among the migration scripts.
+
+    The scripts are scanned as text instead of being loaded through alembic,
+    which keeps the check cheap enough to run in every worker process.
+    """
+    revisions = set()
+    parents = set()
+    for path in glob.glob(os.path.join(versions_directory, '*.py')):
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        revisions.update(_REVISION.findall(source))
+        parents.update(_DOWN_REVISION.findall(source))
+    heads = revisions - parents
+    if len(heads) != 1:
+        raise SchemaVersionError(f"Expected one head revision in {versions_directory}, found {sorted(heads)}")
+    return heads.pop()
+
+
+def check_schema_version(app):
+    """Fail unless the database has been migrated to the latest revision.
+
+    Used instead of ``db.create_all()`` when ``SCHEMA_STARTUP_MODE`` is
+    ``'check'``: a single query reads the revision stored by Flask-Migrate.
+    """
+    expected = head_revision(os.path.join(app.root_path, 'migrations', 'versions'))
+    with app.app_context():
+        try:
+            current = db.session.execute(text('SELECT version_num FROM alembic_version')).scalar()
+        except OperationalError:
+            current = None
+        finally:
+            db.session.remove()
+    
+    if current != expected:
+        raise SchemaVersionError(
+            f"Database schema is at revision {current}, expected {expected}. Run 'flask db upgrade'."
+        )
+    return current
+
+
+def _with_foreign_keys(pragmas):
+    """Return ``pragmas`` with foreign key enforcement turned on."""
+    return {'foreign_keys': 'ON', **(pragmas or {})}
+
+
+def _sqlite_pragma_listener(pragmas):
+    """Build a connect listener that applies the given PRAGMAs."""
+    # busy_timeout goes first so that switching the journal mode waits for
+    # other connections instead of failing with "database is locked".
+    ordered = sorted(pragmas.items(), key=lambda item: item[0] != 'busy_timeout')
+    
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in ordered:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    
+    return set_sqlite_pragmas
@@ -17,10 +17,10 @@ Extensions module.
 Each extension is initialized in the app factory located in app.py
 """
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flask_login import LoginManager
 
+from src.session import RoutingSession
+
 # Initialize extensions
-db = SQLAlchemy()
-migrate = Migrate()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 login_manager = LoginManager()
\ No newline at end of file
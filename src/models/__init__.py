@@ -16,4 +16,4 @@
 Models package.
 """
 from src.models.user import User
-from src.models.survey import Survey, SurveyOption, SurveyResponse
\ No newline at end of file
+from src.models.survey import Survey, SurveyOption, SurveyResponse, SurveyCounter, SurveyOptionCounter, SurveyResponseRollup
\ No newline at end of file
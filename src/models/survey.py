@@ -16,7 +16,13 @@
 Survey models.
 """
 from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.orm import with_loader_criteria
+
 from src.extensions import db
+from src.models.user import User
+from src.session import RoutingSession
 
 
 class Survey(db.Model):
@@ -30,10 +36,21 @@ class Survey(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Set when the survey is deleted; its responses are then purged in the background
+    deleted_at = db.Column(db.DateTime)
+    
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_surveys_user_id_created_at_survey_id', 'user_id', 'created_at', 'survey_id'),
+    )
     
-    # Relationships
-    options = db.relationship('SurveyOption', backref='survey', lazy=True, cascade='all, delete-orphan')
-    responses = db.relationship('SurveyResponse', backref='survey', lazy=True, cascade='all, delete-orphan')
+    # Relationships; child rows are removed by ON DELETE CASCADE in the database
+    options = db.relationship('SurveyOption', backref='survey', lazy=True, cascade='all, delete-orphan',
+                              passive_deletes=True)
+    responses = db.relationship('SurveyResponse', backref='survey', lazy=True, cascade='all, delete-orphan',
+                                passive_deletes=True)
+    counter = db.relationship('SurveyCounter', uselist=False, lazy=True, cascade='all, delete-orphan',
+                              passive_deletes=True)
     
     def __init__(self, user_id, title, description=None):
         self.user_id = user_id
@@ -56,6 +73,38 @@ class Survey(db.Model):
         }
 
 
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _hide_deleted_surveys(execute_state):
+    """Leave soft-deleted surveys out of ORM queries.
+
+    Pass ``execution_options(include_deleted=True)`` to see them.
+    """
+    if (execute_state.is_select
+            and not execute_state.is_column_load
+            and not execute_state.is_relationship_load
+            and not execute_state.execution_options.get('include_deleted', False)):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(Survey, Survey.deleted_at.is_(None), include_aliases=True)
+        )
+
+
+@event.listens_for(RoutingSession, 'before_flush')
+def _touch_survey_lists(session, flush_context, instances):
+    """Bump the survey list stamp of every user whose surveys are being written."""
+    user_ids = {
+        survey.user_id
+        for survey in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(survey, Survey) and survey.user_id is not None
+        and (survey not in session.dirty or session.is_modified(survey, include_collections=False))
+    }
+    if user_ids:
+        session.execute(
+            User.__table__.update()
+            .where(User.__table__.c.user_id.in_(user_ids))
+            .values(surveys_updated_at=datetime.utcnow())
+        )
+
+
 class SurveyOption(db.Model):
     """Survey option model for storing survey choices."""
     __tablename__ = 'Survey_Options'
@@ -68,10 +117,16 @@ class SurveyOption(db.Model):
     # Constraints
     __table_args__ = (
         db.CheckConstraint('option_order BETWEEN 1 AND 5', name='check_option_order'),
+        db.Index('ix_survey_options_survey_id_option_order', 'survey_id', 'option_order'),
     )
     
-    # Relationships
-    responses = db.relationship('SurveyResponse', backref='option', lazy=True, cascade='all, delete-orphan')
+    # Relationships; child rows are removed by ON DELETE CASCADE in the database
+    responses = db.relationship('SurveyResponse', backref='option', lazy=True, cascade='all, delete-orphan',
+                                passive_deletes=True)
+    counter = db.relationship('SurveyOptionCounter', uselist=False, lazy=True, cascade='all, delete-orphan',
+                              passive_deletes=True)
+    rollups = db.relationship('SurveyResponseRollup', lazy=True, cascade='all, delete-orphan',
+                              passive_deletes=True)
     
     def __init__(self, survey_id, option_text, option_order):
         self.survey_id = survey_id
@@ -100,6 +155,13 @@ class SurveyResponse(db.Model):
     respondent_email = db.Column(db.String(120))
     response_date = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_survey_responses_survey_id_option_id', 'survey_id', 'option_id'),
+        db.Index('ix_survey_responses_survey_id_response_date', 'survey_id', 'response_date'),
+        db.Index('ix_survey_responses_option_id', 'option_id'),
+    )
+    
     def __init__(self, survey_id, option_id, respondent_email=None):
         self.survey_id = survey_id
         self.option_id = option_id
@@ -116,4 +178,64 @@ class SurveyResponse(db.Model):
             'option_id': self.option_id,
             'respondent_email': self.respondent_email,
             'response_date': self.response_date.isoformat()
-        }
\ No newline at end of file
+        }
+
+
+class SurveyCounter(db.Model):
+    """Materialized total number of responses for a survey."""
+    __tablename__ = 'Survey_Counters'
+    
+    survey_id = db.Column(db.Integer, db.ForeignKey('Surveys.survey_id', ondelete='CASCADE'), primary_key=True)
+    response_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __init__(self, survey_id, response_count=0):
+        self.survey_id = survey_id
+        self.response_count = response_count
+    
+    def __repr__(self):
+        return f'<SurveyCounter {self.survey_id}: {self.response_count}>'
+
+
+class SurveyOptionCounter(db.Model):
+    """Materialized number of responses for a survey option."""
+    __tablename__ = 'Survey_Option_Counters'
+    
+    option_id = db.Column(db.Integer, db.ForeignKey('Survey_Options.option_id', ondelete='CASCADE'), primary_key=True)
+    response_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __init__(self, option_id, response_count=0):
+        self.option_id = option_id
+        self.response_count = response_count
+    
+    def __repr__(self):
+        return f'<SurveyOptionCounter {self.option_id}: {self.response_count}>'
+
+
+
+class SurveyResponseRollup(db.Model):
+    """Number of responses per option in an hourly or daily time bucket."""
+    __tablename__ = 'Survey_Response_Rollups'
+    
+    option_id = db.Column(db.Integer, db.ForeignKey('Survey_Options.option_id', ondelete='CASCADE'), primary_key=True)
+    granularity = db.Column(db.String(4), primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    survey_id = db.Column(db.Integer, db.ForeignKey('Surveys.survey_id', ondelete='CASCADE'), nullable=False)
+    response_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    # Constraints
+    __table_args__ = (
+        db.CheckConstraint("granularity IN ('hour', 'day')", name='check_rollup_granularity'),
+        db.Index('ix_survey_response_rollups_survey_id_granularity_bucket_start',
+                 'survey_id', 'granularity', 'bucket_start'),
+    )
+    
+    def __init__(self, survey_id, option_id, granularity, bucket_start, response_count=0):
+        self.survey_id = survey_id
+        self.option_id = option_id
+        self.granularity = granularity
+        self.bucket_start = bucket_start
+        self.response_count = response_count
+    
+    def __repr__(self):
+        return f'<SurveyResponseRollup {self.option_id} {self.granularity} {self.bucket_start}: {self.response_count}>'
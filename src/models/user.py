@@ -17,8 +17,8 @@ User model.
 """
 from datetime import datetime
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-from src.extensions import db, login_manager
+from src.extensions import db
+from src.services.passwords import password_hasher
 
 
 class User(UserMixin, db.Model):
@@ -31,6 +31,9 @@ class User(UserMixin, db.Model):
     password_hash = db.Column(db.String(256), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_login = db.Column(db.DateTime)
+    # Version stamp of the survey list, set whenever one of the user's
+    # surveys is created, edited or deleted
+    surveys_updated_at = db.Column(db.DateTime)
     
     # Relationships
     surveys = db.relationship('Survey', backref='user', lazy=True, cascade='all, delete-orphan')
@@ -42,11 +45,15 @@ class User(UserMixin, db.Model):
     
     def set_password(self, password):
         """Create hashed password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
         """Check hashed password."""
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        """Check whether the password hash uses an outdated method or cost."""
+        return password_hasher.needs_rehash(self.password_hash)
     
     def get_id(self):
         """Return the user ID as a unicode string."""
@@ -54,9 +61,3 @@ class User(UserMixin, db.Model):
     
     def __repr__(self):
         return f'<User {self.email}>'
-
-
-@login_manager.user_loader
-def load_user(user_id):
-    """User loader for Flask-Login."""
-    return User.query.get(int(user_id))
\ No newline at end of file
@@ -15,15 +15,34 @@
 """
 Authentication routes.
 """
-from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app
+from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app, make_response
 from flask_login import login_user, logout_user, login_required, current_user
 from datetime import datetime
 
 from src.extensions import db
 from src.models.user import User
+from src.services.passwords import PasswordHasherBusy
+from src.signals import user_changed, send_after_commit
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+# Form re-rendered when the password hashing pool is saturated
+_BUSY_TEMPLATES = {
+    'auth.register': 'auth/register.html',
+    'auth.login': 'auth/login.html',
+    'auth.get_profile': 'auth/profile.html',
+}
+
+
+@auth_bp.errorhandler(PasswordHasherBusy)
+def password_hasher_busy(e):
+    """Ask the user to retry when no password hashing slot is free."""
+    db.session.rollback()
+    flash('The server is busy, please try again in a moment', 'error')
+    response = make_response(render_template(_BUSY_TEMPLATES.get(request.endpoint, 'auth/login.html')), 503)
+    response.headers['Retry-After'] = '1'
+    return response
+
 
 @auth_bp.route('/register', methods=['GET', 'POST'])
 def register():
@@ -63,6 +82,8 @@ def register():
             
             flash('Registration successful! Please log in.', 'success')
             return redirect(url_for('auth.login'))
+        except PasswordHasherBusy:
+            raise
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"Error registering user: {str(e)}")
@@ -89,8 +110,13 @@ def login():
         # Check user credentials
         user = User.query.filter_by(email=email).first()
         if user and user.check_password(password):
+            # Upgrade hashes made with an older method or cost
+            if user.password_needs_rehash():
+                user.set_password(password)
+            
             # Update last login time
             user.last_login = datetime.utcnow()
+            send_after_commit(db.session, user_changed, user_id=user.user_id)
             db.session.commit()
             
             # Login user
@@ -147,6 +173,7 @@ def get_profile():
             current_user.set_password(new_password)
         
         try:
+            send_after_commit(db.session, user_changed, user_id=current_user.user_id)
             db.session.commit()
             flash('Profile updated successfully', 'success')
         except Exception as e:
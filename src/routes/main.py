@@ -15,10 +15,22 @@
 """
 Main routes for the application.
 """
-from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app
+from datetime import datetime
+
+from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app, session, make_response, abort
 from flask_login import login_required, current_user
 from src.models.survey import Survey, SurveyOption, SurveyResponse
 from src.extensions import db
+from src.session import read_only
+from src.signals import survey_changed, send_after_commit
+from src.services.counters import record_responses
+from src.services.ingest import ingestor, IngestQueueFull
+from src.services.live import broadcaster
+from src.services.metrics import request_metrics
+from src.services.pages import get_respond_page
+from src.services.purge import remove_survey
+from src.services.results import get_survey_results
+from src.services.surveys import get_survey_page, InvalidCursor
 
 main_bp = Blueprint('main', __name__)
 
@@ -31,12 +43,38 @@ def index():
     return render_template('index.html')
 
 
+@main_bp.route('/metrics')
+def metrics():
+    """Request and SQL metrics of this worker process in the Prometheus text format."""
+    if not request_metrics.enabled:
+        abort(404)
+    
+    response = make_response(request_metrics.render())
+    response.mimetype = 'text/plain'
+    response.headers['Content-Type'] = 'text/plain; version=0.0.4; charset=utf-8'
+    return response
+
+
 @main_bp.route('/dashboard')
+@read_only
 @login_required
 def dashboard():
     """Dashboard page."""
-    surveys = Survey.query.filter_by(user_id=current_user.user_id).all()
-    return render_template('dashboard.html', surveys=surveys)
+    try:
+        surveys, next_cursor, prev_cursor = get_survey_page(
+            current_user.user_id,
+            current_app.config['SURVEYS_PAGE_SIZE'],
+            request.args.get('cursor')
+        )
+    except InvalidCursor:
+        return redirect(url_for('main.dashboard'))
+    
+    return render_template(
+        'dashboard.html',
+        surveys=surveys,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
+    )
 
 
 @main_bp.route('/surveys/create', methods=['GET', 'POST'])
@@ -78,6 +116,7 @@ def create_survey():
                 )
                 db.session.add(option)
             
+            send_after_commit(db.session, survey_changed, survey_id=survey.survey_id)
             db.session.commit()
             flash('Survey created successfully', 'success')
             return redirect(url_for('main.view_survey', survey_id=survey.survey_id))
@@ -90,20 +129,14 @@ def create_survey():
 
 
 @main_bp.route('/surveys/<int:survey_id>')
+@read_only
 @login_required
 def view_survey(survey_id):
     """View a specific survey."""
     survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first_or_404()
-    options = SurveyOption.query.filter_by(survey_id=survey_id).order_by(SurveyOption.option_order).all()
     
     # Get results
-    results = {}
-    total_responses = 0
-    
-    for option in options:
-        count = SurveyResponse.query.filter_by(option_id=option.option_id).count()
-        results[option.option_text] = count
-        total_responses += count
+    survey_results = get_survey_results(survey_id)
     
     # Generate share link
     host = request.host_url.rstrip('/')
@@ -112,10 +145,12 @@ def view_survey(survey_id):
     return render_template(
         'view_survey.html',
         survey=survey,
-        options=options,
-        results=results,
-        total_responses=total_responses,
-        share_link=share_link
+        options=survey_results['options'],
+        results=survey_results['results'],
+        percentages=survey_results['percentages'],
+        total_responses=survey_results['total_responses'],
+        share_link=share_link,
+        live_results=broadcaster.enabled
     )
 
 
@@ -139,6 +174,7 @@ def edit_survey(survey_id):
             survey.description = description
             survey.is_active = is_active
             
+            send_after_commit(db.session, survey_changed, survey_id=survey_id)
             db.session.commit()
             flash('Survey updated successfully', 'success')
             return redirect(url_for('main.view_survey', survey_id=survey_id))
@@ -158,6 +194,7 @@ def toggle_survey_status(survey_id):
     
     try:
         survey.is_active = not survey.is_active
+        send_after_commit(db.session, survey_changed, survey_id=survey_id)
         db.session.commit()
         
         status = "activated" if survey.is_active else "deactivated"
@@ -177,8 +214,7 @@ def delete_survey(survey_id):
     survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first_or_404()
     
     try:
-        db.session.delete(survey)
-        db.session.commit()
+        remove_survey(survey)
         flash('Survey deleted successfully', 'success')
         return redirect(url_for('main.dashboard'))
     except Exception as e:
@@ -191,6 +227,22 @@ def delete_survey(survey_id):
 @main_bp.route('/respond/<int:survey_id>', methods=['GET', 'POST'])
 def respond_survey(survey_id):
     """Public page to respond to a survey."""
+    # Anonymous visitors without pending messages all see the same page
+    if request.method == 'GET' and current_user.is_anonymous and not session.get('_flashes'):
+        page = get_respond_page(survey_id)
+        response = make_response(page['body'], page['status'])
+        response.set_etag(page['etag'])
+        response.cache_control.public = True
+        # Shared caches must not serve this page to visitors with a session
+        response.vary.add('Cookie')
+        if current_app.config['RESPOND_PAGE_MAX_AGE']:
+            response.cache_control.max_age = current_app.config['RESPOND_PAGE_MAX_AGE']
+        else:
+            response.cache_control.no_cache = True
+        if page['status'] == 200:
+            response.make_conditional(request)
+        return response
+    
     survey = Survey.query.filter_by(survey_id=survey_id, is_active=True).first_or_404()
     options = SurveyOption.query.filter_by(survey_id=survey_id).order_by(SurveyOption.option_order).all()
     
@@ -202,13 +254,28 @@ def respond_survey(survey_id):
             flash('Please select an option', 'error')
             return render_template('respond_survey.html', survey=survey, options=options)
         
+        if option_id not in {str(option.option_id) for option in options}:
+            flash('Invalid option for this survey', 'error')
+            return render_template('respond_survey.html', survey=survey, options=options)
+        
+        if ingestor.enabled:
+            try:
+                ingestor.submit(survey_id, option_id, email)
+            except IngestQueueFull:
+                flash('We are receiving a lot of responses. Please try again in a moment.', 'error')
+                return render_template('respond_survey.html', survey=survey, options=options), 503
+            flash('Thank you for your feedback!', 'success')
+            return render_template('response_thank_you.html', survey=survey)
+        
         try:
             response = SurveyResponse(
                 survey_id=survey_id,
                 option_id=option_id,
                 respondent_email=email
             )
+            response.response_date = datetime.utcnow()
             db.session.add(response)
+            record_responses(survey_id, [(option_id, response.response_date)])
             db.session.commit()
             flash('Thank you for your feedback!', 'success')
             return render_template('response_thank_you.html', survey=survey)
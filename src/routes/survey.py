@@ -15,40 +15,92 @@
 """
 Survey routes.
 """
-from flask import Blueprint, request, jsonify, current_app
+from datetime import datetime
+
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from flask_login import login_required, current_user
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.conditional import make_etag, not_modified, set_validators
 from src.extensions import db
+from src.session import read_only
+from src.signals import survey_changed, send_after_commit
 from src.models.survey import Survey, SurveyOption, SurveyResponse
+from src.services.bulk_import import detect_format, import_responses
+from src.services.counters import record_responses
+from src.services.export import EXPORT_FORMATS, iter_response_rows, iter_csv, iter_ndjson
+from src.services.live import broadcaster
+from src.services.purge import remove_survey
+from src.services.ingest import ingestor, IngestQueueFull
+from src.services.results import get_survey_results
+from src.services.rollups import GRANULARITIES, get_timeseries, parse_utc_timestamp
+from src.services.surveys import get_survey_version, get_survey_list_version, list_survey_dicts, InvalidCursor
 
 survey_bp = Blueprint('survey', __name__, url_prefix='/api/surveys')
 
 
 @survey_bp.route('/', methods=['GET'])
+@read_only
 @login_required
 def get_surveys():
-    """Get all surveys for the current user."""
-    try:
-        surveys = Survey.query.filter_by(user_id=current_user.user_id).all()
+    """Get one page of surveys for the current user."""
+    limit = request.args.get('limit', current_app.config['SURVEYS_PAGE_SIZE'], type=int)
+    if limit < 1 or limit > current_app.config['SURVEYS_MAX_PAGE_SIZE']:
         return jsonify({
-            'surveys': [survey.to_dict() for survey in surveys]
-        }), 200
+            'error': f"limit must be between 1 and {current_app.config['SURVEYS_MAX_PAGE_SIZE']}"
+        }), 400
+    
+    try:
+        cursor = request.args.get('cursor')
+        version = get_survey_list_version(current_user.user_id)
+        etag = make_etag('surveys', current_user.user_id, limit, cursor, version)
+        response = not_modified(etag, version)
+        if response:
+            return response
+        
+        surveys, next_cursor, prev_cursor = list_survey_dicts(current_user.user_id, limit, cursor)
+        response = jsonify({
+            'surveys': surveys,
+            'limit': limit,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor
+        })
+        return set_validators(response, etag, version), 200
+    except InvalidCursor as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         current_app.logger.error(f"Error retrieving surveys: {str(e)}")
         return jsonify({'error': 'Failed to retrieve surveys'}), 500
 
 
+@survey_bp.route('/cache/stats', methods=['GET'])
+@login_required
+def get_cache_stats():
+    """Get hit/miss statistics of the in-process caches."""
+    caches = current_app.extensions.get('caches', {})
+    return jsonify({name: cache.stats() for name, cache in caches.items()}), 200
+
+
 @survey_bp.route('/<int:survey_id>', methods=['GET'])
+@read_only
 @login_required
 def get_survey(survey_id):
     """Get a specific survey."""
     try:
+        version = get_survey_version(survey_id, current_user.user_id)
+        if not version:
+            return jsonify({'error': 'Survey not found'}), 404
+        
+        etag = make_etag('survey', survey_id, version.updated_at)
+        response = not_modified(etag, version.updated_at)
+        if response:
+            return response
+        
         survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first()
         if not survey:
             return jsonify({'error': 'Survey not found'}), 404
         
-        return jsonify(survey.to_dict()), 200
+        return set_validators(jsonify(survey.to_dict()), etag, version.updated_at), 200
     except Exception as e:
         current_app.logger.error(f"Error retrieving survey: {str(e)}")
         return jsonify({'error': 'Failed to retrieve survey'}), 500
@@ -87,6 +139,7 @@ def create_survey():
             )
             db.session.add(option)
         
+        send_after_commit(db.session, survey_changed, survey_id=survey.survey_id)
         db.session.commit()
         return jsonify({
             'message': 'Survey created successfully',
@@ -124,6 +177,7 @@ def update_survey(survey_id):
         if 'is_active' in data:
             survey.is_active = data['is_active']
         
+        send_after_commit(db.session, survey_changed, survey_id=survey_id)
         db.session.commit()
         return jsonify({
             'message': 'Survey updated successfully',
@@ -144,8 +198,7 @@ def delete_survey(survey_id):
         if not survey:
             return jsonify({'error': 'Survey not found'}), 404
         
-        db.session.delete(survey)
-        db.session.commit()
+        remove_survey(survey)
         return jsonify({'message': 'Survey deleted successfully'}), 200
     except Exception as e:
         db.session.rollback()
@@ -176,13 +229,23 @@ def submit_response(survey_id):
         if not option:
             return jsonify({'error': 'Invalid option for this survey'}), 400
         
+        # Queue the response for the background writer
+        if ingestor.enabled:
+            try:
+                ingestor.submit(survey_id, option.option_id, data.get('email'))
+            except IngestQueueFull:
+                return jsonify({'error': 'Too many responses, please retry later'}), 503
+            return jsonify({'message': 'Response accepted'}), 202
+        
         # Create response
         response = SurveyResponse(
             survey_id=survey_id,
             option_id=data['option_id'],
             respondent_email=data.get('email')
         )
+        response.response_date = datetime.utcnow()
         db.session.add(response)
+        record_responses(survey_id, [(option.option_id, response.response_date)])
         db.session.commit()
         
         return jsonify({
@@ -195,33 +258,148 @@ def submit_response(survey_id):
         return jsonify({'error': 'Failed to submit response'}), 500
 
 
+@survey_bp.route('/<int:survey_id>/responses:bulk', methods=['POST'])
+@login_required
+def bulk_import_responses(survey_id):
+    """Import many responses from an NDJSON or CSV request body."""
+    fmt = detect_format(request.mimetype, request.args.get('format'))
+    if not fmt:
+        return jsonify({'error': 'Body must be NDJSON (application/x-ndjson) or CSV (text/csv)'}), 415
+    
+    try:
+        survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first()
+        if not survey:
+            return jsonify({'error': 'Survey not found'}), 404
+        
+        summary = import_responses(
+            survey_id,
+            request.stream,
+            fmt,
+            chunk_size=current_app.config['BULK_IMPORT_CHUNK_SIZE'],
+            max_errors=current_app.config['BULK_IMPORT_MAX_ERRORS']
+        )
+        status = 400 if summary['aborted'] else 200
+        return jsonify(summary), status
+    except Exception as e:
+        current_app.logger.error(f"Error importing responses: {str(e)}")
+        return jsonify({'error': 'Failed to import responses'}), 500
+
+
+@survey_bp.route('/<int:survey_id>/responses/export', methods=['GET'])
+@read_only
+@login_required
+def export_responses(survey_id):
+    """Stream the raw responses of a survey as CSV or NDJSON."""
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': 'format must be csv or ndjson'}), 400
+    
+    try:
+        since = request.args.get('since')
+        until = request.args.get('until')
+        since = parse_utc_timestamp(since) if since else None
+        until = parse_utc_timestamp(until) if until else None
+    except ValueError:
+        return jsonify({'error': 'since and until must be ISO 8601 timestamps'}), 400
+    
+    survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first()
+    if not survey:
+        return jsonify({'error': 'Survey not found'}), 404
+    
+    rows = iter_response_rows(
+        survey_id, since, until, chunk_size=current_app.config['EXPORT_CHUNK_SIZE']
+    )
+    body = iter_csv(rows) if fmt == 'csv' else iter_ndjson(rows)
+    
+    response = Response(stream_with_context(body), mimetype=EXPORT_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f"attachment; filename=survey-{survey_id}-responses.{fmt}"
+    return response
+
+
+@survey_bp.route('/<int:survey_id>/timeseries', methods=['GET'])
+@read_only
+@login_required
+def get_timeseries_results(survey_id):
+    """Get response counts per option over time from the rollups."""
+    granularity = request.args.get('bucket', 'hour')
+    if granularity not in GRANULARITIES:
+        return jsonify({'error': 'bucket must be hour or day'}), 400
+    
+    try:
+        until = request.args.get('until')
+        until = parse_utc_timestamp(until) if until else datetime.utcnow()
+        since = request.args.get('since')
+        default_buckets = current_app.config['TIMESERIES_DEFAULT_BUCKETS']
+        since = parse_utc_timestamp(since) if since else until - GRANULARITIES[granularity] * default_buckets
+    except ValueError:
+        return jsonify({'error': 'since and until must be ISO 8601 timestamps'}), 400
+    
+    if since >= until:
+        return jsonify({'error': 'since must be before until'}), 400
+    if (until - since) / GRANULARITIES[granularity] > current_app.config['TIMESERIES_MAX_BUCKETS']:
+        return jsonify({'error': 'Too many buckets requested, narrow the range or use a larger bucket'}), 400
+    
+    try:
+        survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first()
+        if not survey:
+            return jsonify({'error': 'Survey not found'}), 404
+        
+        return jsonify(get_timeseries(survey_id, granularity, since, until)), 200
+    except Exception as e:
+        current_app.logger.error(f"Error retrieving timeseries: {str(e)}")
+        return jsonify({'error': 'Failed to retrieve timeseries'}), 500
+
+
+@survey_bp.route('/<int:survey_id>/results/stream', methods=['GET'])
+@read_only
+@login_required
+def stream_results(survey_id):
+    """Stream live results of a survey as Server-Sent Events."""
+    if not broadcaster.enabled:
+        return jsonify({'error': 'Live results are disabled'}), 404
+    
+    survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first()
+    if not survey:
+        return jsonify({'error': 'Survey not found'}), 404
+    
+    response = Response(broadcaster.stream(survey_id), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @survey_bp.route('/<int:survey_id>/results', methods=['GET'])
+@read_only
 @login_required
 def get_results(survey_id):
     """Get results for a survey."""
     try:
         # Check if survey belongs to current user
-        survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first()
-        if not survey:
+        version = get_survey_version(survey_id, current_user.user_id)
+        if not version:
             return jsonify({'error': 'Survey not found'}), 404
         
-        # Get all options for this survey
-        options = SurveyOption.query.filter_by(survey_id=survey_id).all()
+        # The title and the response count are all that can change the results
+        etag = make_etag('results', survey_id, version.updated_at, version.response_count)
+        last_modified = max(version.updated_at, version.responses_updated_at or version.updated_at)
+        response = not_modified(etag, last_modified)
+        if response:
+            return response
         
-        # Count responses for each option
-        results = {}
-        total_responses = 0
+        survey = Survey.query.filter_by(survey_id=survey_id, user_id=current_user.user_id).first()
+        if not survey:
+            return jsonify({'error': 'Survey not found'}), 404
         
-        for option in options:
-            count = SurveyResponse.query.filter_by(option_id=option.option_id).count()
-            results[option.option_text] = count
-            total_responses += count
+        # Count responses for all options in a single query
+        survey_results = get_survey_results(survey_id, (version.updated_at, version.response_count))
         
-        return jsonify({
+        response = jsonify({
             'survey_title': survey.title,
-            'total_responses': total_responses,
-            'results': results
-        }), 200
+            'total_responses': survey_results['total_responses'],
+            'results': survey_results['results'],
+            'percentages': survey_results['percentages']
+        })
+        return set_validators(response, etag, last_modified), 200
     except Exception as e:
         current_app.logger.error(f"Error retrieving results: {str(e)}")
         return jsonify({'error': 'Failed to retrieve results'}), 500
\ No newline at end of file
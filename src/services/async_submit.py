@@ -0,0 +1,129 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Async submission of survey responses.
+
+Submitting a response only validates the survey and the option and
+inserts a row, so it spends its time waiting on the database. The
+:class:`AsyncSubmitter` runs that path on an async engine, which lets one
+process hold many in-flight submissions without a thread for each. It is
+served by the ASGI entry point in ``src/asgi.py``.
+"""
+import asyncio
+import contextlib
+from datetime import datetime
+
+from sqlalchemy import and_, select
+
+from src.database import make_async_engine
+from src.models.survey import Survey, SurveyOption, SurveyResponse
+from src.services.counters import apply_response_counts
+from src.services.ingest import ingestor, IngestQueueFull
+from src.signals import responses_recorded
+
+
+class SubmissionError(Exception):
+    """Raised when a response is rejected; carries the HTTP status code."""
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class AsyncSubmitter:
+    """Validate and store survey responses on an async engine."""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.engine = None
+        self._loop = None
+        self._write_lock = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Remember the application; the engine is created on first use."""
+        self.app = app
+        self.engine = None
+        self._loop = None
+        self._write_lock = None
+        app.extensions['async_submitter'] = self
+
+    async def submit(self, survey_id, option_id, respondent_email=None):
+        """Store one response.
+
+        Returns a tuple ``(status_code, body)``: 201 with the new response ID,
+        or 202 when responses are queued for the batched writer. Raises
+        SubmissionError for unknown surveys and options and a full queue.
+        """
+        engine = self._get_engine()
+        
+        async with engine.connect() as conn:
+            # One round trip checks both the survey and the option
+            row = (await conn.execute(
+                select(Survey.survey_id, SurveyOption.option_id).outerjoin(
+                    SurveyOption,
+                    and_(SurveyOption.survey_id == Survey.survey_id, SurveyOption.option_id == option_id)
+                ).where(Survey.survey_id == survey_id, Survey.is_active.is_(True))
+            )).first()
+            if row is None:
+                raise SubmissionError('Survey not found or inactive', 404)
+            if row.option_id is None:
+                raise SubmissionError('Invalid option for this survey', 400)
+            
+            if ingestor.enabled:
+                try:
+                    ingestor.submit(survey_id, option_id, respondent_email)
+                except IngestQueueFull:
+                    raise SubmissionError('Too many responses, please retry later', 503)
+                return 202, {'message': 'Response accepted'}
+            
+            # SQLite has a single writer; queueing here is cheaper than
+            # every connection spinning in the busy handler.
+            async with self._write_lock:
+                response_date = datetime.utcnow()
+                result = await conn.execute(SurveyResponse.__table__.insert().values(
+                    survey_id=survey_id,
+                    option_id=option_id,
+                    respondent_email=respondent_email,
+                    response_date=response_date
+                ))
+                response_id = result.inserted_primary_key[0]
+                option_counts = await conn.run_sync(
+                    lambda sync_conn: apply_response_counts(sync_conn.execute, survey_id, [(option_id, response_date)])
+                )
+                await conn.commit()
+        
+        responses_recorded.send(None, survey_id=survey_id, option_counts=option_counts)
+        return 201, {'message': 'Response submitted successfully', 'response_id': response_id}
+
+    async def dispose(self):
+        """Close the pooled connections."""
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+
+    def _get_engine(self):
+        """Return the engine of the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self.engine is None or self._loop is not loop:
+            self.engine = make_async_engine(self.app)
+            self._loop = loop
+            self._write_lock = asyncio.Lock() if self.engine.dialect.name == 'sqlite' else contextlib.nullcontext()
+        return self.engine
+
+
+async_submitter = AsyncSubmitter()
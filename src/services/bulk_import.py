@@ -0,0 +1,149 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bulk import of survey responses.
+
+Rows are parsed from the request stream one line at a time and inserted
+in chunks, so the size of an upload does not affect memory usage.
+"""
+import codecs
+import csv
+import json
+from datetime import datetime
+
+from src.extensions import db
+from src.models.survey import SurveyOption, SurveyResponse
+from src.services.counters import record_responses
+from src.services.rollups import parse_utc_timestamp
+
+FORMATS = {
+    'application/x-ndjson': 'ndjson',
+    'application/ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+    'text/csv': 'csv',
+}
+
+
+class BulkImportError(Exception):
+    """Raised for a single row that cannot be imported."""
+
+
+def detect_format(mimetype, requested=None):
+    """Return 'ndjson' or 'csv' for a request, or None if unsupported."""
+    if requested:
+        return requested if requested in ('ndjson', 'csv') else None
+    return FORMATS.get(mimetype)
+
+
+def iter_records(stream, fmt):
+    """Yield ``(row_number, record)`` pairs from a byte stream.
+
+    ``record`` is a dictionary, or a BulkImportError if the line could not
+    be parsed.
+    """
+    lines = codecs.iterdecode(stream, 'utf-8')
+    
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        for row_number, record in enumerate(reader, 1):
+            yield row_number, record
+        return
+    
+    for row_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row_number, BulkImportError(f"Invalid JSON: {str(e)}")
+            continue
+        if not isinstance(record, dict):
+            yield row_number, BulkImportError('Each line must be a JSON object')
+            continue
+        yield row_number, record
+
+
+def build_row(survey_id, record, option_ids):
+    """Validate a parsed record and convert it to a Survey_Responses row."""
+    try:
+        option_id = int(record.get('option_id'))
+    except (TypeError, ValueError):
+        raise BulkImportError('option_id is required and must be an integer')
+    if option_id not in option_ids:
+        raise BulkImportError(f"Invalid option {option_id} for this survey")
+    
+    response_date = record.get('response_date')
+    if response_date:
+        try:
+            response_date = parse_utc_timestamp(response_date)
+        except (TypeError, ValueError):
+            raise BulkImportError('response_date must be an ISO 8601 timestamp')
+    else:
+        response_date = datetime.utcnow()
+    
+    return {
+        'survey_id': survey_id,
+        'option_id': option_id,
+        'respondent_email': record.get('respondent_email') or record.get('email') or None,
+        'response_date': response_date
+    }
+
+
+def import_responses(survey_id, stream, fmt, chunk_size=5000, max_errors=1000):
+    """Import responses for a survey from an NDJSON or CSV byte stream.
+
+    Valid rows are inserted and committed in chunks of ``chunk_size``.
+    Returns a summary with the number of imported and rejected rows and
+    up to ``max_errors`` per-row error messages.
+    """
+    option_ids = {
+        option_id for (option_id,) in
+        db.session.query(SurveyOption.option_id).filter_by(survey_id=survey_id)
+    }
+    summary = {'imported': 0, 'rejected': 0, 'errors': [], 'aborted': None}
+    chunk = []
+    
+    def flush():
+        try:
+            db.session.execute(SurveyResponse.__table__.insert(), chunk)
+            record_responses(survey_id, [(row['option_id'], row['response_date']) for row in chunk])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        summary['imported'] += len(chunk)
+        chunk.clear()
+    
+    try:
+        for row_number, record in iter_records(stream, fmt):
+            try:
+                if isinstance(record, BulkImportError):
+                    raise record
+                chunk.append(build_row(survey_id, record, option_ids))
+            except BulkImportError as e:
+                summary['rejected'] += 1
+                if len(summary['errors']) < max_errors:
+                    summary['errors'].append({'row': row_number, 'error': str(e)})
+                continue
+            
+            if len(chunk) >= chunk_size:
+                flush()
+    except (UnicodeDecodeError, csv.Error) as e:
+        summary['aborted'] = f"Malformed upload: {str(e)}"
+    
+    if chunk:
+        flush()
+    
+    return summary
@@ -0,0 +1,171 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Caching primitives.
+
+A :class:`Cache` keeps hit and miss statistics on top of a pluggable
+:class:`CacheBackend`. The in-process :class:`MemoryCacheBackend` is a
+bounded LRU with a TTL; multi-worker deployments can plug in a shared
+backend by setting ``<NAME>_CACHE_BACKEND`` to the import path of another
+:class:`CacheBackend` subclass.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from werkzeug.utils import import_string
+
+
+class CacheBackend:
+    """Interface for cache backends.
+
+    Backends are constructed with ``max_size`` and ``ttl`` (seconds) keyword
+    arguments. Keys are strings; values must be serializable by the backend.
+    """
+
+    def __init__(self, max_size=1024, ttl=30):
+        self.max_size = max_size
+        self.ttl = ttl
+
+    def get(self, key):
+        """Return the cached value, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key, value):
+        """Store a value."""
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Remove a value if it is present."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove every value."""
+        raise NotImplementedError
+
+    def stats(self):
+        """Return backend specific statistics."""
+        return {}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Thread-safe in-process LRU cache with a per-entry TTL."""
+
+    def __init__(self, max_size=1024, ttl=30):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._data), 'max_size': self.max_size, 'evictions': self.evictions}
+
+
+class Cache:
+    """Named cache configured from ``<NAME>_CACHE_*`` settings."""
+
+    def __init__(self, name):
+        self.name = name
+        self.backend = MemoryCacheBackend()
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Create the backend from the application config."""
+        prefix = f"{self.name.upper()}_CACHE"
+        backend_class = app.config.get(f"{prefix}_BACKEND", MemoryCacheBackend)
+        if isinstance(backend_class, str):
+            backend_class = import_string(backend_class)
+        self.backend = backend_class(
+            max_size=app.config.get(f"{prefix}_SIZE", 1024),
+            ttl=app.config.get(f"{prefix}_TTL", 30)
+        )
+        self.enabled = app.config.get(f"{prefix}_ENABLED", True)
+        self.hits = 0
+        self.misses = 0
+        app.extensions.setdefault('caches', {})[self.name] = self
+
+    def key(self, key):
+        """Namespace a key so that caches can share one backend."""
+        return f"{self.name}:{key}"
+
+    def get_or_set(self, key, factory):
+        """Return the cached value for ``key``, computing it on a miss."""
+        if not self.enabled:
+            return factory()
+        value = self.backend.get(self.key(key))
+        if value is not None:
+            self._record_lookup(hit=True)
+            return value
+        self._record_lookup(hit=False)
+        value = factory()
+        self.backend.set(self.key(key), value)
+        return value
+
+    def _record_lookup(self, hit):
+        """Count a hit or a miss; lookups come from many request threads at once."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def delete(self, key):
+        """Invalidate the value for ``key``."""
+        self.backend.delete(self.key(key))
+
+    def stats(self):
+        """Return hit/miss statistics merged with the backend statistics."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        stats = {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / lookups, 4) if lookups else 0.0,
+        }
+        stats.update(self.backend.stats())
+        return stats
@@ -0,0 +1,172 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Materialized response counters.
+
+The counters and the time-bucketed rollups are maintained in the same
+transaction as the inserted responses, so reading survey results only
+touches one row per option.
+"""
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import and_, func
+
+from src.extensions import db
+from src.models.survey import SurveyOption, SurveyResponse, SurveyCounter, SurveyOptionCounter, SurveyResponseRollup
+from src.services.rollups import rollup_counts
+from src.signals import responses_recorded, send_after_commit
+
+
+def record_responses(survey_id, responses):
+    """Increment the counters and rollups for responses added to the current session.
+
+    ``responses`` is an iterable with one ``(option_id, response_date)``
+    pair per inserted response; a missing date means now. The caller is
+    responsible for committing the session.
+    """
+    option_counts = apply_response_counts(db.session.execute, survey_id, responses)
+    if option_counts:
+        send_after_commit(db.session, responses_recorded, survey_id=survey_id, option_counts=option_counts)
+
+
+def apply_response_counts(execute, survey_id, responses):
+    """Increment the counters and rollups through ``execute``.
+
+    ``execute`` is the ``execute`` method of a session or a connection, so
+    the same statements serve the ORM session and the async submit path.
+    Returns a dictionary mapping option IDs to the number of new responses.
+    """
+    responses = [
+        (int(option_id), response_date or datetime.utcnow())
+        for option_id, response_date in responses
+    ]
+    if not responses:
+        return {}
+    
+    option_counts = Counter(option_id for option_id, _ in responses)
+    for option_id, count in option_counts.items():
+        _increment(execute, SurveyOptionCounter, {'option_id': option_id}, count)
+    _increment(execute, SurveyCounter, {'survey_id': survey_id}, len(responses))
+    
+    for (option_id, granularity, start), count in rollup_counts(responses).items():
+        _increment(execute, SurveyResponseRollup, {
+            'option_id': option_id,
+            'granularity': granularity,
+            'bucket_start': start,
+            'survey_id': survey_id
+        }, count, key_columns=('option_id', 'granularity', 'bucket_start'))
+    
+    return dict(option_counts)
+
+
+def _increment(execute, model, values, count, key_columns=None):
+    """Add ``count`` to a counter row, creating the row if it does not exist.
+
+    ``values`` holds the column values of a new row; ``key_columns`` names
+    the columns that identify an existing one (all of them by default).
+    """
+    table = model.__table__
+    key_columns = key_columns or tuple(values)
+    result = execute(
+        table.update()
+        .where(and_(*(table.c[column] == values[column] for column in key_columns)))
+        .values(response_count=table.c.response_count + count)
+    )
+    if result.rowcount == 0:
+        execute(
+            table.insert().values(response_count=count, **values)
+        )
+
+
+def compute_counters(survey_id=None):
+    """Count responses from Survey_Responses.
+
+    Returns a tuple of dictionaries ``(survey_counts, option_counts)``.
+    """
+    survey_query = db.session.query(
+        SurveyResponse.survey_id, func.count(SurveyResponse.response_id)
+    ).group_by(SurveyResponse.survey_id)
+    option_query = db.session.query(
+        SurveyResponse.option_id, func.count(SurveyResponse.response_id)
+    ).group_by(SurveyResponse.option_id)
+    
+    if survey_id is not None:
+        survey_query = survey_query.filter(SurveyResponse.survey_id == survey_id)
+        option_query = option_query.filter(SurveyResponse.survey_id == survey_id)
+    
+    return dict(survey_query.all()), dict(option_query.all())
+
+
+def read_counters(survey_id=None):
+    """Read the stored counters.
+
+    Returns a tuple of dictionaries ``(survey_counts, option_counts)``.
+    """
+    survey_query = db.session.query(SurveyCounter.survey_id, SurveyCounter.response_count)
+    option_query = db.session.query(SurveyOptionCounter.option_id, SurveyOptionCounter.response_count)
+    
+    if survey_id is not None:
+        survey_query = survey_query.filter(SurveyCounter.survey_id == survey_id)
+        option_query = option_query.join(
+            SurveyOption, SurveyOption.option_id == SurveyOptionCounter.option_id
+        ).filter(SurveyOption.survey_id == survey_id)
+    
+    return dict(survey_query.all()), dict(option_query.all())
+
+
+def rebuild_counters(survey_id=None):
+    """Recompute the counters from Survey_Responses and commit them."""
+    survey_counts, option_counts = compute_counters(survey_id)
+    
+    if survey_id is None:
+        SurveyCounter.query.delete(synchronize_session=False)
+        SurveyOptionCounter.query.delete(synchronize_session=False)
+    else:
+        option_ids = db.session.query(SurveyOption.option_id).filter_by(survey_id=survey_id)
+        SurveyCounter.query.filter_by(survey_id=survey_id).delete(synchronize_session=False)
+        SurveyOptionCounter.query.filter(
+            SurveyOptionCounter.option_id.in_(option_ids.scalar_subquery())
+        ).delete(synchronize_session=False)
+    
+    if survey_counts:
+        db.session.execute(SurveyCounter.__table__.insert(), [
+            {'survey_id': key, 'response_count': count} for key, count in survey_counts.items()
+        ])
+    if option_counts:
+        db.session.execute(SurveyOptionCounter.__table__.insert(), [
+            {'option_id': key, 'response_count': count} for key, count in option_counts.items()
+        ])
+    db.session.commit()
+    
+    return survey_counts, option_counts
+
+
+def verify_counters(survey_id=None):
+    """Compare the stored counters against Survey_Responses.
+
+    Returns a list of ``(kind, key, stored, actual)`` tuples, one per mismatch.
+    """
+    actual_surveys, actual_options = compute_counters(survey_id)
+    stored_surveys, stored_options = read_counters(survey_id)
+    
+    mismatches = []
+    for kind, actual, stored in (('survey', actual_surveys, stored_surveys),
+                                 ('option', actual_options, stored_options)):
+        for key in sorted(set(actual) | set(stored)):
+            if actual.get(key, 0) != stored.get(key, 0):
+                mismatches.append((kind, key, stored.get(key, 0), actual.get(key, 0)))
+    
+    return mismatches
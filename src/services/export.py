@@ -0,0 +1,127 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming export of survey responses.
+
+Responses are read in keyset-ordered chunks on ``(response_date,
+response_id)``. Responses without a date come first, keyed on
+``response_id`` alone, because a NULL makes the tuple comparison NULL.
+They are left out when the export is limited to a time window. Every chunk is read in its own short transaction, so an
+export of any size keeps memory flat and never holds a lock that would
+block writers or WAL checkpoints for the duration of the download.
+"""
+import csv
+import io
+import json
+
+from sqlalchemy import tuple_
+
+from src.extensions import db
+from src.models.survey import SurveyOption, SurveyResponse
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+EXPORT_COLUMNS = ('response_id', 'survey_id', 'option_id', 'option_text', 'respondent_email', 'response_date')
+
+
+def iter_response_rows(survey_id, since=None, until=None, chunk_size=5000):
+    """Yield the responses of a survey as dictionaries, oldest first."""
+    option_texts = dict(
+        db.session.query(SurveyOption.option_id, SurveyOption.option_text).filter_by(survey_id=survey_id)
+    )
+    db.session.rollback()
+    
+    undated = since is None and until is None
+    last_key = None
+    while True:
+        query = db.session.query(
+            SurveyResponse.response_id,
+            SurveyResponse.option_id,
+            SurveyResponse.respondent_email,
+            SurveyResponse.response_date
+        ).filter(SurveyResponse.survey_id == survey_id)
+        
+        if undated:
+            query = query.filter(SurveyResponse.response_date.is_(None))
+            if last_key is not None:
+                query = query.filter(SurveyResponse.response_id > last_key[1])
+        else:
+            query = query.filter(SurveyResponse.response_date.isnot(None))
+            if since is not None:
+                query = query.filter(SurveyResponse.response_date >= since)
+            if until is not None:
+                query = query.filter(SurveyResponse.response_date < until)
+            if last_key is not None:
+                query = query.filter(
+                    tuple_(SurveyResponse.response_date, SurveyResponse.response_id) > tuple_(*last_key)
+                )
+        
+        rows = query.order_by(
+            SurveyResponse.response_date, SurveyResponse.response_id
+        ).limit(chunk_size).all()
+        # End the read transaction before handing rows to the client
+        db.session.rollback()
+        
+        for response_id, option_id, respondent_email, response_date in rows:
+            yield {
+                'response_id': response_id,
+                'survey_id': survey_id,
+                'option_id': option_id,
+                'option_text': option_texts.get(option_id),
+                'respondent_email': respondent_email,
+                'response_date': response_date.isoformat() if response_date else None
+            }
+        
+        if len(rows) < chunk_size:
+            if not undated:
+                return
+            undated = False
+            last_key = None
+            continue
+        last_key = (rows[-1].response_date, rows[-1].response_id)
+
+
+def iter_csv(rows, buffer_size=64 * 1024):
+    """Serialize rows as CSV in pieces of roughly ``buffer_size`` characters."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= buffer_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_ndjson(rows, buffer_size=64 * 1024):
+    """Serialize rows as NDJSON in pieces of roughly ``buffer_size`` characters."""
+    lines = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row) + '\n'
+        lines.append(line)
+        size += len(line)
+        if size >= buffer_size:
+            yield ''.join(lines)
+            lines = []
+            size = 0
+    if lines:
+        yield ''.join(lines)
@@ -0,0 +1,247 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Write-behind ingestion of survey responses.
+
+When ``RESPONSE_INGEST_MODE`` is ``'batched'``, validated responses are put
+on a bounded in-process queue and a background thread writes them in a
+single transaction every ``RESPONSE_INGEST_FLUSH_INTERVAL_MS`` milliseconds
+or every ``RESPONSE_INGEST_BATCH_SIZE`` rows, whichever comes first.
+
+Responses whose option was deleted after they were queued are dropped so
+that they cannot fail the rest of the batch, and a batch that hits a
+locked database is retried up to ``RESPONSE_INGEST_LOCK_RETRIES`` times.
+"""
+import atexit
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from src.extensions import db
+from src.models.survey import SurveyOption, SurveyResponse
+from src.services.counters import record_responses
+
+
+class IngestQueueFull(Exception):
+    """Raised when the ingestion queue cannot accept more responses."""
+
+
+class ResponseIngestor:
+    """Queue survey responses and write them to the database in batches."""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.enabled = False
+        self.batch_size = 500
+        self.flush_interval = 0.05
+        self.shutdown_timeout = 10.0
+        self.lock_retries = 10
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self.stats = {'queued': 0, 'written': 0, 'rejected': 0, 'dropped': 0, 'failed': 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the ingestor from the application config."""
+        self.app = app
+        self.enabled = app.config.get('RESPONSE_INGEST_MODE', 'sync') == 'batched'
+        self.batch_size = app.config.get('RESPONSE_INGEST_BATCH_SIZE', 500)
+        self.flush_interval = app.config.get('RESPONSE_INGEST_FLUSH_INTERVAL_MS', 50) / 1000
+        self.shutdown_timeout = app.config.get('RESPONSE_INGEST_SHUTDOWN_TIMEOUT', 10.0)
+        self.lock_retries = app.config.get('RESPONSE_INGEST_LOCK_RETRIES', 10)
+        self._queue = queue.Queue(maxsize=app.config.get('RESPONSE_INGEST_QUEUE_SIZE', 10000))
+        app.extensions['response_ingestor'] = self
+        if self.enabled:
+            atexit.register(self.shutdown)
+
+    def submit(self, survey_id, option_id, respondent_email=None):
+        """Queue a validated response.
+
+        Raises IngestQueueFull if the queue is at capacity.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait({
+                'survey_id': survey_id,
+                'option_id': int(option_id),
+                'respondent_email': respondent_email,
+                'response_date': datetime.utcnow()
+            })
+        except queue.Full:
+            self._count('rejected')
+            raise IngestQueueFull('Response ingestion queue is full')
+        self._count('queued')
+
+    def shutdown(self, timeout=None):
+        """Stop accepting work and write everything still queued."""
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            thread.join(self.shutdown_timeout if timeout is None else timeout)
+        else:
+            # The flusher never ran in this process; drain synchronously.
+            while True:
+                batch = self._collect(block=False)
+                if not batch:
+                    break
+                self._flush(batch)
+
+    def _ensure_started(self):
+        """Start the flusher thread, also after a fork of the worker process."""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name='response-ingestor', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        """Flusher loop."""
+        while True:
+            batch = self._collect()
+            if batch:
+                self._flush(batch)
+            elif self._stopping.is_set():
+                return
+
+    def _collect(self, block=True):
+        """Take up to ``batch_size`` responses from the queue.
+
+        Waits at most ``flush_interval`` seconds after the first response
+        of the batch has been taken.
+        """
+        batch = []
+        deadline = None
+        while len(batch) < self.batch_size:
+            try:
+                if not block:
+                    item = self._queue.get_nowait()
+                elif deadline is None:
+                    item = self._queue.get(timeout=self.flush_interval)
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+        return batch
+
+    def _flush(self, batch):
+        """Write a batch, retrying while the database is locked."""
+        pending = list(batch)
+        with self.app.app_context():
+            for attempt in range(self.lock_retries + 1):
+                try:
+                    self._write(pending)
+                    return
+                except OperationalError as e:
+                    db.session.rollback()
+                    if 'database is locked' not in str(e) or attempt == self.lock_retries:
+                        self._fail(pending, e)
+                        return
+                    self.app.logger.warning(f"Database locked while writing {len(pending)} queued responses, retrying")
+                    time.sleep(min(self.flush_interval * 2 ** attempt, 1.0))
+                except Exception as e:
+                    db.session.rollback()
+                    self._fail(pending, e)
+                    return
+
+    def _write(self, rows):
+        """Insert responses and update the counters in one transaction.
+
+        Rows are removed from ``rows`` once they have been written or
+        dropped, so a retry only writes what is left. If the batch still
+        violates a constraint, e.g. because an option was deleted after the
+        check, the rows are written one at a time so that only the
+        offending ones are dropped.
+        """
+        existing = self._existing(rows)
+        self._drop(len(rows) - len(existing))
+        rows[:] = existing
+        try:
+            self._insert(rows)
+            db.session.commit()
+            self._count('written', len(rows))
+            rows.clear()
+        except IntegrityError:
+            db.session.rollback()
+            while rows:
+                try:
+                    self._insert(rows[:1])
+                    db.session.commit()
+                    self._count('written')
+                except IntegrityError:
+                    db.session.rollback()
+                    self._drop(1)
+                rows.pop(0)
+
+    def _existing(self, rows):
+        """Return the rows whose option still exists in their survey."""
+        if not rows:
+            return []
+        option_ids = {row['option_id'] for row in rows}
+        existing = set(db.session.execute(
+            select(SurveyOption.option_id, SurveyOption.survey_id)
+            .where(SurveyOption.option_id.in_(option_ids))
+        ).all())
+        return [row for row in rows if (row['option_id'], row['survey_id']) in existing]
+
+    def _insert(self, rows):
+        """Add responses and their counter updates to the current session."""
+        if not rows:
+            return
+        db.session.execute(SurveyResponse.__table__.insert(), rows)
+        responses_by_survey = defaultdict(list)
+        for row in rows:
+            responses_by_survey[row['survey_id']].append((row['option_id'], row['response_date']))
+        for survey_id, responses in responses_by_survey.items():
+            record_responses(survey_id, responses)
+
+    def _count(self, name, amount=1):
+        """Increment a statistic; request threads and the flusher update them at once."""
+        with self._lock:
+            self.stats[name] += amount
+
+    def _drop(self, count):
+        """Count responses dropped because their survey or option was deleted."""
+        if count:
+            self._count('dropped', count)
+            self.app.logger.warning(f"Dropped {count} queued responses for deleted survey options")
+
+    def _fail(self, rows, e):
+        """Count responses that could not be written."""
+        self._count('failed', len(rows))
+        self.app.logger.error(f"Error writing {len(rows)} queued responses: {str(e)}")
+
+
+ingestor = ResponseIngestor()
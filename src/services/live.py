@@ -0,0 +1,200 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Live survey results for Server-Sent Events.
+
+One producer thread per watched survey reads the results and fans them out
+to every subscribed stream, so the number of viewers does not change the
+number of database queries. The producer wakes up immediately when a
+response is recorded in this process and otherwise polls the cheap
+per-survey counter every ``LIVE_RESULTS_POLL_INTERVAL`` seconds to pick up
+writes from other processes.
+
+Every open stream occupies a request thread for up to
+``LIVE_RESULTS_MAX_STREAM_SECONDS``, so streaming is only enabled with
+``LIVE_RESULTS_ENABLED`` on servers with threaded or async workers.
+"""
+import json
+import queue
+import threading
+import time
+
+from src.extensions import db
+from src.models.survey import SurveyCounter
+from src.services.results import compute_survey_results
+from src.signals import responses_recorded, survey_changed
+
+
+class _SurveyChannel:
+    """Subscribers and producer state of a single survey."""
+
+    def __init__(self):
+        self.subscribers = set()
+        self.wake = threading.Event()
+        self.snapshot = None
+        self.thread = None
+
+
+class LiveResultsBroadcaster:
+    """Fan out survey results from one producer to many SSE subscribers."""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.enabled = False
+        self.poll_interval = 1.0
+        self.keepalive = 15.0
+        self.max_stream_seconds = 300.0
+        self.queue_size = 16
+        self._channels = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the broadcaster from the application config."""
+        self.app = app
+        self.enabled = app.config.get('LIVE_RESULTS_ENABLED', False)
+        self.poll_interval = app.config.get('LIVE_RESULTS_POLL_INTERVAL', 1.0)
+        self.keepalive = app.config.get('LIVE_RESULTS_KEEPALIVE', 15.0)
+        self.max_stream_seconds = app.config.get('LIVE_RESULTS_MAX_STREAM_SECONDS', 300.0)
+        self.queue_size = app.config.get('LIVE_RESULTS_QUEUE_SIZE', 16)
+        app.extensions['live_results'] = self
+
+    def subscribe(self, survey_id):
+        """Register a subscriber queue for a survey and start its producer."""
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            channel = self._channels.setdefault(survey_id, _SurveyChannel())
+            channel.subscribers.add(subscriber)
+            if channel.snapshot is not None:
+                subscriber.put_nowait(channel.snapshot)
+            if channel.thread is None:
+                channel.thread = threading.Thread(
+                    target=self._produce, args=(survey_id, channel),
+                    name=f"live-results-{survey_id}", daemon=True
+                )
+                channel.thread.start()
+        return subscriber
+
+    def unsubscribe(self, survey_id, subscriber):
+        """Remove a subscriber; the producer stops with the last one."""
+        with self._lock:
+            channel = self._channels.get(survey_id)
+            if channel is not None:
+                channel.subscribers.discard(subscriber)
+                if not channel.subscribers:
+                    channel.wake.set()
+
+    def notify(self, survey_id):
+        """Wake the producer of a survey, if it has subscribers."""
+        channel = self._channels.get(survey_id)
+        if channel is not None:
+            channel.wake.set()
+
+    def stream(self, survey_id):
+        """Yield Server-Sent Events for a survey until the stream times out."""
+        subscriber = self.subscribe(survey_id)
+        deadline = time.monotonic() + self.max_stream_seconds
+        try:
+            yield f"retry: {int(self.poll_interval * 1000)}\n\n"
+            while time.monotonic() < deadline:
+                try:
+                    event = subscriber.get(timeout=self.keepalive)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+                    continue
+                yield f"event: results\ndata: {json.dumps(event)}\n\n"
+        finally:
+            self.unsubscribe(survey_id, subscriber)
+
+    def _produce(self, survey_id, channel):
+        """Producer loop of a survey."""
+        last_total = None
+        try:
+            with self.app.app_context():
+                while True:
+                    with self._lock:
+                        if not channel.subscribers:
+                            del self._channels[survey_id]
+                            return
+                    total = db.session.query(SurveyCounter.response_count).filter_by(
+                        survey_id=survey_id
+                    ).scalar() or 0
+                    if total != last_total or channel.wake.is_set():
+                        channel.wake.clear()
+                        results = compute_survey_results(survey_id)
+                        db.session.rollback()
+                        last_total = results['total_responses']
+                        self._publish(channel, results)
+                    else:
+                        db.session.rollback()
+                    channel.wake.wait(self.poll_interval)
+        except Exception as e:
+            self.app.logger.error(f"Error producing live results for survey {survey_id}: {str(e)}")
+            with self._lock:
+                if self._channels.get(survey_id) is channel:
+                    del self._channels[survey_id]
+
+    def _publish(self, channel, results):
+        """Send a results event with per-option deltas to every subscriber."""
+        previous = channel.snapshot
+        previous_counts = {
+            option['option_id']: option['count'] for option in previous['options']
+        } if previous else {}
+        
+        options = []
+        for option in results['options']:
+            option_text = option['option_text']
+            options.append({
+                'option_id': option['option_id'],
+                'option_text': option_text,
+                'count': results['results'][option_text],
+                'percentage': results['percentages'][option_text]
+            })
+        event = {
+            'total_responses': results['total_responses'],
+            'options': options,
+            'deltas': {
+                option['option_id']: option['count'] - previous_counts.get(option['option_id'], 0)
+                for option in options
+            }
+        }
+        
+        with self._lock:
+            channel.snapshot = event
+            subscribers = list(channel.subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # Events carry absolute counts, so a slow client only needs the latest one
+                try:
+                    subscriber.get_nowait()
+                except queue.Empty:
+                    pass
+                subscriber.put_nowait(event)
+
+
+broadcaster = LiveResultsBroadcaster()
+
+
+@responses_recorded.connect
+def _wake_on_responses(sender, survey_id, **kwargs):
+    broadcaster.notify(survey_id)
+
+
+@survey_changed.connect
+def _wake_on_survey_change(sender, survey_id, **kwargs):
+    broadcaster.notify(survey_id)
@@ -0,0 +1,182 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Per-endpoint request and SQL metrics.
+
+Flask request signals time every request, and SQLAlchemy cursor events
+count the statements issued while it runs and the time spent in them.
+Totals are kept per endpoint in the worker process and rendered in the
+Prometheus text format at ``/metrics``. With ``METRICS_SERVER_TIMING``
+each response also carries a ``Server-Timing`` header with its own
+request and SQL time.
+
+Recording costs two clock reads per statement and one lock acquisition
+per request, so it is enabled by default; set ``METRICS_ENABLED=0`` to
+turn it off.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from flask import g, has_request_context, request, request_started, request_finished
+from sqlalchemy import event
+
+from src.extensions import db
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _EndpointStats:
+    """Counters of a single endpoint."""
+
+    __slots__ = ('buckets', 'count', 'duration', 'queries', 'sql_time', 'statuses')
+
+    def __init__(self, bucket_count):
+        self.buckets = [0] * (bucket_count + 1)
+        self.count = 0
+        self.duration = 0.0
+        self.queries = 0
+        self.sql_time = 0.0
+        self.statuses = {}
+
+
+class RequestMetrics:
+    """Collect request latency, query counts and SQL time per endpoint."""
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.server_timing = False
+        self.buckets = DEFAULT_BUCKETS
+        self._endpoints = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the collector and attach it to the app's signals and engines."""
+        self.enabled = app.config.get('METRICS_ENABLED', True)
+        self.server_timing = app.config.get('METRICS_SERVER_TIMING', False)
+        self.buckets = tuple(sorted(app.config.get('METRICS_BUCKETS') or DEFAULT_BUCKETS))
+        self.reset()
+        app.extensions['request_metrics'] = self
+        if not self.enabled:
+            return
+        
+        request_started.connect(self._request_started, app)
+        request_finished.connect(self._request_finished, app)
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+            event.listen(engine, 'handle_error', _handle_error)
+
+    def reset(self):
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._endpoints = {}
+
+    def _request_started(self, sender, **extra):
+        g._request_metrics = [time.perf_counter(), 0, 0.0]
+
+    def _request_finished(self, sender, response, **extra):
+        state = g.pop('_request_metrics', None)
+        if state is None:
+            return
+        started, queries, sql_time = state
+        duration = time.perf_counter() - started
+        endpoint = request.endpoint or 'unmatched'
+        status = str(response.status_code)
+        
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = _EndpointStats(len(self.buckets))
+            stats.buckets[bisect_left(self.buckets, duration)] += 1
+            stats.count += 1
+            stats.duration += duration
+            stats.queries += queries
+            stats.sql_time += sql_time
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        
+        if self.server_timing:
+            response.headers['Server-Timing'] = (
+                f'app;dur={duration * 1000:.1f}, db;dur={sql_time * 1000:.1f};desc="{queries} queries"'
+            )
+
+    def render(self):
+        """Return the recorded metrics in the Prometheus text exposition format."""
+        with self._lock:
+            snapshot = [
+                (endpoint, list(stats.buckets), stats.count, stats.duration,
+                 stats.queries, stats.sql_time, dict(stats.statuses))
+                for endpoint, stats in sorted(self._endpoints.items())
+            ]
+        
+        lines = [
+            '# HELP survey_http_request_duration_seconds Time spent handling requests.',
+            '# TYPE survey_http_request_duration_seconds histogram',
+        ]
+        for endpoint, buckets, count, duration, _, _, _ in snapshot:
+            cumulative = 0
+            for bound, observed in zip(self.buckets, buckets):
+                cumulative += observed
+                lines.append(f'survey_http_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+            lines.append(f'survey_http_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {count}')
+            lines.append(f'survey_http_request_duration_seconds_sum{{endpoint="{endpoint}"}} {duration}')
+            lines.append(f'survey_http_request_duration_seconds_count{{endpoint="{endpoint}"}} {count}')
+        
+        lines.append('# HELP survey_http_requests_total Requests handled, by response status.')
+        lines.append('# TYPE survey_http_requests_total counter')
+        for endpoint, _, _, _, _, _, statuses in snapshot:
+            for status, count in sorted(statuses.items()):
+                lines.append(f'survey_http_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+        
+        lines.append('# HELP survey_db_queries_total SQL statements executed while handling requests.')
+        lines.append('# TYPE survey_db_queries_total counter')
+        for endpoint, _, _, _, queries, _, _ in snapshot:
+            lines.append(f'survey_db_queries_total{{endpoint="{endpoint}"}} {queries}')
+        
+        lines.append('# HELP survey_db_query_seconds_total Time spent executing SQL statements while handling requests.')
+        lines.append('# TYPE survey_db_query_seconds_total counter')
+        for endpoint, _, _, _, _, sql_time, _ in snapshot:
+            lines.append(f'survey_db_query_seconds_total{{endpoint="{endpoint}"}} {sql_time}')
+        
+        return '\n'.join(lines) + '\n'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('metrics_query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['metrics_query_start'].pop()
+    # Statements of background threads, such as the ingest writer, have no request
+    if has_request_context():
+        state = g.get('_request_metrics')
+        if state is not None:
+            state[1] += 1
+            state[2] += elapsed
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('metrics_query_start'):
+        connection.info['metrics_query_start'].pop()
+
+
+request_metrics = RequestMetrics()
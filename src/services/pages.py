@@ -0,0 +1,63 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cached rendering of the public respond page.
+
+The rendered form only changes when the owner edits the survey, so it is
+rendered once per survey and served from the cache until a
+``survey_changed`` signal invalidates it. Missing and inactive surveys
+are cached as negative entries.
+"""
+import hashlib
+
+from flask import render_template
+
+from src.models.survey import Survey, SurveyOption
+from src.services.cache import Cache
+from src.signals import survey_changed
+
+respond_page_cache = Cache('respond_page')
+
+
+def get_respond_page(survey_id):
+    """Return the rendered respond page of a survey.
+
+    The result is a dictionary with the HTTP ``status``, the HTML ``body``
+    and its ``etag``.
+    """
+    return respond_page_cache.get_or_set(survey_id, lambda: render_respond_page(survey_id))
+
+
+def render_respond_page(survey_id):
+    """Render the respond page, or the 404 page for missing and inactive surveys."""
+    survey = Survey.query.filter_by(survey_id=survey_id, is_active=True).first()
+    if survey is None:
+        status = 404
+        body = render_template('404.html')
+    else:
+        status = 200
+        options = SurveyOption.query.filter_by(survey_id=survey_id).order_by(SurveyOption.option_order).all()
+        body = render_template('respond_survey.html', survey=survey, options=options)
+    
+    return {
+        'status': status,
+        'body': body,
+        'etag': hashlib.sha1(body.encode()).hexdigest()
+    }
+
+
+@survey_changed.connect
+def _invalidate_on_survey_change(sender, survey_id, **kwargs):
+    respond_page_cache.delete(survey_id)
@@ -0,0 +1,113 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Password hashing on a bounded worker pool.
+
+Hashing is deliberately expensive, so a burst of logins or registrations
+could otherwise occupy every request thread and starve cheap requests
+such as vote submissions. Hashes are computed on a dedicated executor
+with ``PASSWORD_HASH_WORKERS`` threads; at most
+``PASSWORD_HASH_MAX_PENDING`` hashes may be running or waiting, and a
+request that cannot get a slot within ``PASSWORD_HASH_TIMEOUT`` seconds
+fails with :class:`PasswordHasherBusy`.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when no hashing slot becomes free within the timeout."""
+
+
+class PasswordHasher:
+    """Hash and verify passwords on a size-limited executor."""
+
+    def __init__(self, app=None):
+        self.method = DEFAULT_METHOD
+        self.workers = 2
+        self.max_pending = 16
+        self.timeout = 5.0
+        self._method_tag = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.stats = {'hashed': 0, 'verified': 0, 'rejected': 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the hasher from the application config."""
+        self.method = app.config.get('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', 2)
+        self.max_pending = app.config.get('PASSWORD_HASH_MAX_PENDING', 16)
+        self.timeout = app.config.get('PASSWORD_HASH_TIMEOUT', 5.0)
+        self._method_tag = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = None
+        app.extensions['password_hasher'] = self
+
+    def hash(self, password):
+        """Return a hash of ``password`` using the configured method."""
+        self._count('hashed')
+        return self._run(generate_password_hash, password, method=self.method)
+
+    def verify(self, pwhash, password):
+        """Return True if ``password`` matches ``pwhash``."""
+        self._count('verified')
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """Return True if ``pwhash`` was not made with the configured method and cost."""
+        if self._method_tag is None:
+            # Expand shorthands such as 'scrypt' to the parameters werkzeug records
+            self._method_tag = generate_password_hash('', method=self.method).split('$', 1)[0]
+        return pwhash.split('$', 1)[0] != self._method_tag
+
+    def _run(self, func, *args, **kwargs):
+        """Run ``func`` on the executor and wait for its result."""
+        if not self._slots.acquire(timeout=self.timeout):
+            self._count('rejected')
+            raise PasswordHasherBusy('Too many password hashes in progress')
+        try:
+            return self._get_executor().submit(func, *args, **kwargs).result()
+        finally:
+            self._slots.release()
+
+    def _count(self, name):
+        """Increment a statistic; hashes run on many request threads at once."""
+        with self._lock:
+            self.stats[name] += 1
+
+    def _get_executor(self):
+        """Return the executor, creating it again after a fork of the worker process."""
+        if self._executor is not None and self._pid == os.getpid():
+            return self._executor
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix='password-hasher'
+                )
+        return self._executor
+
+
+password_hasher = PasswordHasher()
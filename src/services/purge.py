@@ -0,0 +1,178 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Survey deletion.
+
+Child rows are removed by ``ON DELETE CASCADE`` in the database, so a
+survey with few responses is deleted with a single statement. Larger
+surveys, with more than ``SURVEY_PURGE_SYNC_LIMIT`` responses, are only
+marked as deleted, which hides them at once, and a background thread then
+removes their responses in transactions of ``SURVEY_PURGE_CHUNK_SIZE``
+rows, pausing ``SURVEY_PURGE_PAUSE_MS`` milliseconds between them so that
+response submissions are not locked out, before deleting the survey row.
+Purges that a restart interrupted are resumed when the application starts.
+"""
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from src.extensions import db
+from src.models.survey import Survey, SurveyResponse, SurveyResponseRollup, SurveyCounter
+from src.signals import survey_changed, send_after_commit
+
+
+def remove_survey(survey):
+    """Delete a survey, or mark it as deleted and purge it in the background.
+
+    Commits the session. Returns True if the purge was scheduled.
+    """
+    survey_id = survey.survey_id
+    response_count = db.session.query(SurveyCounter.response_count).filter_by(survey_id=survey_id).scalar() or 0
+    background = response_count > survey_purger.sync_limit
+    
+    if background:
+        survey.deleted_at = datetime.utcnow()
+        survey.is_active = False
+    else:
+        db.session.delete(survey)
+    send_after_commit(db.session, survey_changed, survey_id=survey_id)
+    db.session.commit()
+    
+    if background:
+        survey_purger.schedule(survey_id)
+    return background
+
+
+class SurveyPurger:
+    """Remove the rows of soft-deleted surveys in small transactions."""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.sync_limit = 10000
+        self.chunk_size = 1000
+        self.pause = 0.05
+        self._queue = queue.Queue()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.stats = {'purged_surveys': 0, 'purged_responses': 0, 'failed': 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the purger from the application config."""
+        self.app = app
+        self.sync_limit = app.config.get('SURVEY_PURGE_SYNC_LIMIT', 10000)
+        self.chunk_size = app.config.get('SURVEY_PURGE_CHUNK_SIZE', 1000)
+        self.pause = app.config.get('SURVEY_PURGE_PAUSE_MS', 50) / 1000
+        app.extensions['survey_purger'] = self
+
+    def schedule(self, survey_id):
+        """Purge a soft-deleted survey on the background thread."""
+        self._ensure_started()
+        self._queue.put(survey_id)
+
+    def resume(self):
+        """Schedule the surveys left marked as deleted, e.g. by a restart."""
+        with self.app.app_context():
+            try:
+                pending = self.pending_surveys()
+            except Exception as e:
+                self.app.logger.error(f"Error finding surveys to purge: {str(e)}")
+                return
+            finally:
+                db.session.remove()
+        for survey_id in pending:
+            self.schedule(survey_id)
+
+    def pending_surveys(self):
+        """Return the IDs of the surveys marked as deleted but not purged yet."""
+        return [
+            survey_id for (survey_id,) in db.session.query(Survey.survey_id).filter(
+                Survey.deleted_at.isnot(None)
+            ).execution_options(include_deleted=True)
+        ]
+
+    def purge(self, survey_id):
+        """Remove a soft-deleted survey and all of its rows.
+
+        Returns the number of responses deleted, or None if the survey is
+        not waiting to be purged. Must be called within an application context.
+        """
+        pending = db.session.query(Survey.survey_id).filter(
+            Survey.survey_id == survey_id, Survey.deleted_at.isnot(None)
+        ).execution_options(include_deleted=True).first()
+        if pending is None:
+            return None
+        
+        deleted = 0
+        rowid = db.literal_column('rowid')
+        for table in (SurveyResponse.__table__, SurveyResponseRollup.__table__):
+            while True:
+                chunk = db.select(rowid).select_from(table).where(table.c.survey_id == survey_id).limit(self.chunk_size)
+                removed = db.session.execute(table.delete().where(rowid.in_(chunk))).rowcount
+                db.session.commit()
+                if table is SurveyResponse.__table__:
+                    deleted += removed
+                if removed < self.chunk_size:
+                    break
+                time.sleep(self.pause)
+        
+        # Options, counters and anything left cascade from the survey row
+        db.session.execute(
+            Survey.__table__.delete().where(Survey.survey_id == survey_id, Survey.deleted_at.isnot(None))
+        )
+        db.session.commit()
+        return deleted
+
+    def _ensure_started(self):
+        """Start the purge thread, also after a fork of the worker process."""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, name='survey-purger', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Purge loop; also resumes purges interrupted by a restart."""
+        with self.app.app_context():
+            try:
+                resumed = set(self.pending_surveys())
+            finally:
+                db.session.remove()
+        for survey_id in resumed:
+            self._queue.put(survey_id)
+        
+        while True:
+            survey_id = self._queue.get()
+            with self.app.app_context():
+                try:
+                    deleted = self.purge(survey_id)
+                    if deleted is not None:
+                        self.stats['purged_responses'] += deleted
+                        self.stats['purged_surveys'] += 1
+                except Exception as e:
+                    db.session.rollback()
+                    self.stats['failed'] += 1
+                    self.app.logger.error(f"Error purging survey {survey_id}: {str(e)}")
+
+
+survey_purger = SurveyPurger()
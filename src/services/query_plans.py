@@ -0,0 +1,113 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Query plan verification for the hot queries of the application.
+"""
+from datetime import datetime
+
+from sqlalchemy import func, tuple_
+
+from src.extensions import db
+from src.models.survey import Survey, SurveyOption, SurveyResponse, SurveyCounter, SurveyOptionCounter, SurveyResponseRollup
+from src.models.user import User
+from src.services.surveys import SURVEY_COLUMNS
+
+
+def hot_queries():
+    """Return the queries issued on every request, keyed by a short name.
+
+    The statements mirror the ones used by the routes and services. The
+    bound values are placeholders; only the plan matters.
+    """
+    return {
+        'surveys_by_user': Survey.query.filter_by(user_id=1),
+        'survey_page_by_user': db.session.query(*SURVEY_COLUMNS).filter(
+            Survey.user_id == 1,
+            tuple_(Survey.created_at, Survey.survey_id) < tuple_(datetime(2000, 1, 1), 1)
+        ).order_by(Survey.created_at.desc(), Survey.survey_id.desc()).limit(21),
+        'survey_page_options': SurveyOption.query.filter(
+            SurveyOption.survey_id.in_([1, 2, 3])
+        ).order_by(SurveyOption.survey_id, SurveyOption.option_order),
+        'survey_by_owner': Survey.query.filter_by(survey_id=1, user_id=1),
+        'survey_version': db.session.query(
+            Survey.updated_at, SurveyCounter.response_count, SurveyCounter.updated_at
+        ).outerjoin(
+            SurveyCounter, SurveyCounter.survey_id == Survey.survey_id
+        ).filter(Survey.survey_id == 1, Survey.user_id == 1),
+        'survey_list_version': db.session.query(User.surveys_updated_at).filter(User.user_id == 1),
+        'active_survey': Survey.query.filter_by(survey_id=1, is_active=True),
+        'options_by_survey': SurveyOption.query.filter_by(survey_id=1).order_by(SurveyOption.option_order),
+        'option_in_survey': SurveyOption.query.filter_by(option_id=1, survey_id=1),
+        'results_by_survey': db.session.query(
+            SurveyOption, func.coalesce(SurveyOptionCounter.response_count, 0)
+        ).outerjoin(
+            SurveyOptionCounter, SurveyOptionCounter.option_id == SurveyOption.option_id
+        ).filter(
+            SurveyOption.survey_id == 1
+        ).order_by(SurveyOption.option_order),
+        'response_counts_by_survey': db.session.query(
+            SurveyResponse.option_id, func.count(SurveyResponse.response_id)
+        ).filter(
+            SurveyResponse.survey_id == 1
+        ).group_by(SurveyResponse.option_id),
+        'responses_by_date': SurveyResponse.query.filter(
+            SurveyResponse.survey_id == 1,
+            SurveyResponse.response_date >= datetime(2000, 1, 1)
+        ).order_by(SurveyResponse.response_date),
+        'export_chunk': db.session.query(
+            SurveyResponse.response_id, SurveyResponse.option_id,
+            SurveyResponse.respondent_email, SurveyResponse.response_date
+        ).filter(
+            SurveyResponse.survey_id == 1,
+            tuple_(SurveyResponse.response_date, SurveyResponse.response_id) > tuple_(datetime(2000, 1, 1), 1)
+        ).order_by(SurveyResponse.response_date, SurveyResponse.response_id).limit(5000),
+        'timeseries_by_survey': db.session.query(
+            SurveyResponseRollup.option_id, SurveyResponseRollup.bucket_start, SurveyResponseRollup.response_count
+        ).filter(
+            SurveyResponseRollup.survey_id == 1,
+            SurveyResponseRollup.granularity == 'hour',
+            SurveyResponseRollup.bucket_start >= datetime(2000, 1, 1),
+            SurveyResponseRollup.bucket_start < datetime(2000, 1, 3)
+        ),
+        'responses_by_option': SurveyResponse.query.filter_by(option_id=1),
+    }
+
+
+def explain_query_plan(query):
+    """Run EXPLAIN QUERY PLAN for a query and return the plan detail lines."""
+    connection = db.session.connection()
+    compiled = query.statement.compile(
+        dialect=connection.dialect, compile_kwargs={'literal_binds': True}
+    )
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+    return [row[-1] for row in rows]
+
+
+def is_full_scan(detail):
+    """Return True if a plan line scans a whole table without an index."""
+    return detail.startswith('SCAN ') and ' USING ' not in detail
+
+
+def check_query_plans():
+    """Explain every hot query.
+
+    Returns a dictionary mapping each query name to a tuple of
+    ``(plan_lines, full_scan_lines)``.
+    """
+    report = {}
+    for name, query in hot_queries().items():
+        plan = explain_query_plan(query)
+        report[name] = (plan, [detail for detail in plan if is_full_scan(detail)])
+    return report
@@ -0,0 +1,98 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Survey results aggregation service.
+"""
+from sqlalchemy import func
+
+from src.extensions import db
+from src.models.survey import SurveyOption, SurveyOptionCounter
+from src.services.cache import Cache
+from src.signals import responses_recorded, survey_changed
+
+results_cache = Cache('results')
+
+
+def get_survey_results(survey_id, version=None):
+    """Return the results of a survey, from the cache when possible.
+
+    ``version`` is a stamp of the survey read in the same request, such as
+    ``(updated_at, response_count)``. The results are then cached under it,
+    so they never lag behind validators built from the same stamp when
+    another process has recorded responses.
+    """
+    key = survey_id if version is None else ':'.join(str(part) for part in (survey_id, *version))
+    return results_cache.get_or_set(key, lambda: compute_survey_results(survey_id))
+
+
+def compute_survey_results(survey_id):
+    """Aggregate response counts for every option of a survey.
+
+    Counts are read from the materialized per-option counters with a
+    single query, so the cost depends on the number of options rather
+    than on the number of responses.
+    """
+    rows = db.session.query(
+        SurveyOption.option_id,
+        SurveyOption.option_text,
+        SurveyOption.option_order,
+        func.coalesce(SurveyOptionCounter.response_count, 0)
+    ).outerjoin(
+        SurveyOptionCounter, SurveyOptionCounter.option_id == SurveyOption.option_id
+    ).filter(
+        SurveyOption.survey_id == survey_id
+    ).order_by(
+        SurveyOption.option_order
+    ).all()
+
+    options = [
+        {'option_id': option_id, 'option_text': option_text, 'option_order': option_order}
+        for option_id, option_text, option_order, _ in rows
+    ]
+    return build_results(options, [row[3] for row in rows])
+
+
+def build_results(options, counts):
+    """Build the results dictionary from options and their response counts."""
+    results = {}
+    total_responses = 0
+
+    for option, count in zip(options, counts):
+        results[option['option_text']] = count
+        total_responses += count
+
+    percentages = {}
+    for option_text, count in results.items():
+        if total_responses > 0:
+            percentages[option_text] = round(count / total_responses * 100, 1)
+        else:
+            percentages[option_text] = 0.0
+
+    return {
+        'options': options,
+        'results': results,
+        'total_responses': total_responses,
+        'percentages': percentages
+    }
+
+
+@responses_recorded.connect
+def _invalidate_on_responses(sender, survey_id, **kwargs):
+    results_cache.delete(survey_id)
+
+
+@survey_changed.connect
+def _invalidate_on_survey_change(sender, survey_id, **kwargs):
+    results_cache.delete(survey_id)
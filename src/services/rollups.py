@@ -0,0 +1,156 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time-bucketed response rollups.
+
+Every response increments one hourly and one daily bucket of its option,
+so trend charts read at most one row per option and bucket instead of
+scanning Survey_Responses.
+"""
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, literal
+
+from src.extensions import db
+from src.models.survey import SurveyOption, SurveyResponse, SurveyResponseRollup
+
+GRANULARITIES = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+}
+
+# strftime patterns matching SQLAlchemy's SQLite DATETIME storage format
+_SQLITE_BUCKET_FORMATS = {
+    'hour': '%Y-%m-%d %H:00:00.000000',
+    'day': '%Y-%m-%d 00:00:00.000000',
+}
+
+
+def bucket_start(moment, granularity):
+    """Truncate a datetime to the start of its bucket."""
+    if granularity == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def parse_utc_timestamp(value):
+    """Parse an ISO 8601 timestamp into a naive UTC datetime, as stored in the database.
+
+    Timestamps without an offset are taken to be in UTC.
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def rollup_counts(responses):
+    """Count ``(option_id, response_date)`` pairs per rollup bucket.
+
+    Returns a Counter keyed by ``(option_id, granularity, bucket_start)``.
+    """
+    counts = Counter()
+    for option_id, response_date in responses:
+        for granularity in GRANULARITIES:
+            counts[(option_id, granularity, bucket_start(response_date, granularity))] += 1
+    return counts
+
+
+def backfill_rollups(survey_id=None):
+    """Rebuild the rollups from Survey_Responses and commit them.
+
+    Returns the number of rollup rows written.
+    """
+    delete_query = SurveyResponseRollup.query
+    if survey_id is not None:
+        delete_query = delete_query.filter_by(survey_id=survey_id)
+    delete_query.delete(synchronize_session=False)
+    
+    table = SurveyResponseRollup.__table__
+    written = 0
+    for granularity, bucket_format in _SQLITE_BUCKET_FORMATS.items():
+        bucket = func.strftime(bucket_format, SurveyResponse.response_date)
+        select = db.select(
+            SurveyResponse.option_id,
+            literal(granularity),
+            bucket,
+            SurveyResponse.survey_id,
+            func.count(SurveyResponse.response_id)
+        ).where(
+            SurveyResponse.response_date.isnot(None)
+        ).group_by(
+            SurveyResponse.option_id, bucket
+        )
+        if survey_id is not None:
+            select = select.where(SurveyResponse.survey_id == survey_id)
+        
+        result = db.session.execute(table.insert().from_select(
+            ['option_id', 'granularity', 'bucket_start', 'survey_id', 'response_count'], select
+        ))
+        written += result.rowcount
+    
+    db.session.commit()
+    return written
+
+
+def get_timeseries(survey_id, granularity, since, until):
+    """Return response counts per option and bucket between ``since`` and ``until``.
+
+    Reads only the rollup table. Buckets without responses are filled with
+    zeros so the series can be charted directly.
+    """
+    step = GRANULARITIES[granularity]
+    since = bucket_start(since, granularity)
+    
+    options = db.session.query(
+        SurveyOption.option_id, SurveyOption.option_text
+    ).filter_by(survey_id=survey_id).order_by(SurveyOption.option_order).all()
+    
+    rows = db.session.query(
+        SurveyResponseRollup.option_id,
+        SurveyResponseRollup.bucket_start,
+        SurveyResponseRollup.response_count
+    ).filter(
+        SurveyResponseRollup.survey_id == survey_id,
+        SurveyResponseRollup.granularity == granularity,
+        SurveyResponseRollup.bucket_start >= since,
+        SurveyResponseRollup.bucket_start < until
+    )
+    
+    counts = defaultdict(dict)
+    for option_id, start, count in rows:
+        counts[option_id][start] = count
+    
+    labels = []
+    moment = since
+    while moment < until:
+        labels.append(moment)
+        moment += step
+    
+    return {
+        'bucket': granularity,
+        'since': since.isoformat(),
+        'until': until.isoformat(),
+        'labels': [label.isoformat() for label in labels],
+        'datasets': [
+            {
+                'option_id': option_id,
+                'option_text': option_text,
+                'data': [counts[option_id].get(label, 0) for label in labels]
+            }
+            for option_id, option_text in options
+        ]
+    }
@@ -0,0 +1,235 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Slow-query log with EXPLAIN QUERY PLAN capture.
+
+Every statement that runs longer than ``SLOW_QUERY_THRESHOLD_MS`` is
+counted under its normalized SQL, with literals and ``IN`` lists replaced
+by placeholders. The first slow execution of a statement, and then at most
+one every ``SLOW_QUERY_LOG_INTERVAL`` seconds, is logged through the
+application logger with its parameters, the endpoint that issued it, its
+duration and its query plan, and appended to ``SLOW_QUERY_LOG_FILE`` with
+the number of slow executions since the previous entry. ``flask
+slow-queries top`` merges the entries written by every worker process.
+"""
+import atexit
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from flask import has_request_context, request
+from sqlalchemy import event
+
+from src.extensions import db
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAINABLE = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+MAX_PARAMETERS_LENGTH = 1000
+
+
+def normalize_sql(statement):
+    """Return ``statement`` with literals and placeholder lists collapsed."""
+    normalized = _WHITESPACE.sub(' ', statement).strip()
+    normalized = _STRING.sub('?', normalized)
+    normalized = _NUMBER.sub('?', normalized)
+    return _IN_LIST.sub('(?...)', normalized)
+
+
+class SlowQueryLog:
+    """Record statements slower than the configured threshold."""
+
+    def __init__(self, app=None):
+        self.threshold = None
+        self.log_interval = 60.0
+        self.explain = True
+        self.path = None
+        self.logger = None
+        self._statements = {}
+        self._lock = threading.Lock()
+        self._registered_exit = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the log and attach it to the app's engines."""
+        threshold_ms = app.config.get('SLOW_QUERY_THRESHOLD_MS', 200)
+        self.threshold = threshold_ms / 1000 if threshold_ms else None
+        self.log_interval = app.config.get('SLOW_QUERY_LOG_INTERVAL', 60.0)
+        self.explain = app.config.get('SLOW_QUERY_EXPLAIN', True)
+        self.path = app.config.get('SLOW_QUERY_LOG_FILE') or os.path.join(app.instance_path, 'slow_queries.jsonl')
+        self.logger = app.logger
+        app.extensions['slow_query_log'] = self
+        if self.threshold is None:
+            return
+        
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+            event.listen(engine, 'handle_error', _handle_error)
+        
+        if not self._registered_exit:
+            self._registered_exit = True
+            atexit.register(self.flush)
+
+    def observe(self, cursor, statement, parameters, executemany, elapsed):
+        """Count a slow statement and log it unless it was logged recently."""
+        sql = normalize_sql(statement)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._statements.get(sql)
+            if entry is None:
+                entry = self._statements[sql] = {'count': 0, 'total': 0.0, 'max': 0.0, 'logged_at': None}
+            entry['count'] += 1
+            entry['total'] += elapsed
+            entry['max'] = max(entry['max'], elapsed)
+            if entry['logged_at'] is not None and now - entry['logged_at'] < self.log_interval:
+                return
+            entry['logged_at'] = now
+            count, total, longest = entry['count'], entry['total'], entry['max']
+            entry.update(count=0, total=0.0, max=0.0)
+        
+        endpoint = _current_endpoint()
+        plan = self._explain(cursor, statement, parameters, executemany) if self.explain else []
+        params = repr(parameters[0] if executemany and parameters else parameters)[:MAX_PARAMETERS_LENGTH]
+        self.logger.warning(
+            f"Slow query ({elapsed * 1000:.1f} ms, {endpoint}): {_WHITESPACE.sub(' ', statement).strip()} "
+            f"parameters={params} plan={plan}"
+        )
+        self._write({
+            'time': datetime.utcnow().isoformat(),
+            'sql': sql,
+            'statement': statement,
+            'parameters': params,
+            'endpoint': endpoint,
+            'count': count,
+            'total_ms': total * 1000,
+            'max_ms': longest * 1000,
+            'plan': plan,
+        })
+
+    def flush(self):
+        """Write the slow executions that were counted but not logged yet."""
+        pending = []
+        with self._lock:
+            for sql, entry in self._statements.items():
+                if entry['count']:
+                    pending.append((sql, entry['count'], entry['total'], entry['max']))
+                    entry.update(count=0, total=0.0, max=0.0)
+        for sql, count, total, longest in pending:
+            self._write({
+                'time': datetime.utcnow().isoformat(),
+                'sql': sql,
+                'count': count,
+                'total_ms': total * 1000,
+                'max_ms': longest * 1000,
+            })
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['slow_query_start'].pop()
+        if elapsed >= self.threshold:
+            try:
+                self.observe(cursor, statement, parameters, executemany, elapsed)
+            except Exception as e:
+                self.logger.error(f"Error recording slow query: {str(e)}")
+
+    def _explain(self, cursor, statement, parameters, executemany):
+        """Return the EXPLAIN QUERY PLAN detail lines of a SQLite statement."""
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return []
+        connection = getattr(cursor, 'connection', None)
+        if not isinstance(connection, sqlite3.Connection):
+            return []
+        if executemany:
+            parameters = parameters[0] if parameters else ()
+        
+        explain_cursor = connection.cursor()
+        try:
+            rows = explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+        except Exception as e:
+            return [f"EXPLAIN failed: {str(e)}"]
+        finally:
+            explain_cursor.close()
+        return [row[-1] for row in rows]
+
+    def _write(self, record):
+        line = json.dumps(record, default=str) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+def read_slow_queries(path):
+    """Merge the entries of a slow-query log file by normalized SQL."""
+    merged = {}
+    if not os.path.exists(path):
+        return merged
+    
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            entry = merged.setdefault(record['sql'], {
+                'sql': record['sql'], 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                'endpoints': set(), 'statement': None, 'parameters': None, 'plan': None,
+            })
+            entry['count'] += record['count']
+            entry['total_ms'] += record['total_ms']
+            entry['max_ms'] = max(entry['max_ms'], record['max_ms'])
+            if record.get('endpoint'):
+                entry['endpoints'].add(record['endpoint'])
+            if record.get('statement'):
+                entry['statement'] = record['statement']
+                entry['parameters'] = record['parameters']
+                entry['plan'] = record['plan']
+    return merged
+
+
+def top_slow_queries(path, limit=10, sort='total'):
+    """Return the ``limit`` slowest statements, ordered by total, max or count."""
+    key = {'total': 'total_ms', 'max': 'max_ms', 'count': 'count'}[sort]
+    entries = sorted(read_slow_queries(path).values(), key=lambda entry: entry[key], reverse=True)
+    return entries[:limit]
+
+
+def _current_endpoint():
+    if has_request_context():
+        return request.endpoint or 'unmatched'
+    return f"thread:{threading.current_thread().name}"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('slow_query_start', []).append(time.perf_counter())
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('slow_query_start'):
+        connection.info['slow_query_start'].pop()
+
+
+slow_query_log = SlowQueryLog()
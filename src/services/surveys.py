@@ -0,0 +1,170 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Survey listing service.
+"""
+import base64
+import json
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import func, tuple_
+
+from src.extensions import db
+from src.models.survey import Survey, SurveyOption, SurveyCounter
+from src.models.user import User
+
+SURVEY_COLUMNS = (
+    Survey.survey_id,
+    Survey.title,
+    Survey.description,
+    Survey.is_active,
+    Survey.created_at,
+    Survey.updated_at
+)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(direction, created_at, survey_id):
+    """Encode a keyset position as an opaque URL-safe cursor."""
+    payload = json.dumps([direction, created_at.isoformat(), survey_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into ``(direction, created_at, survey_id)``."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        direction, created_at, survey_id = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in ('next', 'prev'):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(created_at), int(survey_id)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+def get_survey_page(user_id, limit, cursor=None):
+    """Return one page of a user's surveys, newest first.
+
+    Pages are addressed with keyset cursors on ``(created_at, survey_id)``,
+    so every page costs the same regardless of its position. Returns a tuple
+    ``(rows, next_cursor, prev_cursor)``; a cursor is None when there is no
+    page in that direction.
+    """
+    direction, created_at, survey_id = decode_cursor(cursor) if cursor else ('next', None, None)
+    key = tuple_(Survey.created_at, Survey.survey_id)
+    
+    query = db.session.query(*SURVEY_COLUMNS).filter(Survey.user_id == user_id)
+    if direction == 'next':
+        if created_at is not None:
+            query = query.filter(key < tuple_(created_at, survey_id))
+        query = query.order_by(Survey.created_at.desc(), Survey.survey_id.desc())
+    else:
+        query = query.filter(key > tuple_(created_at, survey_id))
+        query = query.order_by(Survey.created_at.asc(), Survey.survey_id.asc())
+    
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == 'prev':
+        rows.reverse()
+    
+    if not rows:
+        return [], None, None
+    
+    has_next = has_more if direction == 'next' else True
+    has_prev = cursor is not None if direction == 'next' else has_more
+    next_cursor = encode_cursor('next', rows[-1].created_at, rows[-1].survey_id) if has_next else None
+    prev_cursor = encode_cursor('prev', rows[0].created_at, rows[0].survey_id) if has_prev else None
+    
+    return rows, next_cursor, prev_cursor
+
+
+def list_survey_dicts(user_id, limit, cursor=None):
+    """Return one page of a user's surveys as dictionaries.
+
+    Produces the same structure as ``Survey.to_dict()`` from projected
+    columns, with two queries in total and without loading ORM objects.
+    Returns a tuple ``(surveys, next_cursor, prev_cursor)``.
+    """
+    surveys, next_cursor, prev_cursor = get_survey_page(user_id, limit, cursor)
+    if not surveys:
+        return [], next_cursor, prev_cursor
+    
+    options_by_survey = defaultdict(list)
+    option_rows = db.session.query(
+        SurveyOption.survey_id,
+        SurveyOption.option_id,
+        SurveyOption.option_text,
+        SurveyOption.option_order
+    ).filter(
+        SurveyOption.survey_id.in_([survey.survey_id for survey in surveys])
+    ).order_by(SurveyOption.survey_id, SurveyOption.option_order)
+    
+    for survey_id, option_id, option_text, option_order in option_rows:
+        options_by_survey[survey_id].append({
+            'option_id': option_id,
+            'option_text': option_text,
+            'option_order': option_order
+        })
+    
+    surveys = [
+        {
+            'survey_id': survey_id,
+            'title': title,
+            'description': description,
+            'is_active': is_active,
+            'created_at': created_at.isoformat(),
+            'updated_at': updated_at.isoformat(),
+            'options': options_by_survey[survey_id]
+        }
+        for survey_id, title, description, is_active, created_at, updated_at in surveys
+    ]
+    return surveys, next_cursor, prev_cursor
+
+
+
+def get_survey_version(survey_id, user_id):
+    """Return the version stamp of one of a user's surveys.
+
+    The stamp is a row ``(updated_at, response_count, responses_updated_at)``
+    read from the survey and its counter with primary key lookups, so it is
+    far cheaper than building the survey or its results. Returns None when
+    the survey does not exist or belongs to another user.
+    """
+    return db.session.query(
+        Survey.updated_at,
+        func.coalesce(SurveyCounter.response_count, 0).label('response_count'),
+        SurveyCounter.updated_at.label('responses_updated_at')
+    ).outerjoin(
+        SurveyCounter, SurveyCounter.survey_id == Survey.survey_id
+    ).filter(
+        Survey.survey_id == survey_id,
+        Survey.user_id == user_id
+    ).first()
+
+
+def get_survey_list_version(user_id):
+    """Return the version stamp of a user's survey list.
+
+    The stamp is the user's ``surveys_updated_at``, which is set in the
+    same transaction as every created, edited or deleted survey, so reading
+    it is a single primary key lookup however many surveys the user has.
+    None means the list has not changed since the stamp was introduced.
+    """
+    return db.session.query(User.surveys_updated_at).filter(User.user_id == user_id).scalar()
\ No newline at end of file
@@ -0,0 +1,76 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Cached user loading for Flask-Login.
+
+Every authenticated request loads its user. The cache keeps the user's
+column values rather than ORM instances, and each request merges them
+into its own session without a query, so instances never leak across
+sessions or threads. Entries expire after a short TTL and are dropped
+when a ``user_changed`` signal reports a profile change.
+
+The password hash is never cached, since the backend may be a shared
+store. It is loaded from the database when it is first accessed, which
+only the login and password change paths do.
+"""
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.extensions import db, login_manager
+from src.models.user import User
+from src.services.cache import Cache
+from src.signals import user_changed
+
+user_cache = Cache('user')
+
+UNCACHED_COLUMNS = ('password_hash',)
+
+
+@login_manager.user_loader
+def load_user(user_id):
+    """User loader for Flask-Login."""
+    row = user_cache.get_or_set(int(user_id), lambda: read_user_row(int(user_id)))
+    if not row:
+        return None
+    return attach_user(row)
+
+
+def read_user_row(user_id):
+    """Read a user's column values, or an empty dictionary for unknown users."""
+    user = db.session.get(User, user_id)
+    if user is None:
+        return {}
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__mapper__.column_attrs
+        if column.key not in UNCACHED_COLUMNS
+    }
+
+
+def attach_user(row):
+    """Build a ``User`` from cached column values and merge it into the current session.
+
+    Columns missing from ``row`` are left expired and load on first access.
+    """
+    user = User.__mapper__.class_manager.new_instance()
+    for key, value in row.items():
+        setattr(user, key, value)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+
+@user_changed.connect
+def _invalidate_on_user_change(sender, user_id, **kwargs):
+    user_cache.delete(user_id)
@@ -0,0 +1,47 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Session routing between the primary and the read-only database engine.
+"""
+from functools import wraps
+
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+
+READ_BIND_KEY = 'read'
+
+
+class RoutingSession(Session):
+    """Session that sends reads of read-only requests to the read engine.
+
+    Flushes, and every request not marked with :func:`read_only`, always
+    use the primary engine.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context() and g.get('use_read_engine'):
+            engine = self._db.engines.get(READ_BIND_KEY)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def read_only(view):
+    """Route the queries of a view to the read-only engine, if configured."""
+    @wraps(view)
+    def decorated_view(*args, **kwargs):
+        g.use_read_engine = True
+        return view(*args, **kwargs)
+    return decorated_view
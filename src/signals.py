@@ -0,0 +1,55 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Application signals.
+
+Signals are sent only after the transaction that caused them has been
+committed, so subscribers never observe data that may still be rolled
+back.
+"""
+from blinker import Namespace
+from sqlalchemy import event
+
+from src.session import RoutingSession
+
+_signals = Namespace()
+
+# Sent with ``survey_id`` and ``option_counts`` (option ID -> number of new responses)
+responses_recorded = _signals.signal('responses-recorded')
+
+# Sent with ``survey_id`` when a survey is created, edited, toggled or deleted
+survey_changed = _signals.signal('survey-changed')
+
+# Sent with ``user_id`` when a user's alias, password or last login changes
+user_changed = _signals.signal('user-changed')
+
+_PENDING_KEY = 'pending_signals'
+
+
+def send_after_commit(session, signal, **kwargs):
+    """Send ``signal`` once the current transaction of ``session`` commits."""
+    session.info.setdefault(_PENDING_KEY, []).append((signal, kwargs))
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _send_pending_signals(session):
+    pending = session.info.pop(_PENDING_KEY, [])
+    for signal, kwargs in pending:
+        signal.send(None, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _discard_pending_signals(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,94 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Shared fixtures for the test suite.
+"""
+import os
+
+import click
+import pytest
+
+os.environ.setdefault('APP_SETTINGS', 'config.TestingConfig')
+
+from app import create_app  # noqa: E402
+
+
+@pytest.fixture
+def app_config():
+    """Settings applied on top of the test configuration; parametrize to change them."""
+    return {}
+
+
+@pytest.fixture
+def app(tmp_path, app_config):
+    """Application bound to a fresh SQLite file, with the in-process caches off."""
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'SCHEMA_STARTUP_MODE': 'create',
+        'JINJA_BYTECODE_CACHE': False,
+        'SLOW_QUERY_LOG_FILE': str(tmp_path / 'slow_queries.jsonl'),
+        'RESULTS_CACHE_ENABLED': False,
+        'RESPOND_PAGE_CACHE_ENABLED': False,
+        'USER_CACHE_ENABLED': False,
+        **app_config,
+    })
+    yield app
+
+
+@pytest.fixture
+def migrated_app(tmp_path):
+    """Application whose database is left empty, to be built by the migrations."""
+    # Like the flask CLI, so that the schema check only warns
+    with click.Context(click.Command('db')):
+        app = create_app({
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+            'SCHEMA_STARTUP_MODE': 'check',
+            'JINJA_BYTECODE_CACHE': False,
+            'SLOW_QUERY_LOG_FILE': str(tmp_path / 'slow_queries.jsonl'),
+        })
+    yield app
+
+
+def upgrade(app, revision='head'):
+    """Run the migrations up to ``revision``."""
+    from flask_migrate import upgrade as flask_migrate_upgrade
+    with app.app_context():
+        flask_migrate_upgrade(directory=os.path.join(app.root_path, 'migrations'), revision=revision)
+
+
+@pytest.fixture
+def client(app):
+    """Test client logged in as a registered user."""
+    client = app.test_client()
+    client.post('/auth/register', data={
+        'email': 'owner@example.com', 'alias': 'Owner', 'password': 'password', 'confirm_password': 'password'
+    })
+    client.post('/auth/login', data={'email': 'owner@example.com', 'password': 'password'})
+    return client
+
+
+def create_survey(client, options, responses=0):
+    """Create a survey through the API and submit ``responses`` responses to it."""
+    survey = client.post('/api/surveys/', json={
+        'title': 'Survey', 'options': [f"Option {i}" for i in range(1, options + 1)]
+    }).get_json()['survey']
+    for i in range(responses):
+        option_id = survey['options'][i % options]['option_id']
+        response = client.post(f"/api/surveys/{survey['survey_id']}/respond", json={'option_id': option_id})
+        assert response.status_code == 201, response.get_data(as_text=True)
+    return survey
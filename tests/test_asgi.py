@@ -0,0 +1,88 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the ASGI entry point.
+"""
+import asyncio
+
+import pytest
+
+from src.asgi import create_asgi_app
+from tests.conftest import create_survey
+
+
+async def request(asgi_app, path, headers=(), first_chunk=None):
+    """Send a GET request to ``asgi_app`` and return its status and body."""
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+        'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+        'headers': list(headers), 'client': ('127.0.0.1', 50000), 'server': ('localhost', 80),
+    }
+    requested = False
+    disconnected = asyncio.Event()
+    messages = []
+    
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+    
+    async def send(message):
+        messages.append(message)
+        if first_chunk is not None and message.get('body'):
+            first_chunk.set()
+    
+    try:
+        await asgi_app(scope, receive, send)
+    finally:
+        disconnected.set()
+    status = messages[0]['status']
+    body = b''.join(message.get('body', b'') for message in messages[1:])
+    return status, body
+
+
+@pytest.mark.parametrize('app_config', [{
+    'LIVE_RESULTS_ENABLED': True, 'LIVE_RESULTS_MAX_STREAM_SECONDS': 2, 'LIVE_RESULTS_KEEPALIVE': 0.2
+}])
+def test_flask_routes_respond_while_a_stream_is_open(app, client):
+    survey = create_survey(client, 2, 1)
+    cookie = client.get_cookie('session')
+    asgi_app = create_asgi_app(app)
+    
+    async def scenario():
+        streaming = asyncio.Event()
+        stream = asyncio.create_task(request(
+            asgi_app, f"/api/surveys/{survey['survey_id']}/results/stream",
+            headers=[(b'cookie', f'session={cookie.value}'.encode())], first_chunk=streaming
+        ))
+        await asyncio.wait_for(streaming.wait(), 5)
+        assert not stream.done()
+        
+        status, _ = await asyncio.wait_for(request(asgi_app, '/'), 1)
+        assert status == 200
+        assert not stream.done()
+        
+        status, body = await stream
+        assert status == 200
+        assert b'event: results' in body
+    
+    try:
+        asyncio.run(scenario())
+    finally:
+        asgi_app.wsgi.shutdown()
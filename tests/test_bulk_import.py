@@ -0,0 +1,40 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the bulk response import API.
+"""
+import json
+
+import pytest
+
+from tests.conftest import create_survey
+
+
+@pytest.mark.parametrize('response_date', ['2025-01-01T00:30:00', '2025-01-01T00:30:00Z', '2025-01-01T09:30:00+09:00'])
+def test_import_stores_response_dates_in_utc(client, response_date):
+    survey = create_survey(client, 2)
+    option_id = survey['options'][0]['option_id']
+    body = json.dumps({'option_id': option_id, 'response_date': response_date}) + '\n'
+    response = client.post(f"/api/surveys/{survey['survey_id']}/responses:bulk",
+                           data=body, content_type='application/x-ndjson')
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json()['imported'] == 1
+    
+    timeseries = client.get(f"/api/surveys/{survey['survey_id']}/timeseries", query_string={
+        'bucket': 'hour', 'since': '2025-01-01T00:00:00Z', 'until': '2025-01-01T02:00:00Z'
+    }).get_json()
+    assert timeseries['labels'] == ['2025-01-01T00:00:00', '2025-01-01T01:00:00']
+    assert [dataset['data'] for dataset in timeseries['datasets']] == [[1, 0], [0, 0]]
@@ -0,0 +1,39 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the cache statistics.
+"""
+import threading
+
+from src.services.cache import Cache
+
+
+def test_statistics_count_every_lookup_from_many_threads(app):
+    cache = Cache('test')
+    cache.init_app(app)
+    
+    def lookups():
+        for i in range(2000):
+            cache.get_or_set(i % 10, lambda: i)
+    
+    threads = [threading.Thread(target=lookups) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 8 * 2000
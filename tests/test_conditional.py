@@ -0,0 +1,72 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the conditional requests of the survey API.
+"""
+import pytest
+
+from src.extensions import db
+from src.models.survey import SurveyResponse
+from src.services.counters import apply_response_counts
+from tests.conftest import create_survey
+
+
+def record_response_elsewhere(app, survey_id, option_id):
+    """Store a response like another worker process would, without invalidating this one's caches."""
+    with app.app_context():
+        db.session.add(SurveyResponse(survey_id=survey_id, option_id=option_id))
+        apply_response_counts(db.session.execute, survey_id, [(option_id, None)])
+        db.session.commit()
+
+
+@pytest.mark.parametrize('app_config', [{'RESULTS_CACHE_ENABLED': True}])
+def test_results_etag_matches_body_after_writes_in_another_process(app, client):
+    survey = create_survey(client, 2, 1)
+    url = f"/api/surveys/{survey['survey_id']}/results"
+    first = client.get(url)
+    assert first.get_json()['total_responses'] == 1
+    
+    record_response_elsewhere(app, survey['survey_id'], survey['options'][0]['option_id'])
+    
+    second = client.get(url, headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert second.get_json()['total_responses'] == 2
+    
+    third = client.get(url, headers={'If-None-Match': second.headers['ETag']})
+    assert third.status_code == 304
+
+
+def test_survey_list_etag_changes_on_create_edit_and_delete(client):
+    url = '/api/surveys/'
+    etag = client.get(url).headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+    
+    survey = create_survey(client, 2)
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    
+    client.put(f"/api/surveys/{survey['survey_id']}", json={'title': 'Renamed'})
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['surveys'][0]['title'] == 'Renamed'
+    etag = response.headers['ETag']
+    
+    client.delete(f"/api/surveys/{survey['survey_id']}")
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['surveys'] == []
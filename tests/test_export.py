@@ -0,0 +1,71 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the response export API.
+"""
+import json
+
+import pytest
+from sqlalchemy import text
+
+from src.extensions import db
+from tests.conftest import create_survey
+
+
+def insert_responses(app, survey, dates):
+    """Insert one response per date, as stored: naive UTC or NULL."""
+    option_id = survey['options'][0]['option_id']
+    with app.app_context():
+        for date in dates:
+            db.session.execute(text(
+                "INSERT INTO \"Survey_Responses\" (survey_id, option_id, response_date) "
+                "VALUES (:survey_id, :option_id, :date)"
+            ), {'survey_id': survey['survey_id'], 'option_id': option_id, 'date': date})
+        db.session.commit()
+
+
+def export(client, survey, **params):
+    response = client.get(f"/api/surveys/{survey['survey_id']}/responses/export",
+                          query_string={'format': 'ndjson', **params})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+@pytest.mark.parametrize('since', ['2024-12-31T15:00:00', '2024-12-31T15:00:00Z', '2025-01-01T00:00:00+09:00'])
+def test_export_window_is_in_utc(app, client, since):
+    survey = create_survey(client, 2)
+    insert_responses(app, survey, ['2024-12-31 14:30:00.000000', '2024-12-31 15:30:00.000000'])
+    rows = export(client, survey, since=since)
+    assert [row['response_date'] for row in rows] == ['2024-12-31T15:30:00']
+
+
+def test_export_rejects_invalid_timestamps(client):
+    survey = create_survey(client, 2)
+    response = client.get(f"/api/surveys/{survey['survey_id']}/responses/export", query_string={'since': 'yesterday'})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('app_config', [{'EXPORT_CHUNK_SIZE': 2}])
+def test_export_includes_responses_without_a_date(app, client):
+    survey = create_survey(client, 2)
+    insert_responses(app, survey, [
+        '2025-01-01 10:00:00.000000', None, '2025-01-01 09:00:00.000000', None, None, '2025-01-01 11:00:00.000000'
+    ])
+    rows = export(client, survey)
+    assert [row['response_date'] for row in rows] == [
+        None, None, None, '2025-01-01T09:00:00', '2025-01-01T10:00:00', '2025-01-01T11:00:00'
+    ]
+    assert [row['response_id'] for row in rows[:3]] == [2, 4, 5]
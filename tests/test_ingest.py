@@ -0,0 +1,93 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the batched response ingestor.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.services.ingest import ingestor
+from src.services.results import compute_survey_results
+from tests.conftest import create_survey
+
+pytestmark = pytest.mark.parametrize('app_config', [{'RESPONSE_INGEST_MODE': 'batched'}])
+
+
+@pytest.fixture(autouse=True)
+def stats(monkeypatch):
+    """Count the ingestor statistics from zero in each test."""
+    monkeypatch.setattr(ingestor, 'stats', dict.fromkeys(ingestor.stats, 0))
+
+
+def queued(survey, option_ids):
+    """Rows as :meth:`ResponseIngestor.submit` queues them."""
+    return [{
+        'survey_id': survey['survey_id'], 'option_id': option_id,
+        'respondent_email': None, 'response_date': datetime.utcnow()
+    } for option_id in option_ids]
+
+
+def results(app, survey):
+    with app.app_context():
+        return compute_survey_results(survey['survey_id'])
+
+
+def test_responses_for_deleted_options_do_not_fail_the_batch(app, client):
+    survey = create_survey(client, 2)
+    yes, no = (option['option_id'] for option in survey['options'])
+    
+    ingestor._flush(queued(survey, [yes, 9999, no, yes]))
+    
+    assert results(app, survey)['results'] == {'Option 1': 2, 'Option 2': 1}
+    assert ingestor.stats['written'] == 3
+    assert ingestor.stats['dropped'] == 1
+    assert ingestor.stats['failed'] == 0
+
+
+def test_constraint_violation_falls_back_to_single_rows(app, client, monkeypatch):
+    survey = create_survey(client, 2)
+    yes, no = (option['option_id'] for option in survey['options'])
+    monkeypatch.setattr(ingestor, '_existing', lambda rows: list(rows))
+    
+    ingestor._flush(queued(survey, [yes, 9999, no]))
+    
+    assert results(app, survey)['results'] == {'Option 1': 1, 'Option 2': 1}
+    assert ingestor.stats['written'] == 2
+    assert ingestor.stats['dropped'] == 1
+
+
+def test_locked_database_is_retried(app, client, monkeypatch):
+    survey = create_survey(client, 2)
+    yes, no = (option['option_id'] for option in survey['options'])
+    insert = ingestor._insert
+    attempts = []
+    
+    def locked_once(rows):
+        attempts.append(len(rows))
+        if len(attempts) == 1:
+            raise OperationalError('INSERT', {}, Exception('database is locked'))
+        insert(rows)
+    
+    monkeypatch.setattr(ingestor, '_insert', locked_once)
+    
+    ingestor._flush(queued(survey, [yes, no]))
+    
+    assert attempts == [2, 2]
+    assert results(app, survey)['results'] == {'Option 1': 1, 'Option 2': 1}
+    assert ingestor.stats['written'] == 2
+    assert ingestor.stats['failed'] == 0
@@ -0,0 +1,43 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the opt-in live results stream.
+"""
+import pytest
+
+from tests.conftest import create_survey
+
+
+def test_live_results_are_disabled_by_default(client):
+    survey = create_survey(client, 2, 1)
+    page = client.get(f"/surveys/{survey['survey_id']}").get_data(as_text=True)
+    assert 'EventSource' not in page
+    assert 'resultsChart' in page
+    assert client.get(f"/api/surveys/{survey['survey_id']}/results/stream").status_code == 404
+
+
+@pytest.mark.parametrize('app_config', [{
+    'LIVE_RESULTS_ENABLED': True, 'LIVE_RESULTS_MAX_STREAM_SECONDS': 1, 'LIVE_RESULTS_KEEPALIVE': 0.2
+}])
+def test_live_results_stream_when_enabled(client):
+    survey = create_survey(client, 2, 1)
+    page = client.get(f"/surveys/{survey['survey_id']}").get_data(as_text=True)
+    assert 'EventSource' in page
+    
+    response = client.get(f"/api/surveys/{survey['survey_id']}/results/stream")
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    assert 'event: results' in response.get_data(as_text=True)
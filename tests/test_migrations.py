@@ -0,0 +1,158 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the data migrations.
+"""
+import os
+import sqlite3
+from datetime import datetime
+
+from click.testing import CliRunner
+from flask.cli import FlaskGroup
+from sqlalchemy import text
+
+from src.database import head_revision
+from src.extensions import db
+from src.services.results import compute_survey_results
+from src.services.rollups import get_timeseries
+from app import create_app
+from tests.conftest import upgrade
+
+# The tables of data/customer-feedback.sql before the migrations were added
+ORIGINAL_SCHEMA = """
+CREATE TABLE Users (
+    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT UNIQUE NOT NULL,
+    alias TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_login TIMESTAMP
+);
+
+CREATE TABLE Surveys (
+    survey_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE
+);
+
+CREATE TABLE Survey_Options (
+    option_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    survey_id INTEGER NOT NULL,
+    option_text TEXT NOT NULL,
+    option_order INTEGER NOT NULL,
+    FOREIGN KEY (survey_id) REFERENCES Surveys(survey_id) ON DELETE CASCADE,
+    CONSTRAINT check_option_order CHECK (option_order BETWEEN 1 AND 5)
+);
+
+CREATE TABLE Survey_Responses (
+    response_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    survey_id INTEGER NOT NULL,
+    option_id INTEGER NOT NULL,
+    respondent_email TEXT,
+    response_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (survey_id) REFERENCES Surveys(survey_id) ON DELETE CASCADE,
+    FOREIGN KEY (option_id) REFERENCES Survey_Options(option_id) ON DELETE CASCADE
+);
+"""
+
+
+def insert_responses(app, count):
+    """Insert a survey with two options and ``count`` responses, bypassing the counters."""
+    with app.app_context():
+        db.session.execute(text(
+            "INSERT INTO \"Users\" (user_id, email, alias, password_hash) VALUES (1, 'a@example.com', 'A', 'x')"
+        ))
+        db.session.execute(text(
+            "INSERT INTO \"Surveys\" (survey_id, user_id, title, is_active) VALUES (1, 1, 'Survey', 1)"
+        ))
+        db.session.execute(text(
+            "INSERT INTO \"Survey_Options\" (option_id, survey_id, option_text, option_order) "
+            "VALUES (1, 1, 'Yes', 1), (2, 1, 'No', 2)"
+        ))
+        for i in range(count):
+            db.session.execute(text(
+                "INSERT INTO \"Survey_Responses\" (survey_id, option_id, response_date) "
+                "VALUES (1, :option_id, '2026-01-01 10:30:00.000000')"
+            ), {'option_id': 1 + i % 2})
+        db.session.commit()
+
+
+def test_upgrade_fills_counters_from_existing_responses(migrated_app):
+    upgrade(migrated_app, '0006')
+    insert_responses(migrated_app, 7)
+    upgrade(migrated_app)
+    
+    with migrated_app.app_context():
+        results = compute_survey_results(1)
+    assert results['total_responses'] == 7
+    assert results['results'] == {'Yes': 4, 'No': 3}
+
+
+def test_upgrade_fills_rollups_from_existing_responses(migrated_app):
+    upgrade(migrated_app, '0006')
+    insert_responses(migrated_app, 7)
+    upgrade(migrated_app)
+    
+    with migrated_app.app_context():
+        hourly = get_timeseries(1, 'hour', datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 12))
+        daily = get_timeseries(1, 'day', datetime(2026, 1, 1), datetime(2026, 1, 2))
+    assert [dataset['data'] for dataset in hourly['datasets']] == [[4, 0], [3, 0]]
+    assert [dataset['data'] for dataset in daily['datasets']] == [[4], [3]]
+
+
+def test_stamp_and_upgrade_a_pre_migration_database(migrated_app, tmp_path):
+    # A database created from the schema before the migrations existed
+    with sqlite3.connect(tmp_path / 'test.db') as connection:
+        connection.executescript(ORIGINAL_SCHEMA)
+        connection.execute(
+            "INSERT INTO Users (user_id, email, alias, password_hash) VALUES (1, 'a@example.com', 'A', 'x')"
+        )
+        connection.execute(
+            "INSERT INTO Surveys (survey_id, user_id, title, updated_at) VALUES (1, 1, 'Survey', '2026-01-01 09:00:00')"
+        )
+        connection.execute(
+            "INSERT INTO Survey_Options (option_id, survey_id, option_text, option_order) "
+            "VALUES (1, 1, 'Yes', 1), (2, 1, 'No', 2)"
+        )
+        connection.executemany(
+            "INSERT INTO Survey_Responses (survey_id, option_id, response_date) VALUES (1, ?, '2026-01-01 10:30:00')",
+            [(1 + i % 2,) for i in range(7)]
+        )
+    
+    cli = FlaskGroup(create_app=lambda: create_app({
+        'SQLALCHEMY_DATABASE_URI': migrated_app.config['SQLALCHEMY_DATABASE_URI'],
+        'SCHEMA_STARTUP_MODE': 'create',
+        'JINJA_BYTECODE_CACHE': False,
+        'SLOW_QUERY_LOG_FILE': str(tmp_path / 'slow_queries.jsonl'),
+    }))
+    for command in (['db', 'stamp', '0001'], ['db', 'upgrade']):
+        result = CliRunner().invoke(cli, command)
+        assert result.exit_code == 0, result.output
+    
+    with migrated_app.app_context():
+        current = db.session.execute(text('SELECT version_num FROM alembic_version')).scalar()
+        results = compute_survey_results(1)
+        hourly = get_timeseries(1, 'hour', datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 11))
+        stamp = db.session.execute(text('SELECT surveys_updated_at FROM "Users" WHERE user_id = 1')).scalar()
+    assert current == head_revision(os.path.join(migrated_app.root_path, 'migrations', 'versions'))
+    assert results['results'] == {'Yes': 4, 'No': 3}
+    assert [dataset['data'] for dataset in hourly['datasets']] == [[4], [3]]
+    assert stamp == '2026-01-01 09:00:00'
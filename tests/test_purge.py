@@ -0,0 +1,52 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the background purge of deleted surveys.
+"""
+import time
+
+from sqlalchemy import text
+
+from app import create_app
+from src.extensions import db
+from tests.conftest import create_survey
+
+
+def count_rows(app, table, survey_id):
+    with app.app_context():
+        return db.session.execute(
+            text(f'SELECT count(*) FROM "{table}" WHERE survey_id = :survey_id'), {'survey_id': survey_id}
+        ).scalar()
+
+
+def test_interrupted_purge_resumes_on_startup(app, client):
+    survey = create_survey(client, 2, 5)
+    # A survey marked as deleted whose purge never ran before the restart
+    with app.app_context():
+        db.session.execute(text(
+            'UPDATE "Surveys" SET deleted_at = CURRENT_TIMESTAMP, is_active = 0 WHERE survey_id = :survey_id'
+        ), {'survey_id': survey['survey_id']})
+        db.session.commit()
+    
+    restarted = create_app({key: app.config[key] for key in (
+        'TESTING', 'SQLALCHEMY_DATABASE_URI', 'SCHEMA_STARTUP_MODE', 'JINJA_BYTECODE_CACHE', 'SLOW_QUERY_LOG_FILE'
+    )})
+    
+    deadline = time.monotonic() + 5
+    while count_rows(restarted, 'Surveys', survey['survey_id']) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert count_rows(restarted, 'Surveys', survey['survey_id']) == 0
+    assert count_rows(restarted, 'Survey_Responses', survey['survey_id']) == 0
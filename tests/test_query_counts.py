@@ -0,0 +1,67 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Query-count regression tests for the survey result views.
+"""
+import pytest
+from sqlalchemy import event
+
+from src.extensions import db
+from tests.conftest import create_survey
+
+# The user, the survey, and the options joined with their counters
+VIEW_SURVEY_QUERIES = 3
+# The same, plus the version stamp checked for conditional requests
+RESULTS_API_QUERIES = 4
+
+
+class QueryCounter:
+    """Count the statements executed on an engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._count)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def count_queries(app, client, url):
+    with app.app_context():
+        engine = db.engine
+    with QueryCounter(engine) as counter:
+        response = client.get(url)
+    assert response.status_code == 200
+    return counter.count
+
+
+@pytest.mark.parametrize('options, responses', [(2, 0), (2, 5), (5, 50)])
+def test_view_survey_query_count(app, client, options, responses):
+    survey = create_survey(client, options, responses)
+    assert count_queries(app, client, f"/surveys/{survey['survey_id']}") == VIEW_SURVEY_QUERIES
+
+
+@pytest.mark.parametrize('options, responses', [(2, 0), (2, 5), (5, 50)])
+def test_results_api_query_count(app, client, options, responses):
+    survey = create_survey(client, options, responses)
+    assert count_queries(app, client, f"/api/surveys/{survey['survey_id']}/results") == RESULTS_API_QUERIES
@@ -0,0 +1,39 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Query plan regression tests for the hot queries.
+"""
+import pytest
+
+from src.services.query_plans import check_query_plans, hot_queries
+from tests.conftest import upgrade
+
+
+@pytest.fixture
+def query_plans(migrated_app):
+    upgrade(migrated_app)
+    with migrated_app.app_context():
+        return check_query_plans()
+
+
+def test_every_hot_query_is_explained(query_plans, migrated_app):
+    with migrated_app.app_context():
+        assert set(query_plans) == set(hot_queries())
+
+
+def test_hot_queries_do_not_scan_whole_tables(query_plans):
+    scans = {name: full_scans for name, (_, full_scans) in query_plans.items() if full_scans}
+    assert scans == {}
@@ -0,0 +1,44 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the cached public respond page.
+"""
+import pytest
+
+from tests.conftest import create_survey
+
+pytestmark = pytest.mark.parametrize('app_config', [{'RESPOND_PAGE_CACHE_ENABLED': True, 'RESPOND_PAGE_MAX_AGE': 60}])
+
+
+def test_shared_respond_page_varies_on_cookie(app, client):
+    survey = create_survey(client, 2)
+    response = app.test_client().get(f"/respond/{survey['survey_id']}")
+    assert response.status_code == 200
+    assert 'public' in response.headers['Cache-Control']
+    assert 'Cookie' in response.vary
+    
+    revalidated = app.test_client().get(f"/respond/{survey['survey_id']}",
+                                        headers={'If-None-Match': response.headers['ETag']})
+    assert revalidated.status_code == 304
+
+
+def test_missing_survey_is_not_revalidated(app):
+    visitor = app.test_client()
+    response = visitor.get('/respond/999')
+    assert response.status_code == 404
+    
+    revalidated = visitor.get('/respond/999', headers={'If-None-Match': response.headers['ETag']})
+    assert revalidated.status_code == 404
@@ -0,0 +1,59 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the schema startup modes under the flask CLI.
+"""
+import sqlite3
+
+import pytest
+from click.testing import CliRunner
+from flask.cli import FlaskGroup
+
+from app import create_app
+
+
+def flask_cli(tmp_path, mode):
+    """The flask command for an app bound to ``tmp_path``, started in ``mode``."""
+    return FlaskGroup(create_app=lambda: create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'SCHEMA_STARTUP_MODE': mode,
+        'JINJA_BYTECODE_CACHE': False,
+        'SLOW_QUERY_LOG_FILE': str(tmp_path / 'slow_queries.jsonl'),
+    }))
+
+
+def tables(tmp_path):
+    with sqlite3.connect(tmp_path / 'test.db') as connection:
+        return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def test_builtin_commands_create_the_tables(tmp_path):
+    # 'flask routes' loads the app the same way as 'flask run'
+    result = CliRunner().invoke(flask_cli(tmp_path, 'create'), ['routes'])
+    assert result.exit_code == 0, result.output
+    assert {'Users', 'Surveys', 'Survey_Options', 'Survey_Responses'} <= tables(tmp_path)
+
+
+def test_builtin_commands_fail_on_a_stale_schema(tmp_path):
+    result = CliRunner().invoke(flask_cli(tmp_path, 'check'), ['routes'])
+    assert result.exit_code != 0
+
+
+@pytest.mark.parametrize('mode', ['create', 'check'])
+def test_flask_db_runs_on_an_empty_database(tmp_path, mode):
+    result = CliRunner().invoke(flask_cli(tmp_path, mode), ['db', 'upgrade'])
+    assert result.exit_code == 0, result.output
+    assert 'alembic_version' in tables(tmp_path)
@@ -0,0 +1,44 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the response timeseries API.
+"""
+import pytest
+
+from tests.conftest import create_survey
+
+
+@pytest.mark.parametrize('since, until', [
+    ('2026-01-01T00:00:00', '2026-01-02T00:00:00'),
+    ('2026-01-01T00:00:00Z', '2026-01-02T00:00:00Z'),
+    ('2026-01-01T09:00:00+09:00', '2026-01-02T00:00:00+00:00'),
+])
+def test_timeseries_accepts_naive_and_aware_timestamps(client, since, until):
+    survey = create_survey(client, 2)
+    response = client.get(f"/api/surveys/{survey['survey_id']}/timeseries",
+                          query_string={'bucket': 'hour', 'since': since, 'until': until})
+    assert response.status_code == 200
+    labels = response.get_json()['labels']
+    assert labels[0] == '2026-01-01T00:00:00'
+    assert len(labels) == 24
+
+
+@pytest.mark.parametrize('since', ['yesterday', '2026-01-03T00:00:00Z'])
+def test_timeseries_rejects_invalid_ranges(client, since):
+    survey = create_survey(client, 2)
+    response = client.get(f"/api/surveys/{survey['survey_id']}/timeseries",
+                          query_string={'since': since, 'until': '2026-01-02T00:00:00'})
+    assert response.status_code == 400
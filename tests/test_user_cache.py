@@ -0,0 +1,43 @@
+# Copyright 2025 Amazon Q Developer for CLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the cached Flask-Login user loader.
+"""
+import pytest
+
+from src.services.users import user_cache
+
+pytestmark = pytest.mark.parametrize('app_config', [{'USER_CACHE_ENABLED': True}])
+
+
+def test_password_hash_is_not_cached(client):
+    assert client.get('/dashboard').status_code == 200
+    row = user_cache.backend.get(user_cache.key(1))
+    assert row['email'] == 'owner@example.com'
+    assert 'password_hash' not in row
+
+
+def test_password_change_with_a_cached_user(app, client):
+    client.get('/dashboard')
+    client.post('/auth/profile', data={
+        'current_password': 'password', 'new_password': 'changed', 'confirm_password': 'changed'
+    })
+    client.post('/auth/logout')
+    
+    visitor = app.test_client()
+    assert visitor.post('/auth/login', data={'email': 'owner@example.com', 'password': 'password'}).status_code == 200
+    response = visitor.post('/auth/login', data={'email': 'owner@example.com', 'password': 'changed'})
+    assert response.status_code == 302